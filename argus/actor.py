@@ -0,0 +1,151 @@
+import asyncio
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import Any, Awaitable, Callable, Deque, Dict, List, Optional, Tuple
+
+from argus.models import DebateRoom
+
+Mutation = Callable[[], Awaitable[Any]]
+
+
+class RoomActor:
+    """
+    Applies mutations to one debate room in the order they were submitted.
+    Everything already queued when the actor wakes is drained as a batch and
+    the topic is settled once after the batch instead of once per mutation.
+    """
+
+    def __init__(self, settle: Mutation):
+        self._settle = settle
+        self._mailbox: Deque[Tuple[Mutation, bool, asyncio.Future]] = deque()
+        self._wakeup = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+        self._closed = False
+        self._draining = False
+
+    def __len__(self):
+        return len(self._mailbox)
+
+    @property
+    def busy(self) -> bool:
+        """Whether a new mutation would have to wait for earlier ones."""
+        return self._draining or bool(self._mailbox)
+
+    def submit(self, mutation: Mutation, settle: bool = False) -> asyncio.Future:
+        """
+        Queue a mutation. The returned future resolves with its result, after
+        the topic has been settled if requested.
+        """
+        future = asyncio.get_running_loop().create_future()
+        self._mailbox.append((mutation, settle, future))
+        self._wakeup.set()
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+        return future
+
+    async def call(self, mutation: Mutation, settle: bool = False) -> Any:
+        """Queue a mutation and wait for its result."""
+        return await self.submit(mutation, settle)
+
+    @asynccontextmanager
+    async def turn(self):
+        """Wait for earlier mutations and hold the room until the block exits."""
+        started = asyncio.Event()
+        finished = asyncio.Event()
+
+        async def hold():
+            started.set()
+            await finished.wait()
+
+        self.submit(hold)
+        try:
+            await started.wait()
+            yield
+        finally:
+            finished.set()
+
+    def close(self):
+        """Stop the actor and cancel everything still queued."""
+        self._closed = True
+        if self._task:
+            self._task.cancel()
+            self._task = None
+        while self._mailbox:
+            _, _, future = self._mailbox.popleft()
+            future.cancel()
+
+    def _stops(self, error: BaseException) -> bool:
+        # A mutation that raises must never leave later callers waiting on a
+        # dead loop, so only stop when the actor itself was closed
+        return isinstance(error, (KeyboardInterrupt, SystemExit)) or (
+            isinstance(error, asyncio.CancelledError) and self._closed
+        )
+
+    @staticmethod
+    def _fail(futures: List[asyncio.Future], error: BaseException):
+        for future in futures:
+            if future.done():
+                continue
+            if isinstance(error, asyncio.CancelledError):
+                future.cancel()
+            else:
+                future.set_exception(error)
+
+    async def _run(self):
+        while True:
+            self._draining = False
+            await self._wakeup.wait()
+            self._wakeup.clear()
+            self._draining = True
+
+            settled = []
+            while self._mailbox:
+                mutation, settle, future = self._mailbox.popleft()
+                try:
+                    result = await mutation()
+                except BaseException as e:
+                    self._fail([future], e)
+                    if self._stops(e):
+                        self._fail([future for future, _ in settled], e)
+                        raise
+                    continue
+                if settle:
+                    settled.append((future, result))
+                elif not future.done():
+                    future.set_result(result)
+
+            if not settled:
+                continue
+            try:
+                await self._settle()
+            except BaseException as e:
+                self._fail([future for future, _ in settled], e)
+                if self._stops(e):
+                    raise
+                continue
+            for future, result in settled:
+                if not future.done():
+                    future.set_result(result)
+
+
+class RoomActors:
+    """Lazily started actors for each debate room, keyed by room number."""
+
+    def __init__(self):
+        self._actors: Dict[int, RoomActor] = {}
+
+    def __len__(self):
+        return len(self._actors)
+
+    def get(self, room: DebateRoom, settle: Mutation) -> RoomActor:
+        """Get the actor of a room, starting it with a settle callback if needed."""
+        actor = self._actors.get(room.number)
+        if actor is None:
+            actor = self._actors[room.number] = RoomActor(settle)
+        return actor
+
+    def clear(self):
+        """Stop every actor, used when the rooms are rebuilt."""
+        for actor in self._actors.values():
+            actor.close()
+        self._actors.clear()
@@ -0,0 +1,71 @@
+import asyncio
+import io
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Optional, Tuple
+
+from cachetools import TTLCache
+from matplotlib import style, ticker
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+
+_executor: Optional[ProcessPoolExecutor] = None
+
+# Rendered PNGs keyed by their quantized values, bounded by total bytes
+_chart_cache = TTLCache(maxsize=16 * 1024 * 1024, ttl=60 * 60, getsizeof=len)
+
+
+def get_executor() -> ProcessPoolExecutor:
+    """Get the process pool charts are rendered in, creating it if needed."""
+    global _executor
+    if _executor is None:
+        _executor = ProcessPoolExecutor(max_workers=2)
+    return _executor
+
+
+def shutdown_executor():
+    """Stop the rendering processes."""
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=False, cancel_futures=True)
+        _executor = None
+
+
+def draw_rubric_chart(values: Dict[str, float]) -> bytes:
+    """
+    Draw a horizontal bar chart of normalized rubric values as a PNG.
+    Uses the object-oriented Agg API so no pyplot global state is touched.
+    """
+    with style.context("ggplot"):
+        figure = Figure()
+        FigureCanvasAgg(figure)
+        try:
+            ax = figure.add_subplot()
+            ax.barh(list(values.keys()), list(values.values()))
+            figure.tight_layout()
+            ax.xaxis.set_major_formatter(ticker.PercentFormatter(xmax=1))
+            buffer = io.BytesIO()
+            figure.savefig(buffer, format="png")
+        finally:
+            figure.clear()
+    return buffer.getvalue()
+
+
+def quantize(values: Dict[str, float], places: int = 3) -> Tuple:
+    """Round normalized values so near-identical charts share a cache key."""
+    return tuple((key, round(value, places)) for key, value in values.items())
+
+
+async def render_rubric_chart(values: Dict[str, float]) -> bytes:
+    """
+    Render a rubric chart off the event loop. Charts are cached by their
+    quantized values, so repeated views of unchanged members are free.
+    """
+    key = quantize(values)
+    chart = _chart_cache.get(key)
+    if chart is not None:
+        return chart
+
+    loop = asyncio.get_running_loop()
+    chart = await loop.run_in_executor(get_executor(), draw_rubric_chart, dict(key))
+    _chart_cache[key] = chart
+    return chart
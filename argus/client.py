@@ -1,4 +1,4 @@
-from queue import Queue
+import asyncio
 
 import discord
 from discord import Embed, Interaction
@@ -11,8 +11,18 @@ from discord.app_commands import (
 )
 from discord.ext import commands
 
+from argus.actor import RoomActors
+from argus.charts import shutdown_executor
 from argus.constants import BOT_DESCRIPTION, PLUGINS
+from argus.db.counters import CounterBuffer
+from argus.debounce import Debouncer
+from argus.events import VoiceEventFilter
+from argus.feed import FeedQueue
 from argus.formatter import TimeDelta
+from argus.leaderboard import Leaderboard
+from argus.models import DebateRoomRegistry
+from argus.ranks import RankRoleReconciler
+from argus.timers import RoomTimers
 from argus.utils import update
 
 
@@ -35,16 +45,33 @@ class ArgusClient(commands.Bot):
             "map_roles": {},
             "map_channels": {},
             "debates_enabled": False,
-            "debate_rooms": [],
+            "debate_rooms": DebateRoomRegistry(),
+            "room_actors": RoomActors(),
+            "room_timers": RoomTimers(self),
+            "voice_event_filter": VoiceEventFilter(),
             "debate_room_maps": [],
             "interface_messages": [],
+            "interface_message_handles": {},
+            "interface_message_payloads": {},
+            "interface_renderer": Debouncer(
+                logger,
+                interval=config["global"].get("interface_update_interval", 2.0),
+            ),
             "exiting": False,
-            "debate_feed_fifo": Queue(),
-            "voice_channel_update_task": None,
+            "debate_feed_fifo": FeedQueue(maxsize=100),
+            "room_visibility": None,
+            "voice_edit_semaphore": asyncio.Semaphore(
+                config["global"].get("voice_edit_concurrency", 5)
+            ),
             "debate_feed_updater_task": None,
             "propositions": [],
             "studio_engineers": [],
             "lounge_masters": [],
+            "leaderboard": Leaderboard(),
+            "rating_lock": asyncio.Lock(),
+            "rank_roles": RankRoleReconciler(self),
+            "member_counters": CounterBuffer(self),
+            "member_counters_task": None,
         }
 
         super().__init__(
@@ -70,6 +97,20 @@ class ArgusClient(commands.Bot):
             except Exception as e:
                 self.logger.exception("Core Error")
 
+        self.state["member_counters_task"] = asyncio.create_task(
+            self.state["member_counters"].run()
+        )
+
+    async def close(self):
+        # Write buffered counters and role edits before the connection goes away
+        if self.state["member_counters_task"]:
+            self.state["member_counters_task"].cancel()
+        await self.state["member_counters"].flush()
+        await self.state["rank_roles"].flush()
+
+        shutdown_executor()
+        await super().close()
+
     async def app_command_error(self, interaction: Interaction, error: AppCommandError):
         if isinstance(error, MissingAnyRole):
             await update(
@@ -1,37 +1,66 @@
-import math
-import typing
-from queue import Queue
-from typing import List, Optional
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from typing import Awaitable, Callable, List, Optional
 
 import discord
-from discord import Embed, Interaction, Member, Role, VoiceChannel
+from discord import Embed, Interaction, Member, VoiceChannel
+from pymongo import UpdateOne
+from pymongo.errors import PyMongoError
 
+from argus.actor import RoomActor
 from argus.client import ArgusClient
-from argus.constants import DB_ROLE_NAME_MAP, RANK_RATING_MAP
+from argus.constants import DB_ROLE_NAME_MAP
 from argus.db.models.guild import GuildModel
+from argus.db.models.match import MatchModel, MatchParticipantModel
 from argus.db.models.user import MemberModel
-from argus.models import DebateRoom
-from argus.utils import floor_rating, update
+from argus.models import DebateParticipant, DebateRoom
+from argus.tasks import publish_to_debate_feed
+from argus.utils import defer, update
+from argus.voice import mute_members
 
 
 def get_room_number(bot: ArgusClient, channel: VoiceChannel) -> Optional[int]:
     """Get a room number from a TextChannel or VoiceChannel ID."""
-    debate_rooms: List[DebateRoom] = bot.state["debate_rooms"]
-    for room in debate_rooms:
-        if channel == room.vc:
-            return room.number
-    else:
-        return None
+    room = bot.state["debate_rooms"].from_channel(channel)
+    if room:
+        return room.number
+    return None
 
 
 def get_room(bot: ArgusClient, room_num: int) -> Optional[DebateRoom]:
     """Get a room from a room number."""
-    debate_rooms = bot.state["debate_rooms"]
-    try:
-        room = list(filter(lambda x: x.number == room_num, debate_rooms))[0]
-        return room
-    except IndexError as e_info:
-        return None
+    return bot.state["debate_rooms"].get(room_num)
+
+
+def get_room_actor(bot: ArgusClient, room: DebateRoom) -> RoomActor:
+    """Get the actor that serializes mutations of a room."""
+    return bot.state["room_actors"].get(room, lambda: update_topic(bot, room))
+
+
+@asynccontextmanager
+async def room_turn(bot: ArgusClient, room: DebateRoom, interaction: Interaction):
+    """
+    Take a turn on a room's actor for a command. When the room is busy the
+    interaction is deferred first so waiting cannot outlast Discord's
+    deadline. The defer is ephemeral so rejections stay private.
+    """
+    actor = get_room_actor(bot, room)
+    if actor.busy:
+        await defer(interaction, ephemeral=True)
+    async with actor.turn():
+        yield
+
+
+async def get_rank(bot: ArgusClient, member: Member) -> Optional[int]:
+    """
+    Get a member's position on the leaderboard, so it matches the one shown
+    by the leaderboard command.
+    """
+    leaderboard = bot.state["leaderboard"]
+    if not leaderboard.loaded:
+        await leaderboard.load(bot.db[bot.db.database].member, member.guild)
+    return leaderboard.rank(member.id)
 
 
 def get_embed_message(room_num):
@@ -49,8 +78,7 @@ async def send_embed_message(
     bot: ArgusClient, room_num: int, embed: Optional[Embed] = None
 ):
     if embed:
-        debate_rooms = bot.state["debate_rooms"]
-        voice_channel: VoiceChannel = debate_rooms[room_num - 1].vc
+        voice_channel: VoiceChannel = get_room(bot, room_num).vc
         message = await voice_channel.send(embed=embed)
         return message
 
@@ -73,8 +101,7 @@ async def send_embed_message(
     if current_topic:
         embed.add_field(name="Current Topic: ", value=f"{current_topic}")
 
-    debate_rooms = bot.state["debate_rooms"]
-    voice_channel: VoiceChannel = debate_rooms[room_num - 1].vc
+    voice_channel: VoiceChannel = room.vc
     message = await voice_channel.send(embed=embed)
     return message
 
@@ -142,111 +169,120 @@ async def insert_skill(
     member_data: Optional[MemberModel] = await bot.engine.find_one(
         MemberModel, MemberModel.member == member.id
     )
-    if member_data:
-        if not member_data.mu or not member_data.sigma or not member_data.rating:
-            mu = 25.0
-            sigma = 25 / 3
-            rating = float(20 * ((mu - 3 * sigma) + 25))
-
-            member_data.mu = mu
-            member_data.sigma = sigma
-            member_data.rating = rating
-
-            await bot.engine.save(member_data)
-
-            floored_rating = floor_rating(float(20 * ((mu - 3 * sigma) + 25)))
-            current_rank_role: typing.Optional[Role] = None
-            for rank, rating in RANK_RATING_MAP.items():
-                if math.isclose(floored_rating, rating, rel_tol=1e-04):
-                    current_rank_role = bot.state["map_roles"][rank]
-                    break
-
-            if current_rank_role not in member.roles:
-                await member.add_roles(
-                    current_rank_role, reason="Added during skill view."
-                )
-
-            for rank, rating in RANK_RATING_MAP.items():
-                rank_role = bot.state["map_roles"][rank]
-                if rank_role in member.roles:
-                    if rank_role != current_rank_role:
-                        await member.remove_roles(
-                            rank_role, reason="Removed during skill view."
-                        )
-            return {
-                "mu": mu,
-                "sigma": sigma,
-                "rating": rating,
-                "current_rank_role": current_rank_role,
-            }
-        else:
-            mu = member_data.mu
-            sigma = member_data.sigma
-            rating = member_data.rating
-
-            floored_rating = floor_rating(float(rating))
-            current_rank_role: typing.Optional[Role] = None
-            for rank, rating in RANK_RATING_MAP.items():
-                if math.isclose(floored_rating, rating, rel_tol=1e-04):
-                    current_rank_role = bot.state["map_roles"][rank]
-                    break
-
-            if current_rank_role not in member.roles:
-                await member.add_roles(
-                    current_rank_role, reason="Added during skill view."
-                )
-
-            for rank, rating in RANK_RATING_MAP.items():
-                rank_role = bot.state["map_roles"][rank]
-                if rank_role in member.roles:
-                    if rank_role != current_rank_role:
-                        await member.remove_roles(
-                            rank_role, reason="Removed during skill view."
-                        )
-
-            return {
-                "mu": mu,
-                "sigma": sigma,
-                "rating": rating,
-                "current_rank_role": current_rank_role,
-            }
-
-    else:
+    if not member_data:
         member_data = MemberModel(member=member)
-
+        await bot.engine.save(member_data)
+    elif not member_data.mu or not member_data.sigma or not member_data.rating:
         mu = 25.0
         sigma = 25 / 3
-        rating = float(20 * ((mu - 3 * sigma) + 25))
 
         member_data.mu = mu
         member_data.sigma = sigma
-        member_data.rating = rating
+        member_data.rating = float(20 * ((mu - 3 * sigma) + 25))
 
         await bot.engine.save(member_data)
 
-        floored_rating = floor_rating(float(20 * ((mu - 3 * sigma) + 25)))
-        current_rank_role: typing.Optional[Role] = None
-        for rank, rating in RANK_RATING_MAP.items():
-            if math.isclose(floored_rating, rating, rel_tol=1e-04):
-                current_rank_role = bot.state["map_roles"][rank]
-                break
-
-        if current_rank_role not in member.roles:
-            await member.add_roles(current_rank_role, reason="Added during skill view.")
-
-        for rank, rating in RANK_RATING_MAP.items():
-            rank_role = bot.state["map_roles"][rank]
-            if rank_role in member.roles:
-                if rank_role != current_rank_role:
-                    await member.remove_roles(
-                        rank_role, reason="Removed during skill view."
-                    )
-        return {
-            "mu": mu,
-            "sigma": sigma,
-            "rating": rating,
-            "current_rank_role": current_rank_role,
-        }
+    # Bots are never ranked, matching the leaderboard load
+    if not member.bot:
+        bot.state["leaderboard"].update(member.id, member_data.rating)
+    current_rank_role = bot.state["rank_roles"].schedule(
+        member, member_data.rating, reason="Updated during skill view."
+    )
+    return {
+        "mu": member_data.mu,
+        "sigma": member_data.sigma,
+        "rating": member_data.rating,
+        "current_rank_role": current_rank_role,
+    }
+
+
+async def bulk_insert_skills(
+    bot: ArgusClient,
+    members: List[Member],
+    progress: Optional[Callable[[int], Awaitable[None]]] = None,
+    workers: int = 8,
+    interval: float = 3.0,
+) -> int:
+    """
+    Initializes the skills of many members at once. Existing skills are
+    loaded in one query, missing ones are written with one bulk upsert and
+    rank roles are updated by a bounded pool of workers.
+    """
+    collection = bot.db[bot.db.database].member
+    default = MemberModel(member=0)
+
+    existing = {}
+    cursor = collection.find(
+        {}, {"_id": 0, "member": 1, "rating": 1, "mu": 1, "sigma": 1}
+    )
+    async for document in cursor:
+        existing[document["member"]] = document
+
+    operations = []
+    ratings = {}
+    for member in members:
+        document = existing.get(member.id)
+        if not document:
+            operations.append(
+                UpdateOne(
+                    {"member": member.id},
+                    {"$setOnInsert": MemberModel(member=member).doc()},
+                    upsert=True,
+                )
+            )
+            ratings[member.id] = default.rating
+        elif any(
+            # A rating or mean of zero is valid, only missing values are reset
+            document.get(field) is None
+            for field in ("mu", "sigma", "rating")
+        ):
+            operations.append(
+                UpdateOne(
+                    {"member": member.id},
+                    {
+                        "$set": {
+                            "mu": default.mu,
+                            "sigma": default.sigma,
+                            "rating": default.rating,
+                        }
+                    },
+                )
+            )
+            ratings[member.id] = default.rating
+        else:
+            ratings[member.id] = document["rating"]
+
+    if operations:
+        await collection.bulk_write(operations, ordered=False)
+
+    leaderboard = bot.state["leaderboard"]
+    rank_roles = bot.state["rank_roles"]
+    edits = []
+    for member in members:
+        leaderboard.update(member.id, ratings[member.id])
+        roles = rank_roles.desired_roles(member, ratings[member.id])
+        if set(roles) != set(member.roles[1:]):
+            edits.append((member, roles))
+
+    count = len(members) - len(edits)
+    last_progress = time.monotonic()
+
+    async def worker():
+        nonlocal count, last_progress
+        while edits:
+            member, roles = edits.pop()
+            try:
+                await member.edit(roles=roles, reason="Updated during skill setup.")
+            except discord.HTTPException:
+                bot.logger.exception("Failed to update rank role", member=member.id)
+            count += 1
+
+            if progress and time.monotonic() - last_progress >= interval:
+                last_progress = time.monotonic()
+                await progress(count)
+
+    await asyncio.gather(*[worker() for _ in range(workers)])
+    return count
 
 
 async def in_debate_room(bot: ArgusClient, interaction: Interaction) -> bool:
@@ -345,18 +381,42 @@ async def unlocked_in_private_room(bot: ArgusClient, interaction: Interaction) -
     return True
 
 
+def get_interface_message(
+    bot: ArgusClient, room_num: int
+) -> Optional[discord.PartialMessage]:
+    """
+    Get a handle to a room's interface message without fetching it. Handles
+    are cached by message ID until the message is deleted.
+    """
+    try:
+        im_id = bot.state["interface_messages"][room_num - 1]
+    except IndexError as e_info:
+        return None
+
+    handles = bot.state["interface_message_handles"]
+    im = handles.get(im_id)
+    if im is None:
+        room = get_room(bot, room_num)
+        im = handles[im_id] = room.vc.get_partial_message(im_id)
+    return im
+
+
 async def update_im(bot: ArgusClient, room_num: int):
-    index = room_num - 1
-    interface_messages = bot.state["interface_messages"]
-    im_id = interface_messages[index]
+    """
+    Mark a room's interface message as out of date. Renders are debounced
+    per room and always use the latest state of the room.
+    """
+    bot.state["interface_renderer"].schedule(room_num, lambda: render_im(bot, room_num))
+
+
+async def render_im(bot: ArgusClient, room_num: int):
     room = get_room(bot, room_num)
+    # The rooms may have been rebuilt since the render was scheduled
+    if not room:
+        return
 
     embed = get_embed_message(room_num)
-
-    try:
-        im = await room.vc.fetch_message(im_id)
-    except discord.errors.NotFound as e_info:
-        im = None
+    im = get_interface_message(bot, room_num)
 
     if room.studio:
         embed.title = f"{embed.title} [Recording]"
@@ -376,11 +436,77 @@ async def update_im(bot: ArgusClient, room_num: int):
             name="**Current Topic**: ",
             value=f"{get_room(bot, room_num).current_topic}",
         )
+    if not im:
+        return
+
+    # Skip edits that would not change anything
+    payload = embed.to_dict()
+    payloads = bot.state["interface_message_payloads"]
+    if payloads.get(im.id) == payload:
+        return
+
     try:
-        if im:
-            await im.edit(embed=embed)
+        await im.edit(embed=embed)
+        payloads[im.id] = payload
     except discord.errors.NotFound as e_info:
-        return
+        bot.state["interface_message_handles"].pop(im.id, None)
+    except discord.HTTPException:
+        bot.logger.exception("Failed to update interface message", room=room_num)
+
+
+async def save_ratings(bot: ArgusClient, debaters: List[DebateParticipant]):
+    """Write the post-match ratings of all debaters in one round-trip."""
+    operations = []
+    for debater in debaters:
+        rating = float(20 * ((debater.mu_post - 3 * debater.sigma_post) + 25))
+        operations.append(
+            UpdateOne(
+                {"member": debater.member.id},
+                {
+                    "$set": {
+                        "mu": debater.mu_post,
+                        "sigma": debater.sigma_post,
+                        "rating": rating,
+                    }
+                },
+            )
+        )
+        if not debater.member.bot:
+            bot.state["leaderboard"].update(debater.member.id, rating)
+
+    await bot.db.bulk_update(MemberModel, operations)
+
+
+async def record_match(bot: ArgusClient, room: DebateRoom, rated: bool):
+    """Append a stopped match to the match log so ratings can be replayed."""
+    match = room.match
+    participants = [
+        MatchParticipantModel(
+            member=participant.member.id,
+            debater=participant.debater,
+            against=participant.against,
+            place=participant.place,
+            session_duration=participant.session_duration,
+            votes=[voter.member.id for voter in participant.votes],
+            mu_pre=participant.mu_pre,
+            sigma_pre=participant.sigma_pre,
+            mu_post=participant.mu_post if participant.debater else None,
+            sigma_post=participant.sigma_post if participant.debater else None,
+        )
+        for participant in match.participants
+    ]
+    record = MatchModel(
+        room=room.number,
+        topic=str(match.topic or ""),
+        session_start=match.session_start,
+        session_end=match.session_end,
+        rated=rated,
+        participants=participants,
+    )
+    try:
+        await bot.engine.save(record)
+    except PyMongoError:
+        bot.logger.exception("Failed to record match", room=room.number)
 
 
 async def conclude_debate(bot: ArgusClient, room: DebateRoom, debaters):
@@ -392,121 +518,102 @@ async def conclude_debate(bot: ArgusClient, room: DebateRoom, debaters):
         color=0xE67E22,
     )
 
-    if room.match:
-        check_voters = room.match.check_voters()
-        if not check_voters:
+    # A replay rewrites every rating, so wait for it rather than race it
+    async with bot.state["rating_lock"]:
+        if room.match:
+            check_voters = room.match.check_voters()
+            if room.match.session_end:
+                await record_match(bot, room, rated=bool(check_voters))
+            if not check_voters:
+                debaters = []
+        else:
+            check_voters = None
             debaters = []
-    else:
-        check_voters = None
-        debaters = []
-        for member in room.vc.members:
-            await member.edit(mute=False)
-
-    if debaters:
-        await room.vc.send(embed=embed)
-
-        for debater in debaters:
-            # Mute
-            if debater.member in room.vc.members:
-                await debater.member.edit(mute=True)
-
-    if len(debaters) > 1:
-        for debater in debaters:
-            debater_rating = float(
-                20 * ((debater.mu_post - 3 * debater.sigma_post) + 25)
-            )
-            debater_data: Optional[MemberModel] = await bot.engine.find_one(
-                MemberModel, MemberModel.member == debater.member.id
-            )
-            debater_data.mu = debater.mu_post
-            debater_data.sigma = debater.sigma_post
-            debater_data.rating = debater_rating
+            await mute_members(bot, room.vc.members, mute=False)
 
-            await bot.engine.save(debater_data)
+        if debaters:
+            await room.vc.send(embed=embed)
 
-            embed = Embed(title="Rating Change", color=0xEC6A5C)
-            embed.set_footer(
-                text=debater.member.display_name, icon_url=debater.member.avatar.url
-            )
-            embed.add_field(
-                name="Mean",
-                value=f"```diff\n"
-                f"- {float(debater.mu_pre): .2f}\n"
-                f"+ {float(debater.mu_post): .2f}\n"
-                f"```",
-                inline=True,
-            )
-            embed.add_field(
-                name="Confidence",
-                value=f"```diff\n"
-                f"- {float(debater.sigma_pre): .2f}\n"
-                f"+ {float(debater.sigma_post): .2f}\n"
-                f"```",
-                inline=True,
-            )
-            embed.add_field(
-                name="Rating",
-                value=f"```diff\n"
-                f"- {float(20 * ((debater.mu_pre - 3 * debater.sigma_pre) + 25)): .2f}\n"
-                f"+ {float(20 * ((debater.mu_post - 3 * debater.sigma_post) + 25)): .2f}\n"
-                f"```",
-                inline=True,
+            await mute_members(
+                bot, [debater.member for debater in debaters], channel=room.vc
             )
 
-            fifo: Queue = bot.state["debate_feed_fifo"]
-            fifo.put(embed)
+        if len(debaters) > 1:
+            await bot.state["member_counters"].flush()
+            await save_ratings(bot, debaters)
 
-            # Update Roles
-            floored_rating = floor_rating(
-                float(20 * ((debater.mu_post - 3 * debater.sigma_post) + 25))
-            )
-            rank_role: Optional[Role] = None
-            for rank, rating in RANK_RATING_MAP.items():
-                if math.isclose(floored_rating, rating, rel_tol=1e-04):
-                    rank_role = bot.state["map_roles"][rank]
-                    break
-
-            if rank_role not in debater.member.roles:
-                await debater.member.add_roles(
-                    rank_role, reason="Added at the end of a debate match."
+            for debater in debaters:
+                debater_rating = float(
+                    20 * ((debater.mu_post - 3 * debater.sigma_post) + 25)
                 )
 
-            for rank, rating in RANK_RATING_MAP.items():
-                rank_role_id = bot.state["map_roles"][rank]
-                if rank_role_id in debater.member.roles:
-                    if rank_role_id != rank_role:
-                        await debater.member.remove_roles(
-                            rank_role_id, reason="Removed at the end of a debate match."
-                        )
-
-        embed = Embed(title="Voter Log", color=0xEC6A5C)
-        value = ""
-        debaters_by_votes = sorted(room.match.get_debaters(), key=lambda d: d.votes)
-        for debater in debaters_by_votes:
-            voters = sorted(debater.votes, key=lambda p: p.total_votes())
-            for voter in voters:
-                value += f"{voter.type()} {voter.member.mention} → {debater.type()} {debater.member.mention}\n"
-        embed.description = value
-        fifo: Queue = bot.state["debate_feed_fifo"]
-        fifo.put(embed)
-
-    # Clear private debaters
-    room.private_debaters = []
+                embed = Embed(title="Rating Change", color=0xEC6A5C)
+                embed.set_footer(
+                    text=debater.member.display_name, icon_url=debater.member.avatar.url
+                )
+                embed.add_field(
+                    name="Mean",
+                    value=f"```diff\n"
+                    f"- {float(debater.mu_pre): .2f}\n"
+                    f"+ {float(debater.mu_post): .2f}\n"
+                    f"```",
+                    inline=True,
+                )
+                embed.add_field(
+                    name="Confidence",
+                    value=f"```diff\n"
+                    f"- {float(debater.sigma_pre): .2f}\n"
+                    f"+ {float(debater.sigma_post): .2f}\n"
+                    f"```",
+                    inline=True,
+                )
+                embed.add_field(
+                    name="Rating",
+                    value=f"```diff\n"
+                    f"- {float(20 * ((debater.mu_pre - 3 * debater.sigma_pre) + 25)): .2f}\n"
+                    f"+ {float(20 * ((debater.mu_post - 3 * debater.sigma_post) + 25)): .2f}\n"
+                    f"```",
+                    inline=True,
+                )
 
-    embed = Embed(
-        title="Debate Concluded.",
-        description="Ratings have been updated.",
-        color=0x2ECC71,
-    )
-    if not check_voters:
-        embed.description = "Ratings have not been updated due to lack of voters."
-    elif len(debaters) < 2:
-        embed.description = "Ratings have not been updated due to lack of debaters."
+                publish_to_debate_feed(bot, embed)
+
+                # Update Roles
+                bot.state["rank_roles"].schedule(
+                    debater.member,
+                    debater_rating,
+                    reason="Updated at the end of a debate match.",
+                )
+
+            embed = Embed(title="Voter Log", color=0xEC6A5C)
+            value = ""
+            debaters_by_votes = sorted(
+                room.match.get_debaters(), key=lambda d: d.total_votes()
+            )
+            for debater in debaters_by_votes:
+                voters = sorted(debater.votes, key=lambda p: p.total_votes())
+                for voter in voters:
+                    value += f"{voter.type()} {voter.member.mention} → {debater.type()} {debater.member.mention}\n"
+            embed.description = value
+            publish_to_debate_feed(bot, embed)
+
+        # Clear private debaters
+        room.private_debaters = []
+
+        embed = Embed(
+            title="Debate Concluded.",
+            description="Ratings have been updated.",
+            color=0x2ECC71,
+        )
+        if not check_voters:
+            embed.description = "Ratings have not been updated due to lack of voters."
+        elif len(debaters) < 2:
+            embed.description = "Ratings have not been updated due to lack of debaters."
 
-    room.match = None  # Clear match
+        room.match = None  # Clear match
 
-    if debaters:
-        await room.vc.send(embed=embed)
+        if debaters:
+            await room.vc.send(embed=embed)
 
 
 async def update_topic(bot: ArgusClient, room: DebateRoom):
@@ -528,8 +635,7 @@ async def update_topic(bot: ArgusClient, room: DebateRoom):
             current_topic = room.current_topic
             room.start_match(current_topic)
 
-            for member in room.vc.members:
-                await member.edit(mute=True)
+            await mute_members(bot, room.vc.members, mute=True)
             await update_im(bot, room.number)
         else:
             # Do nothing if there are no voters
@@ -540,9 +646,9 @@ async def update_topic(bot: ArgusClient, room: DebateRoom):
                     return
 
                 # Mute debaters early
-                for debater in debaters:
-                    if debater.member in room.vc.members:
-                        await debater.member.edit(mute=True)
+                await mute_members(
+                    bot, [debater.member for debater in debaters], channel=room.vc
+                )
 
             debaters = []
             if match.concluding is False and match.concluded is False:
@@ -550,9 +656,9 @@ async def update_topic(bot: ArgusClient, room: DebateRoom):
                     debaters = room.stop_match()
 
                     # Mute debaters early
-                    for debater in debaters:
-                        if debater.member in room.vc.members:
-                            await debater.member.edit(mute=True)
+                    await mute_members(
+                        bot, [debater.member for debater in debaters], channel=room.vc
+                    )
 
                     match.concluding = True
                     await conclude_debate(bot, room, debaters)
@@ -564,8 +670,7 @@ async def update_topic(bot: ArgusClient, room: DebateRoom):
                     room.start_match(current_topic)
 
                     await update_im(bot, room.number)
-                    for member in room.vc.members:
-                        await member.edit(mute=True)
+                    await mute_members(bot, room.vc.members, mute=True)
             elif match.concluding is False and match.concluded is True:
                 topic_updated = room.set_current_topic()
                 current_topic = room.current_topic
@@ -582,23 +687,20 @@ async def update_topic(bot: ArgusClient, room: DebateRoom):
                 debaters = room.stop_match()
 
                 # Mute debaters early
-                for debater in debaters:
-                    if debater.member in room.vc.members:
-                        await debater.member.edit(mute=True)
+                await mute_members(
+                    bot, [debater.member for debater in debaters], channel=room.vc
+                )
 
                 match.concluding = True
                 await conclude_debate(bot, room, debaters)
                 match.concluding = False
                 match.concluded = True
-                for member in room.vc.members:
-                    await member.edit(mute=True)
+                await mute_members(bot, room.vc.members, mute=True)
 
         if room.private:
-            for member in room.private_debaters:
-                await member.edit(mute=False)
+            await mute_members(bot, room.private_debaters, mute=False)
         else:
-            for member in room.vc.members:
-                await member.edit(mute=False)
+            await mute_members(bot, room.vc.members, mute=False)
 
     topic_updated = room.set_current_topic()
     current_topic = room.current_topic
@@ -710,4 +812,5 @@ async def add_interface_message(bot: ArgusClient, index, embed: Optional[Embed]
     room_num = index + 1
     im_add = await send_embed_message(bot, room_num, embed)
     bot.state["interface_messages"][index] = im_add.id
+    bot.state["interface_message_handles"][im_add.id] = im_add
     return bot.state["interface_messages"][index]
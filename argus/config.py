@@ -1,7 +1,7 @@
 import sys
 
 import toml
-from schema import Or, Schema
+from schema import Optional, Or, Schema
 
 config_schema = Schema(
     {
@@ -21,7 +21,12 @@ config_schema = Schema(
             "sentry": str,
         },
         "database": {"uri": str, "name": str},
-        "global": {"name": str, "guild_id": int},
+        "global": {
+            "name": str,
+            "guild_id": int,
+            Optional("interface_update_interval"): Or(int, float),
+            Optional("voice_edit_concurrency"): int,
+        },
     },
     ignore_extra_keys=True,
 )
@@ -18,3 +18,15 @@ class DatabaseDriverBase(ABC):
     @abstractmethod
     async def increment(self, entity, state, value):
         pass
+
+    @abstractmethod
+    async def set_fields(self, model, query, **values):
+        pass
+
+    @abstractmethod
+    async def increment_fields(self, model, query, **values):
+        pass
+
+    @abstractmethod
+    async def bulk_update(self, model, operations, ordered):
+        pass
@@ -0,0 +1,69 @@
+import asyncio
+from typing import Dict
+
+from discord.ext import commands
+from pymongo import UpdateOne
+from pymongo.errors import BulkWriteError, PyMongoError
+
+
+class CounterBuffer:
+    """
+    Write-behind buffer for integer counters on member documents. Deltas
+    are accumulated in memory and written with a single unordered bulk
+    write of ``$inc`` updates.
+    """
+
+    def __init__(
+        self, bot: commands.Bot, collection: str = "member", interval: float = 10.0
+    ):
+        self.bot = bot
+        self.collection = collection
+        self.interval = interval
+        self._deltas: Dict[int, Dict[str, int]] = {}
+        self._lock = asyncio.Lock()
+
+    def __len__(self):
+        return len(self._deltas)
+
+    def increment(self, member_id: int, **fields: int):
+        """Add deltas to a member's counters."""
+        deltas = self._deltas.setdefault(member_id, {})
+        for field, value in fields.items():
+            deltas[field] = deltas.get(field, 0) + value
+
+    def pending(self, member_id: int) -> Dict[str, int]:
+        """Get the deltas not yet written for a member."""
+        return dict(self._deltas.get(member_id, {}))
+
+    async def flush(self):
+        """Write all buffered deltas to the database."""
+        async with self._lock:
+            if not self._deltas:
+                return
+
+            deltas, self._deltas = self._deltas, {}
+            member_ids = list(deltas.keys())
+            operations = [
+                UpdateOne({"member": member_id}, {"$inc": deltas[member_id]})
+                for member_id in member_ids
+            ]
+
+            collection = self.bot.db[self.bot.db.database][self.collection]
+            try:
+                await collection.bulk_write(operations, ordered=False)
+            except BulkWriteError as e_info:
+                # Keep only the deltas that failed to be written
+                for error in e_info.details["writeErrors"]:
+                    member_id = member_ids[error["index"]]
+                    self.increment(member_id, **deltas[member_id])
+                self.bot.logger.exception("Failed to write member counters")
+            except PyMongoError:
+                for member_id, fields in deltas.items():
+                    self.increment(member_id, **fields)
+                self.bot.logger.exception("Failed to write member counters")
+
+    async def run(self):
+        """Flush buffered deltas periodically."""
+        while True:
+            await asyncio.sleep(self.interval)
+            await self.flush()
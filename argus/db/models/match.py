@@ -0,0 +1,56 @@
+from datetime import datetime
+from typing import List, Optional
+
+from odmantic import EmbeddedModel, Field, Model
+
+from argus.db.models import DiscordMember
+
+
+class MatchParticipantModel(EmbeddedModel):
+    member: DiscordMember = Field()
+    debater: bool = Field(default=False)
+    against: Optional[bool] = Field(default=None)
+    place: Optional[int] = Field(default=None)
+    session_duration: float = Field(default=0)
+    votes: List[DiscordMember] = Field(default_factory=list)
+    mu_pre: float = Field()
+    sigma_pre: float = Field()
+    mu_post: Optional[float] = Field(default=None)
+    sigma_post: Optional[float] = Field(default=None)
+
+
+class MatchModel(Model):
+    room: int = Field()
+    topic: str = Field(default="")
+    session_start: Optional[datetime] = Field(default=None)
+    session_end: datetime = Field()
+    rated: bool = Field(default=False)
+    participants: List[MatchParticipantModel] = Field(default_factory=list)
+
+    # Schema
+    class Config:
+        schema_extra: dict = {
+            "examples": [
+                {
+                    "room": 1,
+                    "topic": "Pineapple belongs on pizza.",
+                    "session_start": "2022-06-01T12:00:00",
+                    "session_end": "2022-06-01T12:30:00",
+                    "rated": True,
+                    "participants": [
+                        {
+                            "member": 393213862620430336,
+                            "debater": True,
+                            "against": False,
+                            "place": 1,
+                            "session_duration": 1800.0,
+                            "votes": [982636774721482813],
+                            "mu_pre": 25,
+                            "sigma_pre": 25 / 3,
+                            "mu_post": 27.6,
+                            "sigma_post": 7.9,
+                        }
+                    ],
+                }
+            ]
+        }
@@ -1,8 +1,11 @@
 import logging
 import urllib.parse
+from typing import List, Type
 
 import certifi
-from motor.motor_asyncio import AsyncIOMotorClient
+from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorCollection
+from odmantic import Model
+from pymongo import UpdateOne
 
 from argus.db import DatabaseDriverBase
 
@@ -65,7 +68,7 @@ class MongoClient(AsyncIOMotorClient, DatabaseDriverBase):
             raise TypeError(f"'{entity}' is not an Entity!")
 
         collection = self[self.database][f"{entity.__class__.__name__}States"]
-        await collection.update_many(
+        await collection.update_one(
             {f"{entity.__class__.__name__.lower()}_id": int(entity.id)},
             {"$set": states},
             upsert=True,
@@ -105,7 +108,60 @@ class MongoClient(AsyncIOMotorClient, DatabaseDriverBase):
             raise TypeError(f"'{entity}' is not an Entity!")
 
         collection = self[self.database][f"{entity.__class__.__name__}States"]
-        await collection.update_many(
+        await collection.update_one(
             {f"{entity.__class__.__name__.lower()}_id": int(entity.id)},
             {"$inc": {state: value}},
         )
+
+    def collection(self, model: Type[Model]) -> AsyncIOMotorCollection:
+        """
+        Gets the collection documents of a model are stored in.
+        :param model: An ODMantic model class
+        :return: Returns the model's collection
+        """
+        return self[self.database][model.__collection__]
+
+    @staticmethod
+    def _check_fields(model: Type[Model], values: dict):
+        for field in values.keys():
+            if field not in model.__odm_fields__:
+                raise TypeError(f"'{field}' is not a field of '{model.__name__}'!")
+
+    async def set_fields(self, model: Type[Model], query: dict, **values) -> bool:
+        """
+        Sets fields on a single document without reading it first.
+        :param model: An ODMantic model class
+        :param query: A filter matching the document
+        :param values: A dict of fields and their new values
+        :return: Returns whether a document was matched
+        """
+        self._check_fields(model, values)
+        result = await self.collection(model).update_one(query, {"$set": values})
+        return result.matched_count > 0
+
+    async def increment_fields(self, model: Type[Model], query: dict, **values) -> bool:
+        """
+        Increments fields on a single document without reading it first.
+        :param model: An ODMantic model class
+        :param query: A filter matching the document
+        :param values: A dict of fields and the values to increment them by
+        :return: Returns whether a document was matched
+        """
+        self._check_fields(model, values)
+        result = await self.collection(model).update_one(query, {"$inc": values})
+        return result.matched_count > 0
+
+    async def bulk_update(
+        self, model: Type[Model], operations: List[UpdateOne], ordered: bool = False
+    ) -> int:
+        """
+        Applies many single document updates in one round-trip.
+        :param model: An ODMantic model class
+        :param operations: A list of UpdateOne operations
+        :param ordered: Whether to stop at the first failed operation
+        :return: Returns the number of documents modified
+        """
+        if not operations:
+            return 0
+        result = await self.collection(model).bulk_write(operations, ordered=ordered)
+        return result.modified_count
@@ -0,0 +1,44 @@
+import asyncio
+import functools
+from typing import Awaitable, Callable, Dict, Hashable
+
+
+class Debouncer:
+    """
+    Runs the latest callback scheduled for a key at most once per interval.
+    The first call runs right away and every call made while it runs or
+    while the interval passes is coalesced into a single trailing call.
+    """
+
+    def __init__(self, logger, interval: float = 2.0):
+        self.logger = logger
+        self.interval = interval
+        self._pending: Dict[Hashable, Callable[[], Awaitable]] = {}
+        self._tasks: Dict[Hashable, asyncio.Task] = {}
+
+    def schedule(self, key: Hashable, callback: Callable[[], Awaitable]):
+        """Replace the pending callback for a key and run it when allowed."""
+        self._pending[key] = callback
+        if key not in self._tasks:
+            self._start(key)
+
+    def _start(self, key: Hashable):
+        task = self._tasks[key] = asyncio.create_task(self._run(key))
+        task.add_done_callback(functools.partial(self._done, key))
+
+    def _done(self, key: Hashable, task: asyncio.Task):
+        del self._tasks[key]
+        if task.cancelled():
+            return
+        error = task.exception()
+        if error is not None:
+            self.logger.opt(exception=error).error("Debounced callback failed", key=key)
+        # A failed callback must not strand the one scheduled behind it
+        if key in self._pending:
+            self._start(key)
+
+    async def _run(self, key: Hashable):
+        while key in self._pending:
+            callback = self._pending.pop(key)
+            await callback()
+            await asyncio.sleep(self.interval)
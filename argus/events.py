@@ -0,0 +1,36 @@
+from collections import Counter
+from typing import Collection
+
+from discord import VoiceState
+
+
+class VoiceEventFilter:
+    """
+    Cheap check run before any voice listener logic. Events outside debate
+    rooms and events that stay in the same channel, such as mute, deafen,
+    stream or video toggles, are dropped and counted.
+    """
+
+    def __init__(self):
+        self.counts = Counter()
+
+    def __repr__(self):
+        return f"VoiceEventFilter({dict(self.counts)})"
+
+    def accept(
+        self, channel_ids: Collection[int], before: VoiceState, after: VoiceState
+    ) -> bool:
+        """Check if a voice event moved a member into or out of a debate room."""
+        self.counts["received"] += 1
+        before_id = before.channel.id if before.channel else None
+        after_id = after.channel.id if after.channel else None
+
+        if before_id not in channel_ids and after_id not in channel_ids:
+            self.counts["outside_rooms"] += 1
+            return False
+        if before_id == after_id:
+            self.counts["same_channel"] += 1
+            return False
+
+        self.counts["accepted"] += 1
+        return True
@@ -0,0 +1,33 @@
+import asyncio
+from collections import deque
+from typing import Any, Deque
+
+
+class FeedQueue(asyncio.Queue):
+    """
+    Bounded queue for the debate feed that never drops. Items published
+    while it is full wait in an overflow buffer, in order, and move into
+    the queue as the publisher takes items out.
+    """
+
+    def __init__(self, maxsize: int = 0):
+        super().__init__(maxsize)
+        self._overflow: Deque[Any] = deque()
+
+    @property
+    def overflowed(self) -> int:
+        """Number of items waiting for room in the queue."""
+        return len(self._overflow)
+
+    def put_nowait(self, item: Any):
+        # Anything already waiting was published first, so queue behind it
+        if self._overflow or self.full():
+            self._overflow.append(item)
+            return
+        super().put_nowait(item)
+
+    def get_nowait(self) -> Any:
+        item = super().get_nowait()
+        if self._overflow:
+            super().put_nowait(self._overflow.popleft())
+        return item
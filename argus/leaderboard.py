@@ -0,0 +1,73 @@
+import bisect
+from typing import Dict, List, Optional, Tuple
+
+from discord import Guild
+
+
+class Leaderboard:
+    """
+    Ratings of current guild members kept in descending order. Built once
+    from the database and then updated in place on every rating write.
+    """
+
+    def __init__(self):
+        self.loaded = False
+        self._ratings: Dict[int, float] = {}
+        self._order: List[Tuple[float, int]] = []
+
+    def __repr__(self):
+        return f"Leaderboard(members={len(self)}, loaded={self.loaded})"
+
+    def __len__(self):
+        return len(self._order)
+
+    def __contains__(self, member_id: int):
+        return member_id in self._ratings
+
+    async def load(self, collection, guild: Guild):
+        """Build the leaderboard from the member collection."""
+        ratings = {}
+        cursor = collection.find({}, {"_id": 0, "member": 1, "rating": 1})
+        async for document in cursor:
+            member = guild.get_member(document["member"])
+            if not member or member.bot:
+                continue
+            ratings[member.id] = float(document["rating"])
+
+        self._ratings = ratings
+        self._order = sorted((-rating, member) for member, rating in ratings.items())
+        self.loaded = True
+
+    def clear(self):
+        self._ratings = {}
+        self._order = []
+        self.loaded = False
+
+    def update(self, member_id: int, rating: float):
+        """Insert or move a member to the position of their new rating."""
+        self.remove(member_id)
+        rating = float(rating)
+        self._ratings[member_id] = rating
+        bisect.insort(self._order, (-rating, member_id))
+
+    def remove(self, member_id: int):
+        """Remove a member, such as when they leave the guild."""
+        rating = self._ratings.pop(member_id, None)
+        if rating is None:
+            return
+        index = bisect.bisect_left(self._order, (-rating, member_id))
+        del self._order[index]
+
+    def top(self, limit: int = 10, offset: int = 0) -> List[Tuple[int, float]]:
+        """Get the member IDs and ratings of a page of the leaderboard."""
+        return [
+            (member_id, -rating)
+            for rating, member_id in self._order[offset : offset + limit]
+        ]
+
+    def rank(self, member_id: int) -> Optional[int]:
+        """Get the 1-indexed position of a member on the leaderboard."""
+        rating = self._ratings.get(member_id)
+        if rating is None:
+            return None
+        return bisect.bisect_left(self._order, (-rating, member_id)) + 1
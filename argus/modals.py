@@ -3,7 +3,8 @@ import uuid
 import discord
 from discord import Embed, Interaction, ui
 
-from argus.db.models.user import MemberModel
+from argus.common import room_turn
+from argus.models import DebateRoom
 from argus.utils import update
 
 
@@ -33,9 +34,23 @@ class DebateVotingRubric(CustomModal, title="Voter Rubric"):
     select.add_option(label="Debater was respectful to others.", value="Respectful")
 
     async def on_submit(self, interaction: Interaction):
+        # Applied in order with the room's other mutations, so the match
+        # cannot conclude halfway through the vote
         room = self.states["room"]
+        async with room_turn(interaction.client, room, interaction):
+            await self.cast_vote(interaction, room)
+
+    async def cast_vote(self, interaction: Interaction, room: DebateRoom):
         author = self.states["author"]
         candidate = self.states["candidate"]
+        if not room.match:
+            embed = Embed(
+                title="Debate Concluded",
+                description="The debate ended before your vote was cast.",
+                color=0xE74C3C,
+            )
+            await update(interaction, embed=embed, ephemeral=True)
+            return
         result = room.match.vote(voter=author, candidate=candidate)
 
         if result is None:
@@ -55,21 +70,15 @@ class DebateVotingRubric(CustomModal, title="Voter Rubric"):
             await update(interaction, embed=embed, ephemeral=True)
             return
 
-        candidate_data = await interaction.client.engine.find_one(
-            MemberModel, MemberModel.member == candidate.id
+        select = self.select.values
+        interaction.client.state["member_counters"].increment(
+            candidate.id,
+            factual=int("Factual" in select),
+            consistent=int("Consistent" in select),
+            charitable=int("Charitable" in select),
+            respectful=int("Respectful" in select),
+            vote_count=1,
         )
-        if "Factual" in self.select.values:
-            candidate_data.factual += 1
-        if "Consistent" in self.select.values:
-            candidate_data.consistent += 1
-        if "Charitable" in self.select.values:
-            candidate_data.charitable += 1
-        if "Respectful" in self.select.values:
-            candidate_data.respectful += 1
-
-        candidate_data.vote_count += 1
-
-        await interaction.client.engine.save(candidate_data)
 
         embed = Embed(
             title="Vote Cast", description="Your vote has been cast", color=0x2ECC71
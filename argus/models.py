@@ -1,16 +1,18 @@
 import datetime
-from typing import List, Optional, Tuple
+import heapq
+from typing import Dict, List, Optional, Set, Tuple
 
 import discord
-import openskill
 from discord import Member, VoiceChannel
 
+from argus.rating import rate_match
+
 
 class DebateTopic:
     def __init__(self, member: discord.Member, message: str = ""):
         self.author = member
         self.message = message
-        self.voters = [self.author]
+        self._voters: Dict[int, discord.Member] = {member.id: member}
         self.prioritized = False
         self.created_at = datetime.datetime.utcnow()
 
@@ -36,20 +38,25 @@ class DebateTopic:
         else:
             return self.message
 
+    @property
+    def voters(self) -> List[discord.Member]:
+        return list(self._voters.values())
+
     @property
     def votes(self):
         if self.prioritized:
-            return len(self.voters) + 1
+            return len(self._voters) + 1
         else:
-            return len(self.voters)
+            return len(self._voters)
+
+    def has_voter(self, member) -> bool:
+        return member.id in self._voters
 
     def add_voter(self, member):
-        if member not in self.voters:
-            self.voters.append(member)
+        self._voters.setdefault(member.id, member)
 
     def remove_voter(self, member):
-        if member in self.voters:
-            self.voters.remove(member)
+        self._voters.pop(member.id, None)
 
 
 class DebateParticipant:
@@ -57,10 +64,11 @@ class DebateParticipant:
         self, member: discord.Member, mu, sigma, session_start: datetime.datetime
     ):
         self.member = member
-        self.debater = False
+        self._debater = False
         self.votes: List[DebateParticipant] = []
+        self.voted_for: List[DebateParticipant] = []
         self.place = None
-        self.against = None
+        self._against = None
 
         self.mu_pre = mu
         self.mu_post = 0
@@ -72,6 +80,10 @@ class DebateParticipant:
         self.session_end: Optional[datetime.datetime] = None
         self.session_duration: float = 0
 
+        # Tally Cache
+        self._voting_power: Optional[float] = None
+        self._total_votes: Optional[float] = None
+
     def __repr__(self):
         return (
             f"{self.member.display_name}(mu_post={self.mu_post}, "
@@ -80,6 +92,31 @@ class DebateParticipant:
             f"session_duration={self.session_duration}"
         )
 
+    @property
+    def debater(self) -> bool:
+        return self._debater
+
+    @debater.setter
+    def debater(self, value: bool):
+        self._debater = value
+        self._invalidate_voting_power()
+
+    @property
+    def against(self) -> Optional[bool]:
+        return self._against
+
+    @against.setter
+    def against(self, value: Optional[bool]):
+        self._against = value
+        self._total_votes = None
+        self._invalidate_voting_power()
+
+    def _invalidate_voting_power(self):
+        """Clear cached values that depend on this participant's votes."""
+        self._voting_power = None
+        for debater in self.voted_for:
+            debater._total_votes = None
+
     def type(self):
         if self.debater:
             if self.against:
@@ -98,23 +135,37 @@ class DebateParticipant:
 
     def update_duration(self):
         self.session_duration += float(self.time_spent())
+        self._invalidate_voting_power()
+
+    def add_vote(self, voter: "DebateParticipant"):
+        self.votes.append(voter)
+        voter.voted_for.append(self)
+        self._total_votes = None
 
     def voting_power(self) -> float:
-        if self.debater:
-            return 1 * (1.039582 * (self.session_duration**1.579646))
-        else:
-            return 0.5 * (1.039582 * (self.session_duration**1.579646))
+        if self._voting_power is None:
+            if self.debater:
+                self._voting_power = 1 * (
+                    1.039582 * (self.session_duration**1.579646)
+                )
+            else:
+                self._voting_power = 0.5 * (
+                    1.039582 * (self.session_duration**1.579646)
+                )
+        return self._voting_power
 
     def total_votes(self):
-        votes: float = 0
-        for voter in self.votes:
-            if voter.against == self.against:
-                vote = voter.voting_power()
-                votes += vote
-            else:
-                vote = voter.voting_power() + 1
-                votes += vote
-        return votes
+        if self._total_votes is None:
+            votes: float = 0
+            for voter in self.votes:
+                if voter.against == self.against:
+                    vote = voter.voting_power()
+                    votes += vote
+                else:
+                    vote = voter.voting_power() + 1
+                    votes += vote
+            self._total_votes = votes
+        return self._total_votes
 
 
 class DebateMatch:
@@ -122,6 +173,11 @@ class DebateMatch:
         self.topic = topic
         self.participants: List[DebateParticipant] = []
 
+        # Indexes by member ID
+        self._participants: Dict[int, DebateParticipant] = {}
+        self._debaters: Dict[int, DebateParticipant] = {}
+        self._voted_for: Dict[int, DebateParticipant] = {}
+
         self.session_start: Optional[datetime.datetime] = None
         self.session_end: Optional[datetime.datetime] = None
 
@@ -129,13 +185,8 @@ class DebateMatch:
         self.concluding = False
         self.concluded = False
 
-    def add_for(self, participant: DebateParticipant):
+    def _add_participant(self, participant: DebateParticipant):
         p = participant
-        for _ in self.participants:
-            if _.member == p.member:
-                p.against = False
-                return
-        p.against = False
 
         # Reset session start time for first participant to prevent
         # first mover advantage.
@@ -145,134 +196,102 @@ class DebateMatch:
             p.session_start = time_now
 
         self.participants.append(p)
+        self._participants[p.member.id] = p
+
+    def add_for(self, participant: DebateParticipant):
+        p = participant
+        p.against = False
+        if p.member.id in self._participants:
+            return
+        self._add_participant(p)
 
     def add_against(self, participant: DebateParticipant):
         p = participant
-        for _ in self.participants:
-            if _.member == p.member:
-                p.against = True
-                return
         p.against = True
-
-        # Reset session start time for first participant to prevent
-        # first mover advantage.
-        if len(self.participants) == 1:
-            time_now = datetime.datetime.utcnow()
-            self.participants[0].session_start = time_now
-            p.session_start = time_now
-
-        self.participants.append(p)
+        if p.member.id in self._participants:
+            return
+        self._add_participant(p)
 
     def remove_participant(self, member: discord.Member):
         """Remove a participant by passing a discord.Member object"""
-        for m in self.participants:
-            if m.member == member:
-                if not m.debater:
-                    self.participants.remove(m)
+        m = self._participants.get(member.id)
+        if m and not m.debater:
+            self.participants.remove(m)
+            del self._participants[member.id]
 
     def check_participant(self, member: discord.Member):
         """Check if a member is an active participant."""
-        for m in self.participants:
-            if m.member == member:
-                return True
-        return False
+        return member.id in self._participants
 
     def switched_position(self, member: discord.Member) -> Optional[bool]:
         """Check is a voter switched their position."""
         checked_member = self.get_participant(member)
-        for debater in self.get_debaters():
-            if checked_member in [v.member for v in debater.votes]:
-                if checked_member.against == debater.against:
-                    return False
-                else:
-                    return True
-        return None
+        debater = self._voted_for.get(member.id)
+        if not checked_member or not debater:
+            return None
+        return checked_member.against != debater.against
 
     def add_debater(self, member: discord.Member):
         if not self.session_start:
             self.session_start = datetime.datetime.utcnow()
 
-        for m in self.participants:
-            if m.member == member:
-                m.debater = True
-                m.session_start = datetime.datetime.utcnow()
-                break
+        m = self._participants.get(member.id)
+        if m:
+            m.debater = True
+            m.session_start = datetime.datetime.utcnow()
+            self._debaters[member.id] = m
 
     def get_debaters(self):
-        debaters = []
-        for p in self.participants:
-            if p.debater:
-                debaters.append(p)
-        return debaters
+        return list(self._debaters.values())
 
     def check_debater(self, member: discord.Member):
         """Check if a member is a debater."""
-        debaters = [d.member for d in self.get_debaters()]
-        return member in debaters
+        return member.id in self._debaters
 
     def vote(self, voter: discord.Member, candidate: discord.Member):
-        for d in self.get_debaters():
-            if d.member == candidate:
-                voter_participant = self.get_participant(voter)
-                if not voter_participant:
-                    return None
-                voter_index = self.participants.index(voter_participant)
-                voter = self.participants[voter_index]
-                d.votes.append(voter)
-                return True
-        else:
+        d = self._debaters.get(candidate.id)
+        if not d:
             return False
+        voter_participant = self._participants.get(voter.id)
+        if not voter_participant:
+            return None
+        d.add_vote(voter_participant)
+        self._voted_for[voter.id] = d
+        return True
 
     def check_voters(self):
         """Check if there are any voters."""
-        for debater in self.get_debaters():
+        for debater in self._debaters.values():
             if len(debater.votes) > 0:
                 return True
         return False
 
     def get_debater(self, member: discord.Member):
-        debaters = self.get_debaters()
-        for d in debaters:
-            if d.member == member:
-                return d
+        return self._debaters.get(member.id)
 
     def get_participant(self, member: discord.Member):
-        for p in self.participants:
-            if p.member == member:
-                return p
+        return self._participants.get(member.id)
 
     def calculate_places(self):
-        debaters = self.get_debaters()
-        debaters = sorted(debaters, key=lambda x: float((x.total_votes())))[::-1]
+        tallies = [(debater.total_votes(), debater) for debater in self.get_debaters()]
+        tallies = sorted(tallies, key=lambda x: x[0])[::-1]
         place = 0
-        previous_debater = None
-        for debater in debaters:
-            if previous_debater:
-                if previous_debater.total_votes() == debater.total_votes():
-                    debater.place = previous_debater.place
-                    previous_debater = debater
-                else:
-                    place += 1
-                    debater.place = place
-                    previous_debater = debater
-            else:
+        previous_tally = None
+        for tally, debater in tallies:
+            if place == 0 or tally != previous_tally:
                 place += 1
-                debater.place = place
-                previous_debater = debater
+                previous_tally = tally
+            debater.place = place
 
     def calculate_ratings(self):
-        debaters = self.get_debaters()
-        sorted_debaters = sorted(debaters, key=lambda _: _.place)
-        debater_ratings = openskill.rate(
-            [
-                [openskill.create_rating([debater.mu_pre, debater.sigma_pre])]
-                for debater in sorted_debaters
-            ]
+        sorted_debaters = sorted(self.get_debaters(), key=lambda _: _.place)
+        mu_post, sigma_post = rate_match(
+            [debater.mu_pre for debater in sorted_debaters],
+            [debater.sigma_pre for debater in sorted_debaters],
         )
-        for raw_rating in debater_ratings:
-            rating = raw_rating[0]
-            sorted_debaters[debater_ratings.index(raw_rating)].mu_post = rating.mu
-            sorted_debaters[debater_ratings.index(raw_rating)].sigma_post = rating.sigma
+        for debater, mu, sigma in zip(sorted_debaters, mu_post, sigma_post):
+            debater.mu_post = float(mu)
+            debater.sigma_post = float(sigma)
 
     def stop(self):
         self.session_end = datetime.datetime.utcnow()
@@ -290,10 +309,12 @@ class DebateRoom:
         self.vc: VoiceChannel = vc
 
         # Dynamic
-        self.topics: List[DebateTopic] = []
-        self._topic_voters: List[discord.Member] = []
+        self._topics: Dict[int, DebateTopic] = {}
+        self._voted_topics: Dict[int, Set[int]] = {}
+        self._prioritized: Optional[DebateTopic] = None
+        self._topic_voters: Dict[int, discord.Member] = {}
         self.match: Optional[DebateMatch] = None
-        self._conclude_voters: List[Member] = []
+        self._conclude_voters: Dict[int, Member] = {}
         self.current_topic: Optional[DebateTopic] = None
 
         # Studio Variables
@@ -309,8 +330,8 @@ class DebateRoom:
         self.lounge = False
         self.lounge_master: Optional[Member] = None
 
-        # Progress State
-        self.updating_topic = False
+        # Topic Selection Index
+        self._reset_topic_index()
 
     def __repr__(self):
         return f"DebateRoom(number={self.number})"
@@ -337,21 +358,20 @@ class DebateRoom:
         else:
             return None
 
+    @property
+    def topics(self) -> List[DebateTopic]:
+        """Topics in the order they were first proposed."""
+        return list(self._topics.values())
+
     def get_topic_members(self) -> List[Member]:
         """Generate the unique Members of all Topics."""
-        if self.topics:
-            return [topic.author for topic in self.topics]
-        else:
-            return []
+        return [topic.author for topic in self._topics.values()]
 
     # Topic Methods
 
     def topic_from_member(self, member: discord.Member) -> Optional[DebateTopic]:
         """Get a Topic from a Member."""
-        if self.topics:
-            topic = [t for t in self.topics if t.author == member]
-            if len(topic) > 0:
-                return topic[0]
+        return self._topics.get(member.id)
 
     def topics_from_authors(self, topics: List[DebateTopic]) -> List[DebateTopic]:
         """Get a list of topics from possible authors."""
@@ -367,34 +387,110 @@ class DebateRoom:
         topic = self.topic_from_member(author)
         if topic:
             topic.created_at = datetime.datetime.utcnow()
+            self._push_topic_age(topic)
+
+    # Topic Selection Index
+
+    def _reset_topic_index(self):
+        # Heap of (created_at, position, author ID, token), where only the
+        # latest token pushed for an author is live
+        self._topic_ages: List[Tuple[datetime.datetime, int, int, int]] = []
+        self._topic_age_tokens: Dict[int, int] = {}
+        self._topic_positions: Dict[int, int] = {}
+        self._topic_token = 0
+
+        # Author IDs of topics by their number of voters
+        self._vote_buckets: Dict[int, Set[int]] = {}
+        self._max_votes = 0
+
+    def _push_topic_age(self, topic: DebateTopic):
+        author_id = topic.author.id
+        self._topic_token += 1
+        self._topic_age_tokens[author_id] = self._topic_token
+        heapq.heappush(
+            self._topic_ages,
+            (
+                topic.created_at,
+                self._topic_positions[author_id],
+                author_id,
+                self._topic_token,
+            ),
+        )
+
+        # Drop stale entries once they outnumber live ones
+        if len(self._topic_ages) > 2 * len(self._topics) + 16:
+            self._topic_ages = [
+                entry
+                for entry in self._topic_ages
+                if self._topic_age_tokens.get(entry[2]) == entry[3]
+            ]
+            heapq.heapify(self._topic_ages)
+
+    def _oldest_topic(self) -> Optional[DebateTopic]:
+        """Get the oldest topic, ties going to the earliest proposed."""
+        while self._topic_ages:
+            _, _, author_id, token = self._topic_ages[0]
+            if self._topic_age_tokens.get(author_id) == token:
+                return self._topics[author_id]
+            heapq.heappop(self._topic_ages)
+        return None
+
+    def _bucket_add(self, topic: DebateTopic):
+        votes = len(topic._voters)
+        self._vote_buckets.setdefault(votes, set()).add(topic.author.id)
+        if votes > self._max_votes:
+            self._max_votes = votes
+
+    def _bucket_remove(self, topic: DebateTopic):
+        votes = len(topic._voters)
+        bucket = self._vote_buckets[votes]
+        bucket.discard(topic.author.id)
+        if not bucket:
+            del self._vote_buckets[votes]
+            while self._max_votes > 0 and self._max_votes not in self._vote_buckets:
+                self._max_votes -= 1
+
+    def _add_vote(self, topic: DebateTopic, voter: discord.Member):
+        if not topic.has_voter(voter):
+            self._bucket_remove(topic)
+            topic.add_voter(voter)
+            self._bucket_add(topic)
+        self._voted_topics.setdefault(voter.id, set()).add(topic.author.id)
+
+    def _forget_votes(self, topic: DebateTopic):
+        """Drop a topic's voters from the voter index."""
+        for voter_id in topic._voters:
+            authors = self._voted_topics.get(voter_id)
+            if authors:
+                authors.discard(topic.author.id)
+                if not authors:
+                    del self._voted_topics[voter_id]
 
     def update_prioritized_topic(self) -> bool:
         """Updates the oldest topic to current topic"""
-        if len(self.topics) == 0:
-            return False
-        sorted_topics = sorted(self.topics, key=lambda topic: topic.created_at)
-        sorted_topics = self.topics_from_authors(sorted_topics)
-        if len(sorted_topics) == 0:
+        oldest_topic = self._oldest_topic()
+        if not oldest_topic:
             return False
-        oldest_topic = sorted_topics[0]
-        oldest_topic_index = self.topics.index(oldest_topic)
-        for topic in self.topics:
-            topic.prioritized = False
-        self.topics[oldest_topic_index].prioritized = True
+        if self._prioritized:
+            self._prioritized.prioritized = False
+        oldest_topic.prioritized = True
+        self._prioritized = oldest_topic
         return True
 
     def remove_voter_from_topics(self, voter: discord.Member):
         """Removes a voter from all topics."""
-        if self.topics:
-            for topic in self.topics:
+        for author_id in self._voted_topics.pop(voter.id, ()):
+            topic = self._topics.get(author_id)
+            if topic and topic.has_voter(voter):
+                self._bucket_remove(topic)
                 topic.remove_voter(voter)
+                self._bucket_add(topic)
 
     def remove_priority_from_topic(self, author: discord.Member):
         """Removes priority from topic based on topic author."""
-        if self.topics:
-            for topic in self.topics:
-                if topic.author == author:
-                    topic.prioritized = False
+        topic = self.topic_from_member(author)
+        if topic:
+            topic.prioritized = False
 
     def add_topic(self, topic: DebateTopic) -> bool:
         """Add a new topic if the member is new. If old member, then overwrite
@@ -404,26 +500,39 @@ class DebateRoom:
         True
             Topic was updated instead of inserted.
         """
-        if topic.author in self.get_topic_members():
-            index = self.get_topic_members().index(topic.author)
+        author_id = topic.author.id
+        previous = self._topics.get(author_id)
+        if previous:
             self.remove_voter_from_topics(topic.author)
-            self.topics[index] = topic
-            return True
+            self._forget_votes(previous)
+            self._bucket_remove(previous)
         else:
-            self.topics.append(topic)
-            return False
-
-    def _calculate_max_voted_topics(self) -> List[DebateTopic]:
-        """Calculates maximum voted topics."""
-        if len(self.topics) == 0:
-            return []
-        max_topic = max(self.topics, key=lambda topic: topic.votes)
-        max_voted_topics = [
-            topic
-            for index, topic in enumerate(self.topics)
-            if topic.votes == max_topic.votes
-        ]
-        return max_voted_topics
+            self._topic_token += 1
+            self._topic_positions[author_id] = self._topic_token
+
+        # Replacing a key keeps the original position of the topic
+        self._topics[author_id] = topic
+        self._bucket_add(topic)
+        for voter in topic.voters:
+            self._add_vote(topic, voter)
+        self._push_topic_age(topic)
+        return previous is not None
+
+    def _select_topic(self) -> Optional[DebateTopic]:
+        """
+        Pick the topic with the most votes, where the oldest topic gets an
+        extra vote and wins ties. Without the oldest topic in the lead, a
+        tie for the most votes selects nothing.
+        """
+        oldest_topic = self._prioritized
+        if not oldest_topic:
+            return None
+        if len(oldest_topic._voters) + 1 >= self._max_votes:
+            return oldest_topic
+        leaders = self._vote_buckets[self._max_votes]
+        if len(leaders) == 1:
+            return self._topics[next(iter(leaders))]
+        return None
 
     def set_current_topic(self) -> bool:
         """Set the current topic.
@@ -434,24 +543,15 @@ class DebateRoom:
         False
             Topic was the same and caused no change to current topic.
         """
-        self.update_prioritized_topic()
-        max_voted_topics = self._calculate_max_voted_topics()
-        for topic in max_voted_topics:
-            if topic.prioritized:
-                if self.current_topic == topic:
-                    self.current_topic = topic
-                    return False
-                else:
-                    self.current_topic = topic
-                    return True
+        if not self.update_prioritized_topic():
+            self._prioritized = None
 
-        if len(max_voted_topics) == 1:
-            if self.current_topic == max_voted_topics[0]:
-                self.current_topic = max_voted_topics[0]
+        topic = self._select_topic()
+        if topic:
+            if self.current_topic == topic:
                 return False
-            else:
-                self.current_topic = max_voted_topics[0]
-                return True
+            self.current_topic = topic
+            return True
 
         if self.current_topic:
             self.current_topic = None
@@ -466,27 +566,37 @@ class DebateRoom:
 
     def vote_topic(self, voter: discord.Member, candidate: discord.Member):
         """Increment a vote on a topic."""
-        members = self.get_topic_members()
-        if candidate in members:
+        topic = self.topic_from_member(candidate)
+        if topic:
             self.remove_voter_from_topics(voter)
-
-            topic = self.topic_from_member(candidate)
-            topic.add_voter(voter)
+            self._add_vote(topic, voter)
             return topic
 
     def remove_topic(self, author: discord.Member):
         """Remove a topic from room."""
-        topic = self.topic_from_member(author)
+        topic = self._topics.pop(author.id, None)
         if topic:
-            self.topics.remove(topic)
+            self._forget_votes(topic)
+            self._bucket_remove(topic)
+            del self._topic_age_tokens[author.id]
+            del self._topic_positions[author.id]
 
     def remove_obsolete_topics(self):
         """Remove all topics that hit 0 votes and the author is not in the room."""
-        for topic in self.topics:
-            if topic.votes == 0 and topic.author not in self.vc.members:
+        # Only topics in the empty vote bucket can be obsolete
+        candidates = self._vote_buckets.get(0)
+        if candidates:
+            member_ids = {member.id for member in self.vc.members}
+            obsolete = [
+                self._topics[author_id]
+                for author_id in candidates
+                if author_id not in member_ids
+                and not self._topics[author_id].prioritized
+            ]
+            for topic in obsolete:
                 if topic == self.current_topic:
                     self.current_topic = None
-                self.topics.remove(topic)
+                self.remove_topic(topic.author)
 
         if self.current_topic:
             return True
@@ -497,22 +607,16 @@ class DebateRoom:
 
     def add_topic_voter(self, member: discord.Member):
         """Add topic voters."""
-        if member in self._topic_voters:
-            pass
-        else:
-            self._topic_voters.append(member)
+        self._topic_voters.setdefault(member.id, member)
 
     def remove_topic_voter(self, member: discord.Member):
         """Remove topic voters."""
-        try:
-            self._topic_voters.remove(member)
-        except ValueError as e_info:
-            pass
+        self._topic_voters.pop(member.id, None)
         self.remove_voter_from_topics(member)
 
     def get_topic_voters(self) -> List[discord.Member]:
         """Return voter ids."""
-        return self._topic_voters
+        return list(self._topic_voters.values())
 
     # Debate Match Methods
     def start_match(self, topic):
@@ -539,8 +643,7 @@ class DebateRoom:
     ) -> Tuple[Optional[List[DebateParticipant]], Optional[bool], Optional[bool]]:
         if self.match:
             if self.match.check_participant(voter):
-                if voter not in self._conclude_voters:
-                    self._conclude_voters.append(voter)
+                self._conclude_voters.setdefault(voter.id, voter)
 
             if len(self.match.participants) < 1:
                 if self.match.check_voters():
@@ -563,8 +666,55 @@ class DebateRoom:
             return None, None, None  # No match to stop
 
     def remove_conclude_voters(self):
-        self._conclude_voters = []
+        self._conclude_voters = {}
 
     def purge_topics(self):
-        if self.topics:
-            self.topics = []
+        self._topics = {}
+        self._voted_topics = {}
+        self._reset_topic_index()
+
+
+class DebateRoomRegistry:
+    """
+    Debate rooms indexed by room number and by voice channel ID. Iterates
+    in the order rooms were added like the list it replaces.
+    """
+
+    def __init__(self):
+        self._by_number: Dict[int, DebateRoom] = {}
+        self._by_channel: Dict[int, DebateRoom] = {}
+
+    def __repr__(self):
+        return f"DebateRoomRegistry(rooms={len(self)})"
+
+    def __iter__(self):
+        return iter(self._by_number.values())
+
+    def __len__(self):
+        return len(self._by_number)
+
+    def __contains__(self, room: DebateRoom):
+        return self._by_number.get(room.number) is room
+
+    @property
+    def channel_ids(self):
+        """IDs of the voice channels of all rooms."""
+        return self._by_channel.keys()
+
+    def append(self, room: DebateRoom):
+        self._by_number[room.number] = room
+        self._by_channel[room.vc.id] = room
+
+    def clear(self):
+        self._by_number = {}
+        self._by_channel = {}
+
+    def get(self, number: int) -> Optional[DebateRoom]:
+        """Get a room from its number."""
+        return self._by_number.get(number)
+
+    def from_channel(self, channel) -> Optional[DebateRoom]:
+        """Get the room of a voice channel or its text chat."""
+        if channel is None:
+            return None
+        return self._by_channel.get(channel.id)
@@ -1,18 +1,13 @@
-import asyncio
 import io
-import math
 import random
 import typing
-from asyncio import Task
 from datetime import datetime, timedelta
-from queue import Queue
 from typing import Optional
 
 import discord
-import matplotlib.pyplot as plt
 import openskill
 import pymongo
-from discord import Embed, Interaction, Member, Role, app_commands
+from discord import Embed, Interaction, Member, app_commands
 from discord.app_commands import (
     AppCommandError,
     MissingAnyRole,
@@ -21,28 +16,45 @@ from discord.app_commands import (
 )
 from discord.ext import commands
 from humanize import precisedelta
-from matplotlib import ticker
 
+from argus.charts import render_rubric_chart
 from argus.client import ArgusClient
 from argus.common import (
     add_interface_message,
+    bulk_insert_skills,
     check_debater_in_any_room,
     consented,
     get_debater_room,
+    get_interface_message,
+    get_rank,
     get_room,
+    get_room_actor,
     get_room_number,
     in_commands_or_debate,
     in_debate_room,
     insert_skill,
+    record_match,
+    room_turn,
+    save_ratings,
     unlocked_in_private_room,
     update_im,
     update_topic,
 )
-from argus.constants import RANK_RATING_MAP
 from argus.db.models.user import MemberModel
+from argus.leaderboard import Leaderboard
 from argus.modals import DebateVotingRubric
-from argus.models import DebateParticipant, DebateRoom, DebateTopic
-from argus.utils import floor_rating, normalize, update
+from argus.models import (
+    DebateParticipant,
+    DebateRoom,
+    DebateRoomRegistry,
+    DebateTopic,
+)
+from argus.policy import desired_mute, voice_context
+from argus.replay import replay_ratings
+from argus.tasks import publish_to_debate_feed
+from argus.timers import RoomTimers
+from argus.utils import defer, normalize, update
+from argus.voice import mute_members
 
 
 @app_commands.default_permissions(send_messages=True)
@@ -83,23 +95,11 @@ class Skill(
                 await update(interaction, embed=embed, ephemeral=True)
             else:
                 packed_data = await insert_skill(self.bot, interaction, member)
-                pipeline = [
-                    {"$sort": {"rating": -1}},
-                    {"$group": {"_id": None, "items": {"$push": "$$ROOT"}}},
-                    {"$unwind": {"path": "$items", "includeArrayIndex": "items.rank"}},
-                    {"$replaceRoot": {"newRoot": "$items"}},
-                    {"$addFields": {"newRank": {"$add": ["$rank", 1]}}},
-                    {"$match": {"member": int(member.id)}},
-                ]
-
-                member_found = None
-                member_doc = self.bot.db[self.bot.db.database].member.aggregate(
-                    pipeline=pipeline
-                )
-                async for member_found in member_doc:
-                    break
-
-                if not member_found:
+                member_data = await self.bot.engine.find_one(
+                    MemberModel, MemberModel.member == member.id
+                )
+
+                if not member_data:
                     embed = Embed(
                         title="Unknown Error",
                         description="Database seems to be corrupt. Please contact an engineer.",
@@ -108,15 +108,17 @@ class Skill(
                     await update(interaction, embed=embed, ephemeral=True)
                     return
 
+                # Include votes not yet written to the database
+                counters = self.bot.state["member_counters"].pending(member.id)
+                for field, value in counters.items():
+                    setattr(member_data, field, getattr(member_data, field) + value)
+
                 mu = packed_data["mu"]
                 sigma = packed_data["sigma"]
-                rating = packed_data["rating"]
                 current_rank_role = packed_data["current_rank_role"]
                 rank = current_rank_role
+                position = await get_rank(self.bot, member)
 
-                member_data = await self.bot.engine.find_one(
-                    MemberModel, MemberModel.member == member.id
-                )
                 y = {
                     "Factual": member_data.factual,
                     "Consistent": member_data.consistent,
@@ -124,15 +126,8 @@ class Skill(
                     "Respectful": member_data.respectful,
                 }
                 y = normalize(y)
-                plt.style.use("ggplot")
-                fig, ax = plt.subplots()
-                ax.barh(list(y.keys()), list(y.values()))
-                plt.tight_layout()
-                ax.xaxis.set_major_formatter(ticker.PercentFormatter(xmax=1))
-                buffer = io.BytesIO()
-                plt.savefig(buffer, format="png")
-                buffer.seek(0)
-                file = discord.File(fp=buffer, filename="graph.png")
+                chart = await render_rubric_chart(y)
+                file = discord.File(fp=io.BytesIO(chart), filename="graph.png")
 
                 avatar_url = None
                 if member.avatar:
@@ -157,7 +152,7 @@ class Skill(
                 )
                 embed.add_field(
                     name="Rank",
-                    value=f"```{str(member_found['rank'] + 1)}```",
+                    value=f"```{position or 'Unranked'}```",
                     inline=True,
                 )
                 embed.add_field(name="Title", value=f"```{rank.name}```", inline=True)
@@ -172,23 +167,11 @@ class Skill(
                     await update(interaction, file=file, embed=embed, ephemeral=True)
         else:
             packed_data = await insert_skill(self.bot, interaction, interaction.user)
-            pipeline = [
-                {"$sort": {"rating": -1}},
-                {"$group": {"_id": None, "items": {"$push": "$$ROOT"}}},
-                {"$unwind": {"path": "$items", "includeArrayIndex": "items.rank"}},
-                {"$replaceRoot": {"newRoot": "$items"}},
-                {"$addFields": {"newRank": {"$add": ["$rank", 1]}}},
-                {"$match": {"member": int(interaction.user.id)}},
-            ]
-
-            member_found = None
-            member_doc = self.bot.db[self.bot.db.database].member.aggregate(
-                pipeline=pipeline
+            member_data = await self.bot.engine.find_one(
+                MemberModel, MemberModel.member == interaction.user.id
             )
-            async for member_found in member_doc:
-                break
 
-            if not member_found:
+            if not member_data:
                 embed = Embed(
                     title="Unknown Error",
                     description="Database seems to be corrupt. Please contact an engineer.",
@@ -197,15 +180,17 @@ class Skill(
                 await update(interaction, embed=embed, ephemeral=True)
                 return
 
+            # Include votes not yet written to the database
+            counters = self.bot.state["member_counters"].pending(interaction.user.id)
+            for field, value in counters.items():
+                setattr(member_data, field, getattr(member_data, field) + value)
+
             mu = packed_data["mu"]
             sigma = packed_data["sigma"]
-            rating = packed_data["rating"]
             current_rank_role = packed_data["current_rank_role"]
             rank = current_rank_role
+            position = await get_rank(self.bot, interaction.user)
 
-            member_data = await self.bot.engine.find_one(
-                MemberModel, MemberModel.member == interaction.user.id
-            )
             y = {
                 "Factual": member_data.factual,
                 "Consistent": member_data.consistent,
@@ -213,18 +198,8 @@ class Skill(
                 "Respectful": member_data.respectful,
             }
             y = normalize(y)
-            plt.style.use("ggplot")
-            fig, ax = plt.subplots()
-            ax.barh(list(y.keys()), list(y.values()))
-            plt.tight_layout()
-            ax.xaxis.set_major_formatter(ticker.PercentFormatter(xmax=1))
-            buffer = io.BytesIO()
-            plt.savefig(
-                buffer,
-                format="png",
-            )
-            buffer.seek(0)
-            file = discord.File(fp=buffer, filename="graph.png")
+            chart = await render_rubric_chart(y)
+            file = discord.File(fp=io.BytesIO(chart), filename="graph.png")
 
             avatar_url = None
             if interaction.user.avatar:
@@ -248,7 +223,7 @@ class Skill(
                 inline=True,
             )
             embed.add_field(
-                name="Rank", value=f"```{str(member_found['rank'] + 1)}```", inline=True
+                name="Rank", value=f"```{position or 'Unranked'}```", inline=True
             )
             embed.add_field(name="Title", value=f"```{rank.name}```", inline=True)
             embed.add_field(
@@ -381,29 +356,22 @@ class Skill(
     async def leaderboard(
         self,
         interaction: Interaction,
+        page: Optional[app_commands.Range[int, 1]] = 1,
     ) -> None:
         if not await in_commands_or_debate(self.bot, interaction):
             return
 
-        skill_cursor = (
-            self.bot.db[self.bot.db.database]
-            .member.find()
-            .sort("rating", pymongo.DESCENDING)
-        )
-
         guild = interaction.guild
+        leaderboard: Leaderboard = self.bot.state["leaderboard"]
+        if not leaderboard.loaded:
+            await leaderboard.load(self.bot.db[self.bot.db.database].member, guild)
+
+        offset = (page - 1) * 10
         description = ""
-        count = 0
-        async for skill_mapping in skill_cursor:
-            if count == 10:
-                break
-            member = guild.get_member(skill_mapping["member"])
-            if not member:
-                continue
-            count += 1
-            description += (
-                f"`{count: 03d}` {member.mention} • {skill_mapping['rating']: .2f}\n"
-            )
+        for count, (member_id, rating) in enumerate(
+            leaderboard.top(limit=10, offset=offset), start=offset + 1
+        ):
+            description += f"`{count: 03d}` <@{member_id}> • {rating: .2f}\n"
 
         embed = Embed(
             title="Rating Leaderboard",
@@ -451,26 +419,13 @@ class Skill(
     )
     @app_commands.checks.has_permissions(administrator=True)
     async def setup(self, interaction: Interaction) -> None:
-        members = interaction.guild.members
-
-        count = 0
-        embed = Embed(
-            title="Processing Members",
-            description=f"Count: {count}",
-            color=0xF1C40F,
-        )
-        await update(interaction, embed=embed)
-
-        for member in members:
-            if member.pending:
-                continue
-
-            if member.bot:
-                continue
-
-            await insert_skill(self.bot, interaction, member)
-            count += 1
+        members = [
+            member
+            for member in interaction.guild.members
+            if not member.pending and not member.bot
+        ]
 
+        async def report_progress(count: int):
             embed = Embed(
                 title="Processing Members",
                 description=f"Count: {count}",
@@ -478,6 +433,10 @@ class Skill(
             )
             await update(interaction, embed=embed)
 
+        await report_progress(0)
+        count = await bulk_insert_skills(self.bot, members, progress=report_progress)
+        await report_progress(count)
+
         embed = Embed(
             title="Creating Indexes",
             description=f"Sorting member skill ratings in descending order.",
@@ -496,6 +455,28 @@ class Skill(
         )
         await update(interaction, embed=embed, ephemeral=True)
 
+    @app_commands.command(
+        name="replay",
+        description="Recompute the skills of all members from the match log.",
+    )
+    @app_commands.checks.has_permissions(administrator=True)
+    async def replay(self, interaction: Interaction) -> None:
+        embed = Embed(
+            title="Replaying Matches",
+            description="Recomputing member skills from the match log.",
+            color=0xF1C40F,
+        )
+        await update(interaction, embed=embed)
+
+        count = await replay_ratings(self.bot)
+
+        embed = Embed(
+            title="Skill Successfully Replayed",
+            description=f"Skills of {count} members have been recomputed.",
+            color=0x2ECC71,
+        )
+        await update(interaction, embed=embed, ephemeral=True)
+
 
 @app_commands.default_permissions(send_messages=True, connect=True)
 class Topic(
@@ -567,57 +548,45 @@ class Topic(
         room_number = get_room_number(self.bot, channel)
         room: typing.Optional[DebateRoom] = get_room(self.bot, room_number)
 
-        if room.updating_topic:
-            await update(
-                interaction,
-                embed=Embed(
-                    title="Command Temporarily Disabled",
-                    description="This command only works once the topic has finished updating.",
+        async with room_turn(self.bot, room, interaction):
+            if room.lounge:
+                embed = Embed(
+                    title="Command Unauthorized",
+                    description=f"You cannot use this command in a lounge room.",
                     color=0xE74C3C,
-                ),
-                errored=True,
-                ephemeral=True,
-            )
-            return
-
-        if room.lounge:
-            embed = Embed(
-                title="Command Unauthorized",
-                description=f"You cannot use this command in a lounge room.",
-                color=0xE74C3C,
-            )
-            await update(interaction, embed=embed, ephemeral=True)
-            return
+                )
+                await update(interaction, embed=embed, ephemeral=True)
+                return
 
-        topic_updated = room.add_topic(
-            DebateTopic(
-                member=interaction.user,
-                message=topic,
-            )
-        )
-        if topic_updated:
-            embed = Embed(
-                title="Topic Reset",
-                description=f"Note: Any votes on your topic have been reset.",
-                color=0xF1C40F,
-            )
-            embed.add_field(name="Topic", value=f"{topic}")
-            await update(
-                interaction,
-                embed=embed,
-            )
-        else:
-            embed = Embed(title="Topic Added", description=f"{topic}", color=0x2ECC71)
-            await update(
-                interaction,
-                embed=embed,
+            topic_updated = room.add_topic(
+                DebateTopic(
+                    member=interaction.user,
+                    message=topic,
+                )
             )
+            if topic_updated:
+                embed = Embed(
+                    title="Topic Reset",
+                    description=f"Note: Any votes on your topic have been reset.",
+                    color=0xF1C40F,
+                )
+                embed.add_field(name="Topic", value=f"{topic}")
+                await update(
+                    interaction,
+                    embed=embed,
+                )
+            else:
+                embed = Embed(
+                    title="Topic Added", description=f"{topic}", color=0x2ECC71
+                )
+                await update(
+                    interaction,
+                    embed=embed,
+                )
 
-        await update_im(self.bot, room_num=room.number)
+            await update_im(self.bot, room_num=room.number)
 
-        room.updating_topic = True
-        await update_topic(self.bot, room)
-        room.updating_topic = False
+            await update_topic(self.bot, room)
 
     @app_commands.command(
         name="vote",
@@ -644,62 +613,49 @@ class Topic(
         room: typing.Optional[DebateRoom] = get_room(self.bot, room_number)
         candidate = member
 
-        if room.lounge:
-            embed = Embed(
-                title="Command Unauthorized",
-                description=f"You cannot use this command in a lounge room.",
-                color=0xE74C3C,
-            )
-            await update(interaction, embed=embed, ephemeral=True)
-            return
-
-        if not room.check_match():
-            await update(
-                interaction,
-                embed=Embed(
-                    title="Command Disabled",
-                    description="This command only works if a debate room has a current topic.",
+        async with room_turn(self.bot, room, interaction):
+            if room.lounge:
+                embed = Embed(
+                    title="Command Unauthorized",
+                    description=f"You cannot use this command in a lounge room.",
                     color=0xE74C3C,
-                ),
-                ephemeral=True,
-            )
-            return
+                )
+                await update(interaction, embed=embed, ephemeral=True)
+                return
 
-        if room.match:
-            if room.match.concluding:
+            if not room.check_match():
                 await update(
                     interaction,
                     embed=Embed(
-                        title="Command Temporarily Disabled",
-                        description="This command only works once the debate match has finished concluding.",
+                        title="Command Disabled",
+                        description="This command only works if a debate room has a current topic.",
                         color=0xE74C3C,
                     ),
                     ephemeral=True,
                 )
+                return
 
-        await interaction.response.defer()
+            await defer(interaction)
 
-        result = room.vote_topic(voter=interaction.user, candidate=candidate)
+            result = room.vote_topic(voter=interaction.user, candidate=candidate)
 
-        if not result:
-            embed = Embed(
-                title="Topic Author Not Found",
-                description="No topic was authored by the given user.",
-                color=0xE74C3C,
-            )
-            await update(interaction, embed=embed, ephemeral=True)
-            return
+            if not result:
+                embed = Embed(
+                    title="Topic Author Not Found",
+                    description="No topic was authored by the given user.",
+                    color=0xE74C3C,
+                )
+                await update(interaction, embed=embed, ephemeral=True)
+                return
 
-        room.updating_topic = True
-        await update_topic(self.bot, room)
-        room.updating_topic = False
+            await update_topic(self.bot, room)
 
-        embed = Embed(
-            title="Topic Vote Successfully Cast",
-            description="Your vote for that user's topic has been registered.",
-            color=0x2ECC71,
-        )
-        await update(interaction, embed=embed)
+            embed = Embed(
+                title="Topic Vote Successfully Cast",
+                description="Your vote for that user's topic has been registered.",
+                color=0x2ECC71,
+            )
+            await update(interaction, embed=embed)
 
     @app_commands.command(
         name="view",
@@ -716,55 +672,45 @@ class Topic(
         room_number = get_room_number(self.bot, channel)
         room: typing.Optional[DebateRoom] = get_room(self.bot, room_number)
 
-        if room.updating_topic:
-            await update(
-                interaction,
-                embed=Embed(
-                    title="Command Temporarily Disabled",
-                    description="This command only works once the topic has finished updating.",
+        async with room_turn(self.bot, room, interaction):
+            if room.lounge:
+                embed = Embed(
+                    title="Command Unauthorized",
+                    description=f"You cannot use this command in a lounge room.",
                     color=0xE74C3C,
-                ),
-                errored=True,
-                ephemeral=True,
-            )
-            return
+                )
+                await update(interaction, embed=embed, ephemeral=True)
+                return
+
+            if not member:
+                member = interaction.user
+
+            for topic in room.topics:
+                if member == topic.author:
+                    embed = Embed(
+                        title="Member Topic",
+                        color=0xEC6A5C,
+                    )
+                    if topic.prioritized:
+                        embed.add_field(
+                            name="Topic [Prioritized]", value=f"{str(topic)}"
+                        )
+                    else:
+                        embed.add_field(name="Topic", value=f"{str(topic)}")
+                    avatar_url = None
+                    if member.avatar:
+                        avatar_url = member.avatar.url
+                    embed.add_field(name="Votes", value=f"{str(topic.votes)}")
+                    embed.set_footer(text=f"{member.display_name}", icon_url=avatar_url)
+                    await update(interaction, embed=embed, ephemeral=True)
+                    return
 
-        if room.lounge:
             embed = Embed(
-                title="Command Unauthorized",
-                description=f"You cannot use this command in a lounge room.",
+                title="Topic Author Not Found",
+                description="No topic was authored by the given user.",
                 color=0xE74C3C,
             )
             await update(interaction, embed=embed, ephemeral=True)
-            return
-
-        if not member:
-            member = interaction.user
-
-        for topic in room.topics:
-            if member == topic.author:
-                embed = Embed(
-                    title="Member Topic",
-                    color=0xEC6A5C,
-                )
-                if topic.prioritized:
-                    embed.add_field(name="Topic [Prioritized]", value=f"{str(topic)}")
-                else:
-                    embed.add_field(name="Topic", value=f"{str(topic)}")
-                avatar_url = None
-                if member.avatar:
-                    avatar_url = member.avatar.url
-                embed.add_field(name="Votes", value=f"{str(topic.votes)}")
-                embed.set_footer(text=f"{member.display_name}", icon_url=avatar_url)
-                await update(interaction, embed=embed, ephemeral=True)
-                return
-
-        embed = Embed(
-            title="Topic Author Not Found",
-            description="No topic was authored by the given user.",
-            color=0xE74C3C,
-        )
-        await update(interaction, embed=embed, ephemeral=True)
 
     @app_commands.command(
         name="remove",
@@ -784,107 +730,96 @@ class Topic(
         room_number = get_room_number(self.bot, channel)
         room: typing.Optional[DebateRoom] = get_room(self.bot, room_number)
 
-        if room.lounge:
-            embed = Embed(
-                title="Command Unauthorized",
-                description=f"You cannot use this command in a lounge room.",
-                color=0xE74C3C,
-            )
-            await update(interaction, embed=embed, ephemeral=True)
-            return
-
-        if not room.check_match():
-            await update(
-                interaction,
-                embed=Embed(
-                    title="Command Disabled",
-                    description="This command only works if a debate room has a current topic.",
+        async with room_turn(self.bot, room, interaction):
+            if room.lounge:
+                embed = Embed(
+                    title="Command Unauthorized",
+                    description=f"You cannot use this command in a lounge room.",
                     color=0xE74C3C,
-                ),
-                ephemeral=True,
-            )
-            return
+                )
+                await update(interaction, embed=embed, ephemeral=True)
+                return
 
-        if room.match:
-            if room.match.concluding:
+            if not room.check_match():
                 await update(
                     interaction,
                     embed=Embed(
-                        title="Command Temporarily Disabled",
-                        description="This command only works once the debate match has finished concluding.",
+                        title="Command Disabled",
+                        description="This command only works if a debate room has a current topic.",
                         color=0xE74C3C,
                     ),
                     ephemeral=True,
                 )
                 return
 
-        await interaction.response.defer()
+            await defer(interaction)
 
-        if member:
-            if member.bot:
-                embed = Embed(
-                    title=f"Incorrect User Type",
-                    description="Please run this command against a user that is not a bot.",
-                    color=0xE74C3C,
-                )
-                await update(interaction, embed=embed, ephemeral=True)
-                return
-            topic = room.topic_from_member(member)
-            if topic:
-                room.remove_topic(member)
+            if member:
+                if member.bot:
+                    embed = Embed(
+                        title=f"Incorrect User Type",
+                        description="Please run this command against a user that is not a bot.",
+                        color=0xE74C3C,
+                    )
+                    await update(interaction, embed=embed, ephemeral=True)
+                    return
+                topic = room.topic_from_member(member)
+                if topic:
+                    room.remove_topic(member)
+                else:
+                    embed = Embed(
+                        title=f"Topic Author Not Found",
+                        description="Please run this command against a user that has created a topic.",
+                        color=0xE74C3C,
+                    )
+                    await update(interaction, embed=embed, ephemeral=True)
+                    return
+            else:
+                topic = room.current_topic
+                room.remove_topic(room.current_topic.author)
+
+            if room.match:
+                if topic == room.match.topic:
+                    await mute_members(self.bot, room.vc.members, mute=True)
             else:
                 embed = Embed(
-                    title=f"Topic Author Not Found",
-                    description="Please run this command against a user that has created a topic.",
+                    title=f"No Topic Found",
+                    description="Please run this command when there is a topic in the room.",
                     color=0xE74C3C,
                 )
                 await update(interaction, embed=embed, ephemeral=True)
                 return
-        else:
-            topic = room.current_topic
-            room.remove_topic(room.current_topic.author)
 
-        if room.match:
-            if topic == room.match.topic:
-                for current_member in room.vc.members:
-                    await current_member.edit(mute=True)
-        else:
+            room.match = None  # Clear match
+            await update_topic(self.bot, room)
+
+            if room.private:
+                if room.current_topic:
+                    await mute_members(self.bot, room.vc.members, mute=True)
+                else:
+                    await mute_members(
+                        self.bot,
+                        [
+                            member
+                            for member in room.vc.members
+                            if member not in room.private_debaters
+                        ],
+                    )
+
             embed = Embed(
-                title=f"No Topic Found",
-                description="Please run this command when there is a topic in the room.",
-                color=0xE74C3C,
+                title="Topic Successfully Removed",
+                description="The topic you selected has been removed.",
+                color=0x2ECC71,
             )
             await update(interaction, embed=embed, ephemeral=True)
-            return
-
-        room.match = None  # Clear match
-        room.updating_topic = True
-        await update_topic(self.bot, room)
-
-        if room.private:
-            if room.current_topic:
-                for member in room.vc.members:
-                    await member.edit(mute=True)
-            else:
-                for member in room.vc.members:
-                    if member not in room.private_debaters:
-                        await member.edit(mute=True)
-
-        room.updating_topic = False
-
-        embed = Embed(
-            title="Topic Successfully Removed",
-            description="The topic you selected has been removed.",
-            color=0x2ECC71,
-        )
-        await update(interaction, embed=embed, ephemeral=True)
 
 
 class Debate(commands.Cog):
     def __init__(self, bot: ArgusClient) -> None:
         self.bot = bot
-        self.studio_task: Optional[Task] = None
-        self.lounge_task: Optional[Task] = None
+        timers: RoomTimers = bot.state["room_timers"]
+        timers.register("studio", self.studio_expire)
+        timers.register("lounge", self.lounge_expire)
         self.lfd_last_run = None
         super().__init__()
 
@@ -930,27 +865,11 @@ class Debate(commands.Cog):
         if not await in_debate_room(self.bot, interaction):
             return
 
-        channel = interaction.channel
-        room_number = get_room_number(self.bot, channel)
-        room: typing.Optional[DebateRoom] = get_room(self.bot, room_number)
         author = interaction.user
 
-        if room.match:
-            if room.match.concluding:
-                await update(
-                    interaction,
-                    embed=Embed(
-                        title="Command Temporarily Disabled",
-                        description="This command only works once the debate match has finished concluding.",
-                        color=0xE74C3C,
-                    ),
-                    ephemeral=True,
-                )
-                return
-
-        if self.lfd_last_run:
-            if datetime.now() > self.lfd_last_run + timedelta(hours=1):
-                self.lfd_last_run = datetime.now()
+        if self.lfd_last_run:
+            if datetime.now() > self.lfd_last_run + timedelta(hours=1):
+                self.lfd_last_run = datetime.now()
                 await update(
                     interaction,
                     content=f"🎙️ @here {author.mention} is looking for a debate! 🎙️",
@@ -990,84 +909,61 @@ class Debate(commands.Cog):
         room: typing.Optional[DebateRoom] = get_room(self.bot, room_number)
         author = interaction.user
 
-        if room.updating_topic:
-            await update(
-                interaction,
-                embed=Embed(
-                    title="Command Temporarily Disabled",
-                    description="This command only works once the topic has finished updating.",
-                    color=0xE74C3C,
-                ),
-                ephemeral=True,
-            )
-            return
-
-        if room.lounge:
-            embed = Embed(
-                title="Command Unauthorized",
-                description=f"You cannot use this command in a lounge room.",
-                color=0xE74C3C,
-            )
-            await update(interaction, embed=embed, ephemeral=True)
-            return
-
-        if not room.check_match():
-            await update(
-                interaction,
-                embed=Embed(
-                    title="Command Disabled",
-                    description="This command only works if a debate room has a current topic.",
+        async with room_turn(self.bot, room, interaction):
+            if room.lounge:
+                embed = Embed(
+                    title="Command Unauthorized",
+                    description=f"You cannot use this command in a lounge room.",
                     color=0xE74C3C,
-                ),
-                ephemeral=True,
-            )
-            return
+                )
+                await update(interaction, embed=embed, ephemeral=True)
+                return
 
-        if room.match:
-            if room.match.concluding:
+            if not room.check_match():
                 await update(
                     interaction,
                     embed=Embed(
-                        title="Command Temporarily Disabled",
-                        description="This command only works once the debate match has finished concluding.",
+                        title="Command Disabled",
+                        description="This command only works if a debate room has a current topic.",
                         color=0xE74C3C,
                     ),
                     ephemeral=True,
                 )
+                return
 
-        if room.match.check_participant(author):
-            participant = room.match.get_participant(author)
-            if participant.against:
-                embed = Embed(
-                    title="Stance Already Set",
-                    description="You are already against the topic.",
-                    color=0xF1C40F,
-                )
-            else:
-                embed = Embed(
-                    title="Stance Already Set",
-                    description="You are already for the topic.",
-                    color=0xF1C40F,
-                )
-            await update(interaction, embed=embed, ephemeral=True)
-            return
+            if room.match.check_participant(author):
+                participant = room.match.get_participant(author)
+                if participant.against:
+                    embed = Embed(
+                        title="Stance Already Set",
+                        description="You are already against the topic.",
+                        color=0xF1C40F,
+                    )
+                else:
+                    embed = Embed(
+                        title="Stance Already Set",
+                        description="You are already for the topic.",
+                        color=0xF1C40F,
+                    )
+                await update(interaction, embed=embed, ephemeral=True)
+                return
 
-        packed_data = await insert_skill(self.bot, interaction, author)
-        mu = packed_data["mu"]
-        sigma = packed_data["sigma"]
+            packed_data = await insert_skill(self.bot, interaction, author)
+            mu = packed_data["mu"]
+            sigma = packed_data["sigma"]
 
-        room.match.add_for(
-            DebateParticipant(
-                member=author, mu=mu, sigma=sigma, session_start=datetime.utcnow()
+            room.match.add_for(
+                DebateParticipant(
+                    member=author, mu=mu, sigma=sigma, session_start=datetime.utcnow()
+                )
             )
-        )
 
-        embed = Embed(
-            title="Stance Successfully Set",
-            description="You are __for__ the topic.",
-            color=0x2ECC71,
-        )
-        await update(interaction, embed=embed)
+            embed = Embed(
+                title="Stance Successfully Set",
+                description="You are __for__ the topic.",
+                color=0x2ECC71,
+            )
+            await update(interaction, embed=embed)
 
     @app_commands.command(
         name="against",
@@ -1083,85 +979,61 @@ class Debate(commands.Cog):
         room: typing.Optional[DebateRoom] = get_room(self.bot, room_number)
         author = interaction.user
 
-        if room.updating_topic:
-            await update(
-                interaction,
-                embed=Embed(
-                    title="Command Temporarily Disabled",
-                    description="This command only works once the topic has finished updating.",
-                    color=0xE74C3C,
-                ),
-                errored=True,
-                ephemeral=True,
-            )
-            return
-
-        if room.lounge:
-            embed = Embed(
-                title="Command Unauthorized",
-                description=f"You cannot use this command in a lounge room.",
-                color=0xE74C3C,
-            )
-            await update(interaction, embed=embed, ephemeral=True)
-            return
-
-        if not room.check_match():
-            await update(
-                interaction,
-                embed=Embed(
-                    title="Command Disabled",
-                    description="This command only works if a debate room has a current topic.",
+        async with room_turn(self.bot, room, interaction):
+            if room.lounge:
+                embed = Embed(
+                    title="Command Unauthorized",
+                    description=f"You cannot use this command in a lounge room.",
                     color=0xE74C3C,
-                ),
-                ephemeral=True,
-            )
-            return
+                )
+                await update(interaction, embed=embed, ephemeral=True)
+                return
 
-        if room.match:
-            if room.match.concluding:
+            if not room.check_match():
                 await update(
                     interaction,
                     embed=Embed(
-                        title="Command Temporarily Disabled",
-                        description="This command only works once the debate match has finished concluding.",
+                        title="Command Disabled",
+                        description="This command only works if a debate room has a current topic.",
                         color=0xE74C3C,
                     ),
                     ephemeral=True,
                 )
+                return
 
-        if room.match.check_participant(author):
-            participant = room.match.get_participant(author)
-            if participant.against:
-                embed = Embed(
-                    title="Stance Already Set",
-                    description="You are already against the topic.",
-                    color=0xF1C40F,
-                )
-            else:
-                embed = Embed(
-                    title="Stance Already Set",
-                    description="You are already for the topic.",
-                    color=0xF1C40F,
-                )
-            await update(interaction, embed=embed, ephemeral=True)
-            return
+            if room.match.check_participant(author):
+                participant = room.match.get_participant(author)
+                if participant.against:
+                    embed = Embed(
+                        title="Stance Already Set",
+                        description="You are already against the topic.",
+                        color=0xF1C40F,
+                    )
+                else:
+                    embed = Embed(
+                        title="Stance Already Set",
+                        description="You are already for the topic.",
+                        color=0xF1C40F,
+                    )
+                await update(interaction, embed=embed, ephemeral=True)
+                return
 
-        packed_data = await insert_skill(self.bot, interaction, author)
-        mu = packed_data["mu"]
-        sigma = packed_data["sigma"]
+            packed_data = await insert_skill(self.bot, interaction, author)
+            mu = packed_data["mu"]
+            sigma = packed_data["sigma"]
 
-        room.match.add_against(
-            DebateParticipant(
-                member=author, mu=mu, sigma=sigma, session_start=datetime.utcnow()
+            room.match.add_against(
+                DebateParticipant(
+                    member=author, mu=mu, sigma=sigma, session_start=datetime.utcnow()
+                )
             )
-        )
 
-        embed = Embed(
-            title="Stance Successfully Set",
-            description="You are __against__ the topic.",
-            color=0x2ECC71,
-        )
-        await update(interaction, embed=embed)
+            embed = Embed(
+                title="Stance Successfully Set",
+                description="You are __against__ the topic.",
+                color=0x2ECC71,
+            )
+            await update(interaction, embed=embed)
 
     @app_commands.command(
         name="debate", description="Start or join a debate after you've set a stance."
@@ -1180,106 +1052,80 @@ class Debate(commands.Cog):
         room: typing.Optional[DebateRoom] = get_room(self.bot, room_number)
         author = interaction.user
 
-        if room.updating_topic:
-            await update(
-                interaction,
-                embed=Embed(
-                    title="Command Temporarily Disabled",
-                    description="This command only works once the topic has finished updating.",
-                    color=0xE74C3C,
-                ),
-                errored=True,
-                ephemeral=True,
-            )
-            return
-
-        if room.lounge:
-            embed = Embed(
-                title="Command Unauthorized",
-                description=f"You cannot use this command in a lounge room.",
-                color=0xE74C3C,
-            )
-            await update(interaction, embed=embed, ephemeral=True)
-            return
-
-        if not room.check_match():
-            await update(
-                interaction,
-                embed=Embed(
-                    title="Command Disabled",
-                    description="This command only works if a debate room has a current topic.",
+        async with room_turn(self.bot, room, interaction):
+            if room.lounge:
+                embed = Embed(
+                    title="Command Unauthorized",
+                    description=f"You cannot use this command in a lounge room.",
                     color=0xE74C3C,
-                ),
-                ephemeral=True,
-            )
-            return
+                )
+                await update(interaction, embed=embed, ephemeral=True)
+                return
 
-        if room.match:
-            if room.match.concluding:
+            if not room.check_match():
                 await update(
                     interaction,
                     embed=Embed(
-                        title="Command Temporarily Disabled",
-                        description="This command only works once the debate match has finished concluding.",
+                        title="Command Disabled",
+                        description="This command only works if a debate room has a current topic.",
                         color=0xE74C3C,
                     ),
                     ephemeral=True,
                 )
+                return
 
-        if check_debater_in_any_room(
-            bot=self.bot, interaction=interaction, room=room, member=author
-        ):
-            debater_room = get_debater_room(
-                bot=self.bot, interaction=interaction, member=author
-            )
-            embed = Embed(
-                title="You are not allowed to start multiple debates simultaneously.",
-                description=f"Please wait till your existing debate in __Debate {debater_room.number}__ is finished.",
-                color=0xF1C40F,
-            )
-            await update(interaction, embed=embed, ephemeral=True)
-            return
+            if check_debater_in_any_room(
+                bot=self.bot, interaction=interaction, room=room, member=author
+            ):
+                debater_room = get_debater_room(
+                    bot=self.bot, interaction=interaction, member=author
+                )
+                embed = Embed(
+                    title="You are not allowed to start multiple debates simultaneously.",
+                    description=f"Please wait till your existing debate in __Debate {debater_room.number}__ is finished.",
+                    color=0xF1C40F,
+                )
+                await update(interaction, embed=embed, ephemeral=True)
+                return
 
-        if room.match.check_debater(author):
-            embed = Embed(
-                title="Command Disabled",
-                description="You are already a debater.",
-                color=0xE74C3C,
-            )
-            await update(interaction, embed=embed, ephemeral=True)
-            return
+            if room.match.check_debater(author):
+                embed = Embed(
+                    title="Command Disabled",
+                    description="You are already a debater.",
+                    color=0xE74C3C,
+                )
+                await update(interaction, embed=embed, ephemeral=True)
+                return
 
-        if not room.match.check_participant(author):
-            embed = Embed(
-                title="You must choose a position on the topic before "
-                "you can debate.",
-                description="`/for` - For the topic.\n\n"
-                "`/against` - Against the topic.",
-                color=0xF1C40F,
-            )
-            await update(interaction, embed=embed, ephemeral=True)
-            return
+            if not room.match.check_participant(author):
+                embed = Embed(
+                    title="You must choose a position on the topic before "
+                    "you can debate.",
+                    description="`/for` - For the topic.\n\n"
+                    "`/against` - Against the topic.",
+                    color=0xF1C40F,
+                )
+                await update(interaction, embed=embed, ephemeral=True)
+                return
 
-        current_session_start = datetime.utcnow()
-        for participant in room.match.participants:
-            participant.session_start = current_session_start
+            current_session_start = datetime.utcnow()
+            for participant in room.match.participants:
+                participant.session_start = current_session_start
 
-        room.match.add_debater(author)
+            room.match.add_debater(author)
 
-        await author.edit(mute=False)
+            await author.edit(mute=False)
 
-        debater_data = await self.bot.engine.find_one(
-            MemberModel, MemberModel.member == interaction.user.id
-        )
-        debater_data.debate_count += 1
-        await self.bot.engine.save(debater_data)
+            await self.bot.db.increment_fields(
+                MemberModel, {"member": interaction.user.id}, debate_count=1
+            )
 
-        embed = Embed(
-            title="You are now a debater on the topic.",
-            description="Your skill rating is at risk. Be mindful of what you say.",
-            color=0x2ECC71,
-        )
-        await update(interaction, embed=embed)
+            embed = Embed(
+                title="You are now a debater on the topic.",
+                description="Your skill rating is at risk. Be mindful of what you say.",
+                color=0x2ECC71,
+            )
+            await update(interaction, embed=embed)
 
     @app_commands.command(name="vote", description="Vote for you think won the debate")
     async def debate_vote(
@@ -1295,19 +1141,6 @@ class Debate(commands.Cog):
         author = interaction.user
         candidate = debater
 
-        if room.updating_topic:
-            await update(
-                interaction,
-                embed=Embed(
-                    title="Command Temporarily Disabled",
-                    description="This command only works once the topic has finished updating.",
-                    color=0xE74C3C,
-                ),
-                errored=True,
-                ephemeral=True,
-            )
-            return
-
         if room.lounge:
             embed = Embed(
                 title="Command Unauthorized",
@@ -1329,18 +1162,6 @@ class Debate(commands.Cog):
             )
             return
 
-        if room.match:
-            if room.match.concluding:
-                await update(
-                    interaction,
-                    embed=Embed(
-                        title="Command Temporarily Disabled",
-                        description="This command only works once the debate match has finished concluding.",
-                        color=0xE74C3C,
-                    ),
-                    ephemeral=True,
-                )
-
         if candidate == author:
             embed = Embed(
                 title="Invalid Candidate",
@@ -1395,66 +1216,41 @@ class Debate(commands.Cog):
         room_number = get_room_number(self.bot, channel)
         room: typing.Optional[DebateRoom] = get_room(self.bot, room_number)
 
-        if room.updating_topic:
-            await update(
-                interaction,
-                embed=Embed(
-                    title="Command Temporarily Disabled",
-                    description="This command only works once the topic has finished updating.",
+        async with room_turn(self.bot, room, interaction):
+            if room.lounge:
+                embed = Embed(
+                    title="Command Unauthorized",
+                    description=f"You cannot use this command in a lounge room.",
                     color=0xE74C3C,
-                ),
-                errored=True,
-                ephemeral=True,
-            )
-            return
+                )
+                await update(interaction, embed=embed, ephemeral=True)
+                return
 
-        if room.lounge:
-            embed = Embed(
-                title="Command Unauthorized",
-                description=f"You cannot use this command in a lounge room.",
-                color=0xE74C3C,
-            )
-            await update(interaction, embed=embed, ephemeral=True)
-            return
+            if room.private:
+                embed = Embed(
+                    title="Room Private Already",
+                    description="This room is already private.",
+                    color=0xF1C40F,
+                )
+                await update(interaction, embed=embed, ephemeral=True)
+                return
 
-        if room.match:
-            if room.match.concluding:
-                await update(
-                    interaction,
-                    embed=Embed(
-                        title="Command Temporarily Disabled",
-                        description="This command only works once the debate match has finished concluding.",
-                        color=0xE74C3C,
-                    ),
-                    ephemeral=True,
-                )
+            room.private = True
 
-        if room.private:
-            embed = Embed(
-                title="Room Private Already",
-                description="This room is already private.",
-                color=0xF1C40F,
-            )
-            await update(interaction, embed=embed, ephemeral=True)
-            return
-
-        room.private = True
+            await mute_members(self.bot, room.vc.members, mute=True)
 
-        for member in room.vc.members:
-            await member.edit(mute=True)
-
-        if room.match:
-            room.match = None
-        room.purge_topics()
-        room.private_debaters = []
+            if room.match:
+                room.match = None
+            room.purge_topics()
+            room.private_debaters = []
 
-        await update_im(bot=self.bot, room_num=room.number)
-        embed = Embed(
-            title="Room Converted",
-            description="This room is now private.",
-            color=0x2ECC71,
-        )
-        await update(interaction, embed=embed)
+            await update_im(bot=self.bot, room_num=room.number)
+            embed = Embed(
+                title="Room Converted",
+                description="This room is now private.",
+                color=0x2ECC71,
+            )
+            await update(interaction, embed=embed)
 
     @app_commands.command(
         name="public", description="Convert a private debate into a public one."
@@ -1471,66 +1267,41 @@ class Debate(commands.Cog):
         room_number = get_room_number(self.bot, channel)
         room: typing.Optional[DebateRoom] = get_room(self.bot, room_number)
 
-        if room.updating_topic:
-            await update(
-                interaction,
-                embed=Embed(
-                    title="Command Temporarily Disabled",
-                    description="This command only works once the topic has finished updating.",
+        async with room_turn(self.bot, room, interaction):
+            if room.lounge:
+                embed = Embed(
+                    title="Command Unauthorized",
+                    description=f"You cannot use this command in a lounge room.",
                     color=0xE74C3C,
-                ),
-                errored=True,
-                ephemeral=True,
-            )
-            return
-
-        if room.lounge:
-            embed = Embed(
-                title="Command Unauthorized",
-                description=f"You cannot use this command in a lounge room.",
-                color=0xE74C3C,
-            )
-            await update(interaction, embed=embed, ephemeral=True)
-            return
-
-        if room.match:
-            if room.match.concluding:
-                await update(
-                    interaction,
-                    embed=Embed(
-                        title="Command Temporarily Disabled",
-                        description="This command only works once the debate match has finished concluding.",
-                        color=0xE74C3C,
-                    ),
-                    ephemeral=True,
                 )
+                await update(interaction, embed=embed, ephemeral=True)
+                return
 
-        if room.private:
-            room.private = False
-        else:
-            embed = Embed(
-                title="Room Public Already",
-                description="This room is already public.",
-                color=0xF1C40F,
-            )
-            await update(interaction, embed=embed, ephemeral=True)
-            return
+            if room.private:
+                room.private = False
+            else:
+                embed = Embed(
+                    title="Room Public Already",
+                    description="This room is already public.",
+                    color=0xF1C40F,
+                )
+                await update(interaction, embed=embed, ephemeral=True)
+                return
 
-        for member in room.vc.members:
-            await member.edit(mute=False)
+            await mute_members(self.bot, room.vc.members, mute=False)
 
-        if room.match:
-            room.match = None
-        room.purge_topics()
-        room.private_debaters = []
+            if room.match:
+                room.match = None
+            room.purge_topics()
+            room.private_debaters = []
 
-        await update_im(bot=self.bot, room_num=room.number)
-        embed = Embed(
-            title="Room Converted",
-            description="This room is now public.",
-            color=0x2ECC71,
-        )
-        await update(interaction, embed=embed)
+            await update_im(bot=self.bot, room_num=room.number)
+            embed = Embed(
+                title="Room Converted",
+                description="This room is now public.",
+                color=0x2ECC71,
+            )
+            await update(interaction, embed=embed)
 
     @app_commands.command(
         name="unlock",
@@ -1551,75 +1322,53 @@ class Debate(commands.Cog):
         room: typing.Optional[DebateRoom] = get_room(self.bot, room_number)
         unlocked_member = participant
 
-        if room.updating_topic:
-            await update(
-                interaction,
-                embed=Embed(
-                    title="Command Temporarily Disabled",
-                    description="This command only works once the topic has finished updating.",
+        async with room_turn(self.bot, room, interaction):
+            if room.lounge:
+                embed = Embed(
+                    title="Command Unauthorized",
+                    description=f"You cannot use this command in a lounge room.",
                     color=0xE74C3C,
-                ),
-                errored=True,
-                ephemeral=True,
-            )
-            return
-
-        if room.lounge:
-            embed = Embed(
-                title="Command Unauthorized",
-                description=f"You cannot use this command in a lounge room.",
-                color=0xE74C3C,
-            )
-            await update(interaction, embed=embed, ephemeral=True)
-            return
-
-        if room.match:
-            if room.match.concluding:
-                await update(
-                    interaction,
-                    embed=Embed(
-                        title="Command Temporarily Disabled",
-                        description="This command only works once the debate match has finished concluding.",
-                        color=0xE74C3C,
-                    ),
-                    ephemeral=True,
                 )
+                await update(interaction, embed=embed, ephemeral=True)
+                return
 
-        if not room.private:
-            embed = Embed(
-                title="Command Unauthorized",
-                description="You can only unlock members in a private room.",
-                color=0xE74C3C,
-            )
-            await update(interaction, embed=embed, ephemeral=True)
-            return
+            if not room.private:
+                embed = Embed(
+                    title="Command Unauthorized",
+                    description="You can only unlock members in a private room.",
+                    color=0xE74C3C,
+                )
+                await update(interaction, embed=embed, ephemeral=True)
+                return
 
-        if unlocked_member in [_ for _ in room.private_debaters]:
-            embed = Embed(
-                title="Participant Already Unlocked",
-                description="This member is already unlocked in this room.",
-                color=0xF1C40F,
-            )
-            await update(interaction, embed=embed, ephemeral=True)
-        else:
-            if unlocked_member in room.vc.members:
-                room.private_debaters.append(unlocked_member)
-                if room.match:
-                    await unlocked_member.edit(mute=True)
-                else:
-                    if room.current_topic:
-                        await unlocked_member.edit(mute=False)
+            if unlocked_member in [_ for _ in room.private_debaters]:
+                embed = Embed(
+                    title="Participant Already Unlocked",
+                    description="This member is already unlocked in this room.",
+                    color=0xF1C40F,
+                )
+                await update(interaction, embed=embed, ephemeral=True)
+            else:
+                if unlocked_member in room.vc.members:
+                    room.private_debaters.append(unlocked_member)
+                    if room.match:
+                        await unlocked_member.edit(mute=True)
+                    else:
+                        if room.current_topic:
+                            await unlocked_member.edit(mute=False)
 
-            embed = Embed(
-                title="Participant Unlocked",
-                description=f"{participant.mention} is now allowed to debate in the room.",
-                color=0x2ECC71,
-            )
-            avatar_url = None
-            if unlocked_member.avatar:
-                avatar_url = unlocked_member.avatar.url
-            embed.set_author(name=f"{unlocked_member.username}", icon_url=avatar_url)
-            await update(interaction, embed=embed)
+                embed = Embed(
+                    title="Participant Unlocked",
+                    description=f"{participant.mention} is now allowed to debate in the room.",
+                    color=0x2ECC71,
+                )
+                avatar_url = None
+                if unlocked_member.avatar:
+                    avatar_url = unlocked_member.avatar.url
+                embed.set_author(
+                    name=f"{unlocked_member.username}", icon_url=avatar_url
+                )
+                await update(interaction, embed=embed)
 
     @app_commands.command(
         name="conclude",
@@ -1634,233 +1383,187 @@ class Debate(commands.Cog):
         room_number = get_room_number(self.bot, channel)
         room: typing.Optional[DebateRoom] = get_room(self.bot, room_number)
 
-        if room.updating_topic:
-            await update(
-                interaction,
-                embed=Embed(
-                    title="Command Temporarily Disabled",
-                    description="This command only works once the topic has finished updating.",
-                    color=0xE74C3C,
-                ),
-                ephemeral=True,
-            )
-            return
-
-        if room.lounge:
-            embed = Embed(
-                title="Command Unauthorized",
-                description=f"You cannot use this command in a lounge room.",
-                color=0xE74C3C,
-            )
-            await update(interaction, embed=embed, ephemeral=True)
-            return
-
-        if not room.check_match():
-            await update(
-                interaction,
-                embed=Embed(
-                    title="Command Disabled",
-                    description="This command only works if a debate room has a current topic.",
+        async with room_turn(self.bot, room, interaction):
+            if room.lounge:
+                embed = Embed(
+                    title="Command Unauthorized",
+                    description=f"You cannot use this command in a lounge room.",
                     color=0xE74C3C,
-                ),
-                ephemeral=True,
-            )
-            return
+                )
+                await update(interaction, embed=embed, ephemeral=True)
+                return
 
-        if room.match:
-            if room.match.concluding:
+            if not room.check_match():
                 await update(
                     interaction,
                     embed=Embed(
-                        title="Command Temporarily Disabled",
-                        description="This command only works once the debate match has finished concluding.",
+                        title="Command Disabled",
+                        description="This command only works if a debate room has a current topic.",
                         color=0xE74C3C,
                     ),
                     ephemeral=True,
                 )
+                return
 
-        debaters, concluded, voters = room.vote_conclude(voter=interaction.user)
-        if concluded is None:
-            embed = Embed(
-                title="Already Concluding",
-                description="The debate is already concluding.",
-                color=0xF1C40F,
-            )
-            await update(interaction, embed=embed, ephemeral=True)
-            return
-        else:
-            embed = Embed(
-                title="Conclude Vote Cast",
-                description="You have voted to conclude the debate.",
-                color=0xEC6A5C,
-            )
-            await update(interaction, embed=embed)
+            debaters, concluded, voters = room.vote_conclude(voter=interaction.user)
+            if concluded is None:
+                embed = Embed(
+                    title="Already Concluding",
+                    description="The debate is already concluding.",
+                    color=0xF1C40F,
+                )
+                await update(interaction, embed=embed, ephemeral=True)
+                return
+            else:
+                embed = Embed(
+                    title="Conclude Vote Cast",
+                    description="You have voted to conclude the debate.",
+                    color=0xEC6A5C,
+                )
+                await update(interaction, embed=embed)
 
-        if concluded:
-            room.match.concluding = True
-            embed = Embed(
-                title="Debate Concluding",
-                description="Ratings are being updated. Debate specific commands will not run.",
-                color=0xE67E22,
-            )
-            await room.vc.send(embed=embed)
+            if concluded:
+                room.match.concluding = True
+                embed = Embed(
+                    title="Debate Concluding",
+                    description="Ratings are being updated. Debate specific commands will not run.",
+                    color=0xE67E22,
+                )
+                await room.vc.send(embed=embed)
 
-            if room.match:
-                for debater in debaters:
-                    # Mute
-                    if debater.member in room.vc.members:
-                        await debater.member.edit(mute=True)
-            else:
-                if room.private:
-                    for member in room.private_debaters:
-                        await member.edit(mute=False)
+                if room.match:
+                    await mute_members(
+                        self.bot,
+                        [debater.member for debater in debaters],
+                        channel=room.vc,
+                    )
                 else:
-                    for member in room.vc.members:
-                        await member.edit(mute=False)
+                    if room.private:
+                        await mute_members(self.bot, room.private_debaters, mute=False)
+                    else:
+                        await mute_members(self.bot, room.vc.members, mute=False)
 
-            if room.match:
-                if room.match.check_voters():
-                    for debater in debaters:
-                        debater_rating = float(
-                            20 * ((debater.mu_post - 3 * debater.sigma_post) + 25)
-                        )
-                        debater_data = await self.bot.engine.find_one(
-                            MemberModel, MemberModel.member == debater.member.id
-                        )
-                        debater_data.mu = debater.mu_post
-                        debater_data.sigma = debater.sigma_post
-                        debater_data.rating = debater_rating
-
-                        await self.bot.engine.save(debater_data)
-
-                        avatar_url = None
-                        if debater.member.avatar:
-                            avatar_url = debater.member.avatar.url
-                        embed = Embed(title="Rating Change", color=0xEC6A5C)
-                        embed.set_footer(
-                            text=debater.member.display_name,
-                            icon_url=avatar_url,
-                        )
-                        embed.add_field(
-                            name="Mean",
-                            value=f"```diff\n"
-                            f"- {float(debater.mu_pre): .2f}\n"
-                            f"+ {float(debater.mu_post): .2f}\n"
-                            f"```",
-                            inline=True,
-                        )
-                        embed.add_field(
-                            name="Confidence",
-                            value=f"```diff\n"
-                            f"- {float(debater.sigma_pre): .2f}\n"
-                            f"+ {float(debater.sigma_post): .2f}\n"
-                            f"```",
-                            inline=True,
-                        )
-                        embed.add_field(
-                            name="Rating",
-                            value=f"```diff\n"
-                            f"- {float(20 * ((debater.mu_pre - 3 * debater.sigma_pre) + 25)): .2f}\n"
-                            f"+ {float(20 * ((debater.mu_post - 3 * debater.sigma_post) + 25)): .2f}\n"
-                            f"```",
-                            inline=True,
+                if room.match:
+                    if room.match.session_end:
+                        await record_match(
+                            self.bot, room, rated=bool(room.match.check_voters())
                         )
+                    if room.match.check_voters():
+                        await self.bot.state["member_counters"].flush()
+                        await save_ratings(self.bot, debaters)
 
-                        fifo: Queue = self.bot.state["debate_feed_fifo"]
-                        fifo.put(embed)
-
-                        # Update Roles
-                        floored_rating = floor_rating(
-                            float(
+                        for debater in debaters:
+                            debater_rating = float(
                                 20 * ((debater.mu_post - 3 * debater.sigma_post) + 25)
                             )
-                        )
-                        rank_role: Optional[Role] = None
-                        for rank, rating in RANK_RATING_MAP.items():
-                            if math.isclose(floored_rating, rating, rel_tol=1e-04):
-                                rank_role = self.bot.state["map_roles"][rank]
-                                break
-
-                        if rank_role not in debater.member.roles:
-                            await debater.member.add_roles(
-                                rank_role, reason="Added at the end of a debate match."
+
+                            avatar_url = None
+                            if debater.member.avatar:
+                                avatar_url = debater.member.avatar.url
+                            embed = Embed(title="Rating Change", color=0xEC6A5C)
+                            embed.set_footer(
+                                text=debater.member.display_name,
+                                icon_url=avatar_url,
+                            )
+                            embed.add_field(
+                                name="Mean",
+                                value=f"```diff\n"
+                                f"- {float(debater.mu_pre): .2f}\n"
+                                f"+ {float(debater.mu_post): .2f}\n"
+                                f"```",
+                                inline=True,
+                            )
+                            embed.add_field(
+                                name="Confidence",
+                                value=f"```diff\n"
+                                f"- {float(debater.sigma_pre): .2f}\n"
+                                f"+ {float(debater.sigma_post): .2f}\n"
+                                f"```",
+                                inline=True,
+                            )
+                            embed.add_field(
+                                name="Rating",
+                                value=f"```diff\n"
+                                f"- {float(20 * ((debater.mu_pre - 3 * debater.sigma_pre) + 25)): .2f}\n"
+                                f"+ {float(20 * ((debater.mu_post - 3 * debater.sigma_post) + 25)): .2f}\n"
+                                f"```",
+                                inline=True,
+                            )
+
+                            publish_to_debate_feed(self.bot, embed)
+
+                            # Update Roles
+                            self.bot.state["rank_roles"].schedule(
+                                debater.member,
+                                debater_rating,
+                                reason="Updated at the end of a debate match.",
                             )
 
-                        for rank, rating in RANK_RATING_MAP.items():
-                            rank_role_id = self.bot.state["map_roles"][rank]
-                            if rank_role_id in debater.member.roles:
-                                if rank_role_id != rank_role:
-                                    await debater.member.remove_roles(
-                                        rank_role_id,
-                                        reason="Removed at the end of a debate match.",
-                                    )
-
-                    embed = Embed(title="Voter Log", color=0xEC6A5C)
-                    value = ""
-                    debaters_by_votes = sorted(
-                        room.match.get_debaters(), key=lambda d: d.votes
+                        embed = Embed(title="Voter Log", color=0xEC6A5C)
+                        value = ""
+                        debaters_by_votes = sorted(
+                            room.match.get_debaters(), key=lambda d: d.total_votes()
+                        )
+                        for debater in debaters_by_votes:
+                            voters = sorted(
+                                debater.votes, key=lambda p: p.total_votes()
+                            )
+                            for voter in voters:
+                                value += f"{voter.type()} {voter.member.mention} → {debater.type()} {debater.member.mention}\n"
+                        embed.description = value
+                        publish_to_debate_feed(self.bot, embed)
+
+                # Update topic
+                current_topic = room.current_topic
+                if current_topic:
+                    await update_im(
+                        bot=self.bot,
+                        room_num=get_room_number(bot=self.bot, channel=room.vc),
+                    )
+                    room.remove_topic(current_topic.author)
+                    room.vote_topic(current_topic.author, current_topic.author)
+                else:
+                    await update_im(
+                        bot=self.bot,
+                        room_num=get_room_number(bot=self.bot, channel=room.vc),
                     )
-                    for debater in debaters_by_votes:
-                        voters = sorted(debater.votes, key=lambda p: p.total_votes())
-                        for voter in voters:
-                            value += f"{voter.type()} {voter.member.mention} → {debater.type()} {debater.member.mention}\n"
-                    embed.description = value
-                    fifo: Queue = self.bot.state["debate_feed_fifo"]
-                    fifo.put(embed)
-
-            # Update topic
-            current_topic = room.current_topic
-            if current_topic:
-                await update_im(
-                    bot=self.bot,
-                    room_num=get_room_number(bot=self.bot, channel=room.vc),
-                )
-                room.remove_topic(current_topic.author)
-                room.vote_topic(current_topic.author, current_topic.author)
-            else:
-                await update_im(
-                    bot=self.bot,
-                    room_num=get_room_number(bot=self.bot, channel=room.vc),
-                )
 
-            room.updating_topic = True
-            await update_topic(bot=self.bot, room=room)
-            room.updating_topic = False
+                await update_topic(bot=self.bot, room=room)
 
-            # Clear private debaters
-            room.private_debaters = []
+                # Clear private debaters
+                room.private_debaters = []
 
-            if room.match:
-                check_voters = room.match.check_voters()
-                room.match.concluding = False
-                room.match.concluded = True
-            else:
-                check_voters = None
+                if room.match:
+                    check_voters = room.match.check_voters()
+                    room.match.concluding = False
+                    room.match.concluded = True
+                else:
+                    check_voters = None
 
-            # Remove voters from data set
-            room.remove_conclude_voters()
-            room.match = None  # Clear match
+                # Remove voters from data set
+                room.remove_conclude_voters()
+                room.match = None  # Clear match
 
-            embed = Embed(
-                title="Debate Concluded",
-                description="Ratings have been updated.",
-                color=0x2ECC71,
-            )
-            if not check_voters:
-                embed.description = (
-                    "Ratings have not been updated due to lack of voters."
-                )
-            await room.vc.send(embed=embed)
-        else:
-            if not debaters:
-                return
-            if len(debaters) == 0:
                 embed = Embed(
-                    title="Conclude Failed",
-                    description="You cannot conclude an empty debate room.",
-                    color=0xE74C3C,
+                    title="Debate Concluded",
+                    description="Ratings have been updated.",
+                    color=0x2ECC71,
                 )
-                await update(interaction, embed=embed, ephemeral=True)
+                if not check_voters:
+                    embed.description = (
+                        "Ratings have not been updated due to lack of voters."
+                    )
+                await room.vc.send(embed=embed)
+            else:
+                if not debaters:
+                    return
+                if len(debaters) == 0:
+                    embed = Embed(
+                        title="Conclude Failed",
+                        description="You cannot conclude an empty debate room.",
+                        color=0xE74C3C,
+                    )
+                    await update(interaction, embed=embed, ephemeral=True)
 
     @app_commands.command(
         name="consent",
@@ -1876,62 +1579,38 @@ class Debate(commands.Cog):
         room: typing.Optional[DebateRoom] = get_room(self.bot, room_number)
         author = interaction.user
 
-        if room.updating_topic:
-            await update(
-                interaction,
-                embed=Embed(
-                    title="Command Temporarily Disabled",
-                    description="This command only works once the topic has finished updating.",
+        async with room_turn(self.bot, room, interaction):
+            if room.lounge:
+                embed = Embed(
+                    title="Command Unauthorized",
+                    description=f"You cannot use this command in a lounge room.",
                     color=0xE74C3C,
-                ),
-                errored=True,
-                ephemeral=True,
-            )
-            return
-
-        if room.match:
-            if room.match.concluding:
-                await update(
-                    interaction,
-                    embed=Embed(
-                        title="Command Temporarily Disabled",
-                        description="This command only works once the debate match has finished concluding.",
-                        color=0xE74C3C,
-                    ),
-                    ephemeral=True,
                 )
+                await update(interaction, embed=embed, ephemeral=True)
+                return
 
-        if room.lounge:
-            embed = Embed(
-                title="Command Unauthorized",
-                description=f"You cannot use this command in a lounge room.",
-                color=0xE74C3C,
-            )
-            await update(interaction, embed=embed, ephemeral=True)
-            return
-
-        if room.studio:
-            room.studio_participants.append(author)
-            if room.match:
-                if room.match.check_debater(member=author):
+            if room.studio:
+                room.studio_participants.append(author)
+                if room.match:
+                    if room.match.check_debater(member=author):
+                        await author.edit(mute=False)
+                else:
                     await author.edit(mute=False)
+                embed = Embed(
+                    title="Consent Received",
+                    description=f"{author.mention} has consented to being recorded.",
+                    color=0x2ECC71,
+                )
+                await update(interaction, embed=embed)
+                return
             else:
-                await author.edit(mute=False)
-            embed = Embed(
-                title="Consent Received",
-                description=f"{author.mention} has consented to being recorded.",
-                color=0x2ECC71,
-            )
-            await update(interaction, embed=embed)
-            return
-        else:
-            embed = Embed(
-                title="Command Unauthorized",
-                description=f"This is not a studio room.",
-                color=0xE74C3C,
-            )
-            await update(interaction, embed=embed, ephemeral=True)
-            return
+                embed = Embed(
+                    title="Command Unauthorized",
+                    description=f"This is not a studio room.",
+                    color=0xE74C3C,
+                )
+                await update(interaction, embed=embed, ephemeral=True)
+                return
 
     @app_commands.command(
         name="proposition",
@@ -1952,44 +1631,47 @@ class Debate(commands.Cog):
                 if message.embeds[0].title.startswith("Debate Room"):
                     return
 
-        if message.channel in [room.vc for room in self.bot.state["debate_rooms"]]:
-            # Get number
-            room_num = get_room_number(self.bot, message.channel)
-
+        room = self.bot.state["debate_rooms"].from_channel(message.channel)
+        if room:
             # Delete interface message
-            index = room_num - 1
-            im_del = self.bot.state["interface_messages"][index]
-            try:
-                im_del = await message.channel.fetch_message(im_del)
-            except discord.errors.NotFound as e_info:
-                im_del = None
-
+            im_del = get_interface_message(self.bot, room.number)
             try:
                 if im_del:
                     await im_del.delete()
             except discord.errors.NotFound as e_info:
+                self.bot.state["interface_message_handles"].pop(im_del.id, None)
                 return
 
     @commands.Cog.listener()
     async def on_raw_message_delete(self, payload):
         channel = self.bot.get_channel(payload.channel_id)
-        if channel in [room.vc for room in self.bot.state["debate_rooms"]]:
+        room = self.bot.state["debate_rooms"].from_channel(channel)
+        if room:
+            self.bot.state["interface_message_handles"].pop(payload.message_id, None)
+            self.bot.state["interface_message_payloads"].pop(payload.message_id, None)
+
             # Add interface message when embed is deleted
             if payload.message_id in self.bot.state["interface_messages"]:
-                index = get_room_number(self.bot, channel) - 1
+                index = room.number - 1
                 if not self.bot.state["exiting"]:
                     im = await add_interface_message(self.bot, index)
 
     @commands.Cog.listener()
     async def on_raw_bulk_message_delete(self, payload):
         channel = self.bot.get_channel(payload.channel_id)
+        room = self.bot.state["debate_rooms"].from_channel(channel)
+        if not room:
+            return
+
         for message_id in payload.message_ids:
-            if channel in [room.vc for room in self.bot.state["debate_rooms"]]:
-                # Add interface message when embed is deleted
-                if message_id in self.bot.state["interface_messages"]:
-                    index = get_room_number(self.bot, channel) - 1
-                    if not self.bot.state["exiting"]:
-                        im = await add_interface_message(self.bot, index)
+            self.bot.state["interface_message_handles"].pop(message_id, None)
+            self.bot.state["interface_message_payloads"].pop(message_id, None)
+
+            # Add interface message when embed is deleted
+            if message_id in self.bot.state["interface_messages"]:
+                index = room.number - 1
+                if not self.bot.state["exiting"]:
+                    im = await add_interface_message(self.bot, index)
 
     @commands.Cog.listener()
     async def on_member_join(self, member: Member):
@@ -1999,36 +1681,30 @@ class Debate(commands.Cog):
 
     @commands.Cog.listener()
     async def on_member_update(self, old_member, member):
+        if member.bot:
+            return
         if old_member.pending and not member.pending:
             member_data = await self.bot.engine.find_one(
                 MemberModel, MemberModel.member == member.id
             )
             if member_data:
-                floored_rating = floor_rating(
-                    float(20 * ((member_data.mu - 3 * member_data.sigma) + 25))
-                )
-                current_rank_role: typing.Optional[Role] = None
-                for rank, rating in RANK_RATING_MAP.items():
-                    if math.isclose(floored_rating, rating, rel_tol=1e-04):
-                        current_rank_role = self.bot.state["map_roles"][rank]
-                        break
-
-                if current_rank_role not in member.roles:
-                    await member.add_roles(
-                        current_rank_role, reason="Added during member join."
-                    )
-
-                for rank, rating in RANK_RATING_MAP.items():
-                    rank_role = self.bot.state["map_roles"][rank]
-                    if rank_role in member.roles:
-                        if rank_role != current_rank_role:
-                            await member.remove_roles(
-                                rank_role, reason="Removed during member join."
-                            )
+                self.bot.state["leaderboard"].update(member.id, member_data.rating)
+                self.bot.state["rank_roles"].schedule(
+                    member,
+                    float(20 * ((member_data.mu - 3 * member_data.sigma) + 25)),
+                    reason="Updated during member join.",
+                )
             else:
                 member_data = MemberModel(member=member)
                 await self.bot.engine.save(member_data)
-                await member.add_roles(self.bot.state["map_roles"]["role_novice"])
+                self.bot.state["leaderboard"].update(member.id, member_data.rating)
+                self.bot.state["rank_roles"].schedule(
+                    member, member_data.rating, reason="Updated during member join."
+                )
+
+    @commands.Cog.listener()
+    async def on_member_remove(self, member: Member):
+        self.bot.state["leaderboard"].remove(member.id)
 
     async def studio_release(self, room: DebateRoom):
         embed = Embed(
@@ -2038,14 +1714,22 @@ class Debate(commands.Cog):
             color=0xF1C40F,
         )
         await room.vc.send(embeds=[embed])
-        await asyncio.sleep(120)
+        await self.bot.state["room_timers"].schedule(
+            room, "studio", 120, room.studio_engineer.id
+        )
+
+    async def studio_expire(self, room: DebateRoom, owner: Optional[int]):
+        async with get_room_actor(self.bot, room).turn():
+            # The studio was stopped or claimed by someone else meanwhile
+            if room.studio_engineer is None or room.studio_engineer.id != owner:
+                return
 
-        if room.studio_engineer in self.bot.state["studio_engineers"]:
-            self.bot.state["studio_engineers"].remove(room.studio_engineer)
+            if room.studio_engineer in self.bot.state["studio_engineers"]:
+                self.bot.state["studio_engineers"].remove(room.studio_engineer)
 
-        room.studio = False
-        room.studio_engineer = None
-        await update_im(bot=self.bot, room_num=room.number)
+            room.studio = False
+            room.studio_engineer = None
+            await update_im(bot=self.bot, room_num=room.number)
 
     async def lounge_release(self, room: DebateRoom):
         embed = Embed(
@@ -2055,18 +1739,33 @@ class Debate(commands.Cog):
             color=0xF1C40F,
         )
         await room.vc.send(embeds=[embed])
-        await asyncio.sleep(300)
+        await self.bot.state["room_timers"].schedule(
+            room, "lounge", 300, room.lounge_master.id
+        )
+
+    async def lounge_expire(self, room: DebateRoom, owner: Optional[int]):
+        async with get_room_actor(self.bot, room).turn():
+            # The lounge was released or claimed by someone else meanwhile
+            if room.lounge_master is None or room.lounge_master.id != owner:
+                return
 
-        if room.lounge_master in self.bot.state["lounge_masters"]:
-            self.bot.state["lounge_masters"].remove(room.lounge_master)
-        room.lounge = False
-        room.lounge_master = None
-        await update_im(bot=self.bot, room_num=room.number)
+            if room.lounge_master in self.bot.state["lounge_masters"]:
+                self.bot.state["lounge_masters"].remove(room.lounge_master)
+            room.lounge = False
+            room.lounge_master = None
+            await update_im(bot=self.bot, room_num=room.number)
 
     @commands.Cog.listener()
     async def on_voice_state_update(self, member, before, after):
-        debate_rooms: typing.List[DebateRoom] = self.bot.state["debate_rooms"]
+        debate_rooms: DebateRoomRegistry = self.bot.state["debate_rooms"]
+
+        # Only moves into or out of debate rooms are handled
+        voice_filter = self.bot.state["voice_event_filter"]
+        if not voice_filter.accept(debate_rooms.channel_ids, before, after):
+            return
+
         roles = self.bot.state["map_roles"]
+        timers: RoomTimers = self.bot.state["room_timers"]
         checked_roles = [
             roles["role_chancellor"],
             roles["role_liege"],
@@ -2074,213 +1773,56 @@ class Debate(commands.Cog):
             roles["role_minister"],
         ]
 
-        # Do nothing if mute event
-        if before.mute and not after.mute:
-            return
-        if not before.mute and after.mute:
-            return
-
-        if before.deaf and not after.deaf:
-            return
-        if not before.deaf and after.deaf:
-            return
+        async def join_room():
+            after_vc = after.channel
+            room_after_number = get_room_number(self.bot, after_vc)
+            if not room_after_number:
+                return
 
-        if before.self_mute and not after.self_mute:
-            return
-        if not before.self_mute and after.self_mute:
-            return
+            room_after = get_room(self.bot, room_after_number)
+            room_after.add_topic_voter(member)
+            room_after.reset_topic_creation(member)
 
-        if before.self_deaf and not after.self_deaf:
-            return
-        if not before.self_deaf and after.self_deaf:
-            return
+            if room_after.match:
+                participant = room_after.match.get_participant(member)
+                if participant:
+                    participant.session_start = datetime.utcnow()
 
-        if before.self_stream and not after.self_stream:
-            return
-        if not before.self_stream and after.self_stream:
-            return
+            # Allow members to send messages in linked text chat
+            await room_after.vc.set_permissions(member, send_messages=True)
 
-        if before.self_video and not after.self_video:
-            return
-        if not before.self_video and after.self_video:
-            return
+            if room_after.studio and member == room_after.studio_engineer:
+                if await timers.cancel(room_after, "studio"):
+                    embed = Embed(
+                        title="Studio Expiration Cancelled",
+                        description="The studio's engineer has returned.",
+                        color=0x2ECC71,
+                    )
+                    await room_after.vc.send(embeds=[embed])
+            elif (
+                not room_after.match
+                and not room_after.private
+                and not room_after.studio
+                and room_after.lounge
+                and member == room_after.lounge_master
+            ):
+                # Allow lounge masters to mute users
+                await room_after.vc.set_permissions(
+                    member, mute_members=True, send_messages=True
+                )
+                if await timers.cancel(room_after, "lounge"):
+                    embed = Embed(
+                        title="Lounge Expiration Cancelled",
+                        description="The lounge's master has returned.",
+                        color=0x2ECC71,
+                    )
+                    await room_after.vc.send(embeds=[embed])
 
-        async def join_room():
-            after_vc = after.channel
-            room_after_number = get_room_number(self.bot, after_vc)
-            room_after = None
-            if room_after_number:
-                room_after = get_room(self.bot, room_after_number)
-                room_after.add_topic_voter(member)
-                room_after.reset_topic_creation(member)
-
-                if room_after.match:
-                    participant = room_after.match.get_participant(member)
-                    if participant:
-                        participant.session_start = datetime.utcnow()
-
-                # Allow members to send messages in linked text chat
-                await room_after.vc.set_permissions(member, send_messages=True)
-
-                if room_after.match:
-                    if room_after.match.check_debater(member):
-                        if room_after.private:
-                            if room_after.studio:
-                                if member == room_after.studio_engineer:
-                                    self.studio_task.cancel()
-                                    embed = Embed(
-                                        title="Studio Expiration Cancelled",
-                                        description="The studio's engineer has returned.",
-                                        color=0x2ECC71,
-                                    )
-                                    await room_after.vc.send(embeds=[embed])
-
-                                if (
-                                    self.bot.state["map_roles"]["role_detained"]
-                                    in member.roles
-                                ):
-                                    await member.edit(mute=True)
-                                else:
-                                    if member in room_after.private_debaters:
-                                        if member in room_after.studio_participants:
-                                            await member.edit(mute=False)
-                                    else:
-                                        if member not in room_after.studio_participants:
-                                            await member.edit(mute=True)
-                            else:
-                                if (
-                                    self.bot.state["map_roles"]["role_detained"]
-                                    in member.roles
-                                ):
-                                    await member.edit(mute=True)
-                                else:
-                                    if member in room_after.private_debaters:
-                                        await member.edit(mute=False)
-                                    else:
-                                        await member.edit(mute=True)
-                        else:
-                            if room_after.studio:
-                                if member == room_after.studio_engineer:
-                                    self.studio_task.cancel()
-                                    embed = Embed(
-                                        title="Studio Expiration Cancelled",
-                                        description="The studio's engineer has returned.",
-                                        color=0x2ECC71,
-                                    )
-                                    await room_after.vc.send(embeds=[embed])
-
-                                if (
-                                    self.bot.state["map_roles"]["role_detained"]
-                                    in member.roles
-                                ):
-                                    await member.edit(mute=True)
-                                else:
-                                    if member in room_after.studio_participants:
-                                        await member.edit(mute=False)
-                            else:
-                                if (
-                                    self.bot.state["map_roles"]["role_detained"]
-                                    in member.roles
-                                ):
-                                    await member.edit(mute=True)
-                                else:
-                                    await member.edit(mute=False)
-                    else:
-                        if room_after.studio:
-                            if member == room_after.studio_engineer:
-                                self.studio_task.cancel()
-                                embed = Embed(
-                                    title="Studio Expiration Cancelled",
-                                    description="The studio's engineer has returned.",
-                                    color=0x2ECC71,
-                                )
-                                await room_after.vc.send(embeds=[embed])
-
-                            if member not in room_after.studio_participants:
-                                await member.edit(mute=True)
-                        else:
-                            await member.edit(mute=True)
-                else:
-                    if room_after.private:
-                        if room_after.studio:
-                            if member == room_after.studio_engineer:
-                                self.studio_task.cancel()
-                                embed = Embed(
-                                    title="Studio Expiration Cancelled",
-                                    description="The studio's engineer has returned.",
-                                    color=0x2ECC71,
-                                )
-                                await room_after.vc.send(embeds=[embed])
-
-                            if (
-                                self.bot.state["map_roles"]["role_detained"]
-                                in member.roles
-                            ):
-                                await member.edit(mute=True)
-                            else:
-                                if member in room_after.private_debaters:
-                                    if member in room_after.studio_participants:
-                                        await member.edit(mute=False)
-                                    else:
-                                        await member.edit(mute=True)
-                                else:
-                                    if member in room_after.studio_participants:
-                                        await member.edit(mute=False)
-                                    else:
-                                        await member.edit(mute=True)
-                        else:
-                            if (
-                                self.bot.state["map_roles"]["role_detained"]
-                                in member.roles
-                            ):
-                                await member.edit(mute=True)
-                            else:
-                                if member in room_after.private_debaters:
-                                    await member.edit(mute=False)
-                                else:
-                                    await member.edit(mute=True)
-                    else:
-                        if room_after.studio:
-                            if member == room_after.studio_engineer:
-                                self.studio_task.cancel()
-                                embed = Embed(
-                                    title="Studio Expiration Cancelled",
-                                    description="The studio's engineer has returned.",
-                                    color=0x2ECC71,
-                                )
-                                await room_after.vc.send(embeds=[embed])
-
-                            if (
-                                self.bot.state["map_roles"]["role_detained"]
-                                in member.roles
-                            ):
-                                await member.edit(mute=True)
-                            else:
-                                if member in room_after.studio_participants:
-                                    await member.edit(mute=False)
-                                else:
-                                    await member.edit(mute=True)
-                        elif room_after.lounge:
-                            # Allow lounge masters to mute users
-                            if room_after.lounge_master == member:
-                                await room_after.vc.set_permissions(
-                                    member, mute_members=True, send_messages=True
-                                )
-                                self.lounge_task.cancel()
-                                embed = Embed(
-                                    title="Lounge Expiration Cancelled",
-                                    description="The lounge's master has returned.",
-                                    color=0x2ECC71,
-                                )
-                                await room_after.vc.send(embeds=[embed])
-                        else:
-                            if (
-                                self.bot.state["map_roles"]["role_detained"]
-                                in member.roles
-                            ):
-                                await member.edit(mute=True)
-                            else:
-                                await member.edit(mute=False)
+            mute = desired_mute(
+                voice_context(room_after, member, roles["role_detained"])
+            )
+            if mute is not None and after.mute != mute:
+                await member.edit(mute=mute)
 
         async def leave_room():
             before_vc = before.channel
@@ -2309,64 +1851,21 @@ class Debate(commands.Cog):
 
                     # Remove Recording Session
                     if member == room_before.studio_engineer:
-                        self.studio_task = asyncio.create_task(
-                            self.studio_release(room_before)
-                        )
+                        await self.studio_release(room_before)
 
                     # Remove Lounge Session
                     if member == room_before.lounge_master:
-                        self.lounge_task = asyncio.create_task(
-                            self.lounge_release(room_before)
-                        )
-
-                    # Delete if not working
-                    room_before.updating_topic = True
-                    await update_topic(self.bot, room_before)
-                    room_before.updating_topic = False
-
-        if before.channel is None and after.channel:
-            if before.channel is None and after.channel in [
-                room.vc for room in debate_rooms
-            ]:
-                await join_room()
-                return
-
-        if before.channel and after.channel is None:
-            if (
-                before.channel in [room.vc for room in debate_rooms]
-                and after.channel is None
-            ):
-                await leave_room()
-                return
-
-        after_list = []
-        if after.channel:
-            after_list = list([room.vc for room in debate_rooms])
-            if after.channel in after_list:
-                after_list.remove(after.channel)
-        else:
-            return
+                        await self.lounge_release(room_before)
 
-        before_list = []
-        if before.channel:
-            before_list = list([room.vc for room in debate_rooms])
-            if before.channel in before_list:
-                before_list.remove(before.channel)
-        else:
-            return
+        before_room = debate_rooms.from_channel(before.channel)
+        after_room = debate_rooms.from_channel(after.channel)
 
-        if before.channel and after.channel and after_list and before_list:
-            if before.channel not in after_list and after.channel in before_list:
-                await join_room()
-                await leave_room()
-                return
-            elif before.channel in after_list and after.channel not in before_list:
-                await join_room()
-                await leave_room()
-                return
-            elif before.channel in after_list and after.channel in before_list:
-                await join_room()
-                await leave_room()
+        # Queued behind the room's commands, the topic is updated once for
+        # every leave that arrived while the room was busy
+        if after_room:
+            await get_room_actor(self.bot, after_room).call(join_room)
+        if before_room:
+            await get_room_actor(self.bot, before_room).call(leave_room, settle=True)
 
 
 @app_commands.default_permissions(send_messages=True)
@@ -2426,75 +1925,63 @@ class Studio(
         room: typing.Optional[DebateRoom] = get_room(self.bot, room_number)
         author = interaction.user
 
-        if room.updating_topic:
-            await update(
-                interaction,
-                embed=Embed(
-                    title="Command Temporarily Disabled",
-                    description="This command only works once the topic has finished updating.",
-                    color=0xE74C3C,
-                ),
-                errored=True,
-                ephemeral=True,
-            )
-            return
+        async with room_turn(self.bot, room, interaction):
+            if room.check_match():
+                await update(
+                    interaction,
+                    embed=Embed(
+                        title="Command Unauthorized",
+                        description=f"You can only claim a room without an existing match.",
+                        color=0xE74C3C,
+                    ),
+                )
+                return
 
-        if room.check_match():
-            await update(
-                interaction,
-                embed=Embed(
+            if room.lounge:
+                embed = Embed(
                     title="Command Unauthorized",
-                    description=f"You can only claim a room without an existing match.",
+                    description=f"You cannot record in lounge rooms.",
                     color=0xE74C3C,
-                ),
-            )
-            return
-
-        if room.lounge:
-            embed = Embed(
-                title="Command Unauthorized",
-                description=f"You cannot record in lounge rooms.",
-                color=0xE74C3C,
-            )
-            await update(interaction, embed=embed, ephemeral=True)
-            return
+                )
+                await update(interaction, embed=embed, ephemeral=True)
+                return
 
-        if room.studio:
-            embed = Embed(
-                title="Command Unauthorized",
-                description=f"This room is already claimed by f{room.studio_engineer.mention}.",
-                color=0xE74C3C,
-            )
-            await update(interaction, embed=embed, ephemeral=True)
-            return
-        else:
-            if room.studio_engineer in self.bot.state["studio_engineers"]:
+            if room.studio:
                 embed = Embed(
                     title="Command Unauthorized",
-                    description=f"You can only claim one studio room at a time.",
+                    description=f"This room is already claimed by f{room.studio_engineer.mention}.",
                     color=0xE74C3C,
                 )
                 await update(interaction, embed=embed, ephemeral=True)
                 return
+            else:
+                if room.studio_engineer in self.bot.state["studio_engineers"]:
+                    embed = Embed(
+                        title="Command Unauthorized",
+                        description=f"You can only claim one studio room at a time.",
+                        color=0xE74C3C,
+                    )
+                    await update(interaction, embed=embed, ephemeral=True)
+                    return
 
-            room.studio = True
-            room.studio_engineer = author
-            self.bot.state["studio_engineers"].append(author)
+                room.studio = True
+                room.studio_engineer = author
+                self.bot.state["studio_engineers"].append(author)
 
-            await interaction.response.defer()
+                await defer(interaction)
+                await self.bot.state["room_timers"].cancel(room, "studio")
 
-            for member in room.vc.members:
-                await member.edit(mute=True)
+                await mute_members(self.bot, room.vc.members, mute=True)
 
-            await update_im(bot=self.bot, room_num=room.number)
+                await update_im(bot=self.bot, room_num=room.number)
 
-            embed = Embed(
-                title="Studio Initialized",
-                description="This room is potentially being recorded.",
-                color=0x2ECC71,
-            )
-            await update(interaction, embed=embed)
-            return
+                embed = Embed(
+                    title="Studio Initialized",
+                    description="This room is potentially being recorded.",
+                    color=0x2ECC71,
+                )
+                await update(interaction, embed=embed)
+                return
 
     @app_commands.command(
         name="stop",
@@ -2510,64 +1997,52 @@ class Studio(
         room: typing.Optional[DebateRoom] = get_room(self.bot, room_number)
         author = interaction.user
 
-        if room.updating_topic:
-            await update(
-                interaction,
-                embed=Embed(
-                    title="Command Temporarily Disabled",
-                    description="This command only works once the topic has finished updating.",
+        async with room_turn(self.bot, room, interaction):
+            if room.lounge:
+                embed = Embed(
+                    title="Command Unauthorized",
+                    description=f"You cannot record in lounge rooms.",
                     color=0xE74C3C,
-                ),
-                errored=True,
-                ephemeral=True,
-            )
-            return
-
-        if room.lounge:
-            embed = Embed(
-                title="Command Unauthorized",
-                description=f"You cannot record in lounge rooms.",
-                color=0xE74C3C,
-            )
-            await update(interaction, embed=embed, ephemeral=True)
-            return
+                )
+                await update(interaction, embed=embed, ephemeral=True)
+                return
 
-        if not room.studio:
-            embed = Embed(
-                title="Command Unauthorized",
-                description=f"This is not a studio room.",
-                color=0xE74C3C,
-            )
-            await update(interaction, embed=embed, ephemeral=True)
-            return
-        else:
-            if author != room.studio_engineer:
+            if not room.studio:
                 embed = Embed(
                     title="Command Unauthorized",
-                    description=f"Only the studio engineer can run this command.",
+                    description=f"This is not a studio room.",
                     color=0xE74C3C,
                 )
                 await update(interaction, embed=embed, ephemeral=True)
                 return
+            else:
+                if author != room.studio_engineer:
+                    embed = Embed(
+                        title="Command Unauthorized",
+                        description=f"Only the studio engineer can run this command.",
+                        color=0xE74C3C,
+                    )
+                    await update(interaction, embed=embed, ephemeral=True)
+                    return
 
-            await interaction.response.defer()
+                await defer(interaction)
+                await self.bot.state["room_timers"].cancel(room, "studio")
 
-            room.studio = False
-            room.studio_engineer = None
+                room.studio = False
+                room.studio_engineer = None
 
-            if not room.match:
-                for member in room.vc.members:
-                    await member.edit(mute=False)
+                if not room.match:
+                    await mute_members(self.bot, room.vc.members, mute=False)
 
-            await update_im(bot=self.bot, room_num=room.number)
+                await update_im(bot=self.bot, room_num=room.number)
 
-            embed = Embed(
-                title="Studio Ended",
-                description="No one is allowed to record in this room anymore.",
-                color=0x2ECC71,
-            )
-            await update(interaction, embed=embed)
-            return
+                embed = Embed(
+                    title="Studio Ended",
+                    description="No one is allowed to record in this room anymore.",
+                    color=0x2ECC71,
+                )
+                await update(interaction, embed=embed)
+                return
 
 
 @app_commands.default_permissions(send_messages=True)
@@ -2595,67 +2070,56 @@ class Lounge(
         room: typing.Optional[DebateRoom] = get_room(self.bot, room_number)
         author = interaction.user
 
-        if room.updating_topic:
-            await update(
-                interaction,
-                embed=Embed(
-                    title="Command Temporarily Disabled",
-                    description="This command only works once the topic has finished updating.",
-                    color=0xE74C3C,
-                ),
-                errored=True,
-                ephemeral=True,
-            )
-            return
-
-        if room.check_match():
-            await update(
-                interaction,
-                embed=Embed(
-                    title="Command Unauthorized",
-                    description=f"You can only claim a room without an existing match.",
-                    color=0xE74C3C,
-                ),
-            )
-            return
+        async with room_turn(self.bot, room, interaction):
+            if room.check_match():
+                await update(
+                    interaction,
+                    embed=Embed(
+                        title="Command Unauthorized",
+                        description=f"You can only claim a room without an existing match.",
+                        color=0xE74C3C,
+                    ),
+                )
+                return
 
-        if room.lounge:
-            embed = Embed(
-                title="Command Unauthorized",
-                description=f"This room is already claimed by f{room.lounge_master.mention}.",
-                color=0xE74C3C,
-            )
-            await update(interaction, embed=embed, ephemeral=True)
-            return
-        else:
-            if author in self.bot.state["lounge_masters"]:
+            if room.lounge:
                 embed = Embed(
                     title="Command Unauthorized",
-                    description=f"You can only claim one lounge room at a time.",
+                    description=f"This room is already claimed by f{room.lounge_master.mention}.",
                     color=0xE74C3C,
                 )
                 await update(interaction, embed=embed, ephemeral=True)
                 return
+            else:
+                if author in self.bot.state["lounge_masters"]:
+                    embed = Embed(
+                        title="Command Unauthorized",
+                        description=f"You can only claim one lounge room at a time.",
+                        color=0xE74C3C,
+                    )
+                    await update(interaction, embed=embed, ephemeral=True)
+                    return
 
-            room.lounge = True
-            room.lounge_master = author
-            self.bot.state["lounge_masters"].append(author)
+                room.lounge = True
+                room.lounge_master = author
+                self.bot.state["lounge_masters"].append(author)
 
-            await interaction.response.defer()
+                await defer(interaction)
+                await self.bot.state["room_timers"].cancel(room, "lounge")
 
-            await room.vc.set_permissions(
-                target=author, mute_members=True, send_messages=True
-            )
+                await room.vc.set_permissions(
+                    target=author, mute_members=True, send_messages=True
+                )
 
-            await update_im(bot=self.bot, room_num=room.number)
+                await update_im(bot=self.bot, room_num=room.number)
 
-            embed = Embed(
-                title="Lounge Initialized",
-                description="This room is now a lounge room.",
-                color=0x2ECC71,
-            )
-            await update(interaction, embed=embed)
-            return
+                embed = Embed(
+                    title="Lounge Initialized",
+                    description="This room is now a lounge room.",
+                    color=0x2ECC71,
+                )
+                await update(interaction, embed=embed)
+                return
 
     @app_commands.command(
         name="release",
@@ -2672,58 +2136,46 @@ class Lounge(
         room: typing.Optional[DebateRoom] = get_room(self.bot, room_number)
         author = interaction.user
 
-        if room.updating_topic:
-            await update(
-                interaction,
-                embed=Embed(
-                    title="Command Temporarily Disabled",
-                    description="This command only works once the topic has finished updating.",
-                    color=0xE74C3C,
-                ),
-                errored=True,
-                ephemeral=True,
-            )
-            return
-
-        if not room.lounge:
-            embed = Embed(
-                title="Command Unauthorized",
-                description=f"This is not a lounge room.",
-                color=0xE74C3C,
-            )
-            await update(interaction, embed=embed, ephemeral=True)
-            return
-        else:
-            if author != room.lounge_master:
+        async with room_turn(self.bot, room, interaction):
+            if not room.lounge:
                 embed = Embed(
                     title="Command Unauthorized",
-                    description=f"Only the lounge master can run this command.",
+                    description=f"This is not a lounge room.",
                     color=0xE74C3C,
                 )
                 await update(interaction, embed=embed, ephemeral=True)
                 return
+            else:
+                if author != room.lounge_master:
+                    embed = Embed(
+                        title="Command Unauthorized",
+                        description=f"Only the lounge master can run this command.",
+                        color=0xE74C3C,
+                    )
+                    await update(interaction, embed=embed, ephemeral=True)
+                    return
 
-            await interaction.response.defer()
+                await defer(interaction)
+                await self.bot.state["room_timers"].cancel(room, "lounge")
 
-            room.lounge = False
-            room.lounge_master = None
+                room.lounge = False
+                room.lounge_master = None
 
-            await room.vc.set_permissions(
-                target=author, mute_members=None, send_messages=True
-            )
+                await room.vc.set_permissions(
+                    target=author, mute_members=None, send_messages=True
+                )
 
-            for member in room.vc.members:
-                await member.edit(mute=False)
+                await mute_members(self.bot, room.vc.members, mute=False)
 
-            await update_im(bot=self.bot, room_num=room.number)
+                await update_im(bot=self.bot, room_num=room.number)
 
-            embed = Embed(
-                title="Lounge Release",
-                description="This room is free for ranked debates now.",
-                color=0x2ECC71,
-            )
-            await update(interaction, embed=embed)
-            return
+                embed = Embed(
+                    title="Lounge Release",
+                    description="This room is free for ranked debates now.",
+                    color=0x2ECC71,
+                )
+                await update(interaction, embed=embed)
+                return
 
 
 async def setup(bot: ArgusClient) -> None:
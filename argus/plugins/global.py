@@ -1,8 +1,8 @@
 import asyncio
 import datetime
-from typing import List
 
 import discord
+import pymongo
 import pytz
 from discord import Embed, Interaction, app_commands
 from discord.app_commands import (
@@ -17,10 +17,10 @@ from argus.client import ArgusClient
 from argus.common import check_roles_exist, send_embed_message
 from argus.constants import DB_CHANNEL_NAME_MAP
 from argus.db.models.guild import GuildModel
-from argus.models import DebateRoom
+from argus.models import DebateRoom, DebateRoomRegistry
 from argus.tasks import debate_feed_updater
 from argus.utils import update
-from argus.voice import voice_channel_update
+from argus.voice import RoomVisibility
 
 
 @app_commands.default_permissions(administrator=True)
@@ -50,6 +50,18 @@ class Global(
     async def on_disconnect(self):
         self.bot.logger.warning("Disconnected from Gateway.")
 
+    @commands.Cog.listener()
+    async def on_voice_state_update(self, member, before, after):
+        room_visibility = self.bot.state["room_visibility"]
+        if self.bot.state["debates_enabled"] and room_visibility:
+            room_visibility.voice_state_update(before, after)
+
+    @commands.Cog.listener()
+    async def on_guild_channel_update(self, before, after):
+        room_visibility = self.bot.state["room_visibility"]
+        if self.bot.state["debates_enabled"] and room_visibility:
+            room_visibility.channel_update(after)
+
     @commands.Cog.listener()
     async def on_error(self, interaction: Interaction, error: AppCommandError):
         if isinstance(error, MissingAnyRole):
@@ -98,7 +110,7 @@ class Global(
         )
 
         self.bot.state["debates_enabled"] = True
-        debate_rooms: List[DebateRoom] = self.bot.state["debate_rooms"]
+        debate_rooms: DebateRoomRegistry = self.bot.state["debate_rooms"]
         roles = self.bot.state["map_roles"]
         interface_messages = self.bot.state["interface_messages"]
         guild = interaction.guild
@@ -117,6 +129,16 @@ class Global(
             )
             return
 
+        # Rating replays read the match log in chronological order
+        await self.bot.db[self.bot.db.database].match.create_index(
+            [("session_end", pymongo.ASCENDING)]
+        )
+
+        # Room timers are saved and cleared by room number and kind
+        await self.bot.db[self.bot.db.database].timer.create_index(
+            [("room", pymongo.ASCENDING), ("kind", pymongo.ASCENDING)], unique=True
+        )
+
         guild_data: GuildModel = await self.bot.engine.find_one(
             GuildModel, GuildModel.guild == guild.id
         )
@@ -131,6 +153,11 @@ class Global(
                     )
                 )
 
+        # Setup Leaderboard Cache
+        await self.bot.state["leaderboard"].load(
+            self.bot.db[self.bot.db.database].member, guild
+        )
+
         # Setup Channels Cache
         for channel in interaction.guild.channels:
             if channel.name in DB_CHANNEL_NAME_MAP.keys():
@@ -155,9 +182,11 @@ class Global(
         self.bot.state["debate_feed_updater_task"] = asyncio.create_task(
             debate_feed_updater(self.bot)
         )
-        self.bot.state["voice_channel_update_task"] = asyncio.create_task(
-            voice_channel_update(self.bot)
-        )
+        await self.bot.state["room_timers"].restore(debate_rooms)
+        room_visibility = RoomVisibility(self.bot)
+        room_visibility.load(debate_rooms)
+        self.bot.state["room_visibility"] = room_visibility
+        await room_visibility.reconcile()
 
         # Send Confirmation Message
         await update(
@@ -34,6 +34,29 @@ class Meta(commands.Cog):
             )
         )
 
+    @commands.command(name="stats")
+    @commands.is_owner()
+    async def stats(self, ctx: Context) -> None:
+        counts = self.bot.state["voice_event_filter"].counts
+        embed = Embed(title="Runtime Statistics", color=0xEC6A5C)
+        embed.add_field(
+            name="Voice Events",
+            value=f"Received: {counts['received']}\n"
+            f"Outside Rooms: {counts['outside_rooms']}\n"
+            f"Same Channel: {counts['same_channel']}\n"
+            f"Accepted: {counts['accepted']}",
+        )
+        timers = self.bot.state["room_timers"]
+        embed.add_field(
+            name="Room Timers",
+            value=f"Pending: {len(timers)}\n"
+            f"Scheduled: {timers.counts['scheduled']}\n"
+            f"Cancelled: {timers.counts['cancelled']}\n"
+            f"Expired: {timers.counts['expired']}\n"
+            f"Restored: {timers.counts['restored']}",
+        )
+        await ctx.send(embed=embed)
+
 
 async def setup(bot: ArgusClient) -> None:
     await bot.add_cog(
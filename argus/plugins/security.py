@@ -14,7 +14,7 @@ from argus.db.models.guild import GuildModel
 from argus.models import DebateRoom
 from argus.tasks import debate_feed_updater
 from argus.utils import update
-from argus.voice import voice_channel_update
+from argus.voice import RoomVisibility
 
 
 @app_commands.default_permissions(administrator=True)
@@ -80,6 +80,8 @@ class Lockdown(commands.GroupCog, name="lockdown"):
 
         self.bot.state["debates_enabled"] = False
         self.bot.state["interface_messages"] = []
+        self.bot.state["interface_message_handles"] = {}
+        self.bot.state["interface_message_payloads"] = {}
 
         for room in debate_rooms:
             now = datetime.datetime.now(tz=pytz.UTC)
@@ -117,9 +119,13 @@ class Lockdown(commands.GroupCog, name="lockdown"):
         )
 
         # Reset Variables
-        self.bot.state["debate_rooms"] = []
+        self.bot.state["debate_rooms"].clear()
+        self.bot.state["room_actors"].clear()
+        self.bot.state["room_timers"].clear()
         self.bot.state["debate_room_maps"] = []
         self.bot.state["interface_messages"] = []
+        self.bot.state["interface_message_handles"] = {}
+        self.bot.state["interface_message_payloads"] = {}
 
         # Shortcut Variables
         channels = self.bot.state["map_channels"]
@@ -200,7 +206,6 @@ class Lockdown(commands.GroupCog, name="lockdown"):
             interface_messages.append(message.id)
 
         debate_feed_updated_task = self.bot.state["debate_feed_updater_task"]
-        voice_channel_update_task = self.bot.state["voice_channel_update_task"]
 
         if debate_feed_updated_task:
             debate_feed_updated_task.cancel()
@@ -212,17 +217,15 @@ class Lockdown(commands.GroupCog, name="lockdown"):
                 debate_feed_updater(self.bot)
             )
 
-        if voice_channel_update_task:
-            voice_channel_update_task.cancel()
-            self.bot.state["voice_channel_update_task"] = asyncio.create_task(
-                voice_channel_update(self.bot)
-            )
-        else:
-            self.bot.state["voice_channel_update_task"] = asyncio.create_task(
-                voice_channel_update(self.bot)
-            )
+        room_visibility = RoomVisibility(self.bot)
+        room_visibility.load(debate_rooms)
+        self.bot.state["room_visibility"] = room_visibility
 
+        # Nothing may yield between starting the feed updater and enabling
+        # debates, or the updater sees debates disabled and exits
         self.bot.state["debates_enabled"] = True
+        await room_visibility.reconcile()
+        await self.bot.state["room_timers"].restore(debate_rooms)
 
         # Send Confirmation Message
         await update(
@@ -0,0 +1,92 @@
+from typing import NamedTuple, Optional, Tuple
+
+from discord import Member, Role
+
+from argus.models import DebateRoom
+
+
+class VoiceContext(NamedTuple):
+    """The room and member state that decides a member's server mute."""
+
+    match: bool
+    debater: bool
+    private: bool
+    studio: bool
+    lounge: bool
+    detained: bool
+    private_debater: bool
+    studio_participant: bool
+
+
+# Ordered rules of required context values and the mute to apply. The first
+# matching rule wins and None leaves the member's mute as it is.
+MUTE_POLICY: Tuple[Tuple[dict, Optional[bool]], ...] = (
+    # Debaters in a match
+    ({"match": True, "debater": True, "detained": True}, True),
+    (
+        {
+            "match": True,
+            "debater": True,
+            "private": True,
+            "studio": True,
+            "private_debater": True,
+            "studio_participant": True,
+        },
+        False,
+    ),
+    (
+        {
+            "match": True,
+            "debater": True,
+            "private": True,
+            "studio": True,
+            "private_debater": False,
+            "studio_participant": False,
+        },
+        True,
+    ),
+    ({"match": True, "debater": True, "private": True, "studio": True}, None),
+    ({"match": True, "debater": True, "private": True, "private_debater": True}, False),
+    ({"match": True, "debater": True, "private": True}, True),
+    (
+        {"match": True, "debater": True, "studio": True, "studio_participant": True},
+        False,
+    ),
+    ({"match": True, "debater": True, "studio": True}, None),
+    ({"match": True, "debater": True}, False),
+    # Voters in a match
+    ({"match": True, "studio": True, "studio_participant": False}, True),
+    ({"match": True, "studio": True}, None),
+    ({"match": True}, True),
+    # No match, lounge masters decide who speaks
+    ({"private": False, "studio": False, "lounge": True}, None),
+    ({"detained": True}, True),
+    ({"studio": True, "studio_participant": True}, False),
+    ({"studio": True}, True),
+    ({"private": True, "private_debater": True}, False),
+    ({"private": True}, True),
+    ({}, False),
+)
+
+
+def desired_mute(context: VoiceContext) -> Optional[bool]:
+    """Get the server mute a member should have, or None to leave it."""
+    for conditions, mute in MUTE_POLICY:
+        if all(getattr(context, key) == value for key, value in conditions.items()):
+            return mute
+    return None
+
+
+def voice_context(room: DebateRoom, member: Member, detained: Role) -> VoiceContext:
+    """Build the mute policy context of a member in a debate room."""
+    match = room.match is not None
+    return VoiceContext(
+        match=match,
+        debater=match and room.match.check_debater(member),
+        private=room.private,
+        studio=room.studio,
+        lounge=room.lounge,
+        detained=member.get_role(detained.id) is not None,
+        private_debater=member in room.private_debaters,
+        studio_participant=member in room.studio_participants,
+    )
@@ -0,0 +1,90 @@
+import asyncio
+import bisect
+from typing import Dict, List, Optional, Tuple
+
+import discord
+from discord import Member, Role
+from discord.ext import commands
+
+from argus.constants import RANK_RATING_MAP
+
+# Rank role keys and their lower rating bounds in ascending order
+RANK_KEYS = sorted(RANK_RATING_MAP.keys(), key=lambda rank: RANK_RATING_MAP[rank])
+RANK_THRESHOLDS = [RANK_RATING_MAP[rank] for rank in RANK_KEYS]
+
+
+def rank_from_rating(rating: float) -> str:
+    """Get the key of the rank role a rating falls under."""
+    index = bisect.bisect_right(RANK_THRESHOLDS, float(rating)) - 1
+    return RANK_KEYS[max(index, 0)]
+
+
+class RankRoleReconciler:
+    """
+    Keeps a member's rank role in line with their rating. The full role set
+    is applied with a single edit and repeated requests for the same member
+    within a short window are coalesced into one.
+    """
+
+    def __init__(self, bot: commands.Bot, delay: float = 1.0):
+        self.bot = bot
+        self.delay = delay
+        self._pending: Dict[int, Tuple[Member, float, Optional[str]]] = {}
+        self._tasks: Dict[int, asyncio.Task] = {}
+
+    def rank_role(self, rating: float) -> Role:
+        """Get the rank role for a rating."""
+        return self.bot.state["map_roles"][rank_from_rating(rating)]
+
+    def desired_roles(self, member: Member, rating: float) -> List[Role]:
+        """Get a member's roles with only the rank role matching their rating."""
+        roles = self.bot.state["map_roles"]
+        rank_roles = {roles[rank] for rank in RANK_KEYS}
+        desired = [role for role in member.roles[1:] if role not in rank_roles]
+        desired.append(self.rank_role(rating))
+        return desired
+
+    async def apply(
+        self, member: Member, rating: float, reason: Optional[str] = None
+    ) -> Role:
+        """Apply a member's rank role immediately if it is out of date."""
+        desired = self.desired_roles(member, rating)
+        if set(desired) != set(member.roles[1:]):
+            await member.edit(roles=desired, reason=reason)
+        return desired[-1]
+
+    def schedule(
+        self, member: Member, rating: float, reason: Optional[str] = None
+    ) -> Role:
+        """
+        Schedule a member's rank role to be reconciled and return the role
+        it will be set to. Only the latest rating within the window is used.
+        """
+        self._pending[member.id] = (member, rating, reason)
+        if member.id not in self._tasks:
+            self._tasks[member.id] = asyncio.create_task(self._flush(member.id))
+        return self.rank_role(rating)
+
+    async def flush(self):
+        """Apply every pending rank role edit now, such as before shutdown."""
+        # Tasks still listed are waiting out the window, not editing
+        for task in self._tasks.values():
+            task.cancel()
+        self._tasks.clear()
+        pending, self._pending = self._pending, {}
+        for member_id, (member, rating, reason) in pending.items():
+            try:
+                await self.apply(member, rating, reason=reason)
+            except discord.HTTPException:
+                self.bot.logger.exception(
+                    "Failed to update rank role", member=member_id
+                )
+
+    async def _flush(self, member_id: int):
+        await asyncio.sleep(self.delay)
+        member, rating, reason = self._pending.pop(member_id)
+        del self._tasks[member_id]
+        try:
+            await self.apply(member, rating, reason=reason)
+        except discord.HTTPException:
+            self.bot.logger.exception("Failed to update rank role", member=member_id)
@@ -0,0 +1,77 @@
+from typing import Optional, Sequence, Tuple
+
+import numpy as np
+
+# Weng-Lin constants matching the openskill defaults
+MU = 25.0
+SIGMA = MU / 3
+BETA_SQUARED = (SIGMA / 2) ** 2
+EPSILON = 0.0001
+
+
+def rate_matches(
+    mu: np.ndarray,
+    sigma: np.ndarray,
+    ranks: Optional[np.ndarray] = None,
+    valid: Optional[np.ndarray] = None,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Apply the Plackett-Luce update to a batch of free-for-all matches of
+    single player teams. Every argument is a ``(matches, players)`` array.
+    Lower ranks are better and equal ranks are ties; by default players are
+    ranked by their column. Padded slots are marked ``False`` in ``valid``
+    and are returned unchanged.
+
+    Gives the same results as ``openskill.rate`` called once per match.
+    """
+    mu = np.atleast_2d(np.asarray(mu, dtype=np.float64))
+    sigma = np.atleast_2d(np.asarray(sigma, dtype=np.float64))
+    if ranks is None:
+        ranks = np.broadcast_to(np.arange(mu.shape[1]), mu.shape)
+    else:
+        ranks = np.atleast_2d(np.asarray(ranks))
+    if valid is None:
+        valid = np.ones(mu.shape, dtype=bool)
+    else:
+        valid = np.atleast_2d(np.asarray(valid, dtype=bool))
+
+    sigma_squared = np.where(valid, sigma**2, 0.0)
+    c = np.sqrt(np.sum(np.where(valid, sigma_squared + BETA_SQUARED, 0.0), axis=1))
+    c = np.where(c > 0, c, 1.0)[:, None]
+    strength = np.where(valid, np.exp(np.where(valid, mu, 0.0) / c), 0.0)
+
+    # beaten[m, i, q] is set when player i did no better than player q
+    pair = valid[:, :, None] & valid[:, None, :]
+    beaten = pair & (ranks[:, :, None] >= ranks[:, None, :])
+    tied = pair & (ranks[:, :, None] == ranks[:, None, :])
+
+    # Sum of strengths of everyone still in the running at each place
+    sum_q = np.einsum("mi,miq->mq", strength, beaten)
+    sum_q = np.where(sum_q > 0, sum_q, 1.0)
+    ties = np.maximum(tied.sum(axis=1), 1)
+
+    p = strength[:, :, None] / sum_q[:, None, :]
+    identity = np.eye(mu.shape[1], dtype=bool)[None, :, :]
+    omega = np.sum(np.where(beaten, (identity - p) / ties[:, None, :], 0.0), axis=2)
+    delta = np.sum(np.where(beaten, p * (1 - p) / ties[:, None, :], 0.0), axis=2)
+
+    omega *= sigma_squared / c
+    delta *= sigma_squared / c**2 * (np.sqrt(sigma_squared) / c)
+
+    mu_post = np.where(valid, mu + omega, mu)
+    sigma_post = np.where(valid, sigma * np.sqrt(np.maximum(1 - delta, EPSILON)), sigma)
+    return mu_post, sigma_post
+
+
+def rate_match(
+    mu: Sequence[float],
+    sigma: Sequence[float],
+    ranks: Optional[Sequence[int]] = None,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Rate a single match. Players are listed from first to last place."""
+    mu_post, sigma_post = rate_matches(
+        np.asarray(mu)[None, :],
+        np.asarray(sigma)[None, :],
+        None if ranks is None else np.asarray(ranks)[None, :],
+    )
+    return mu_post[0], sigma_post[0]
@@ -0,0 +1,189 @@
+import asyncio
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+from discord.ext import commands
+from pymongo import UpdateOne
+
+from argus.db.models.match import MatchModel
+from argus.db.models.user import MemberModel
+from argus.rating import MU, SIGMA, rate_matches
+
+
+class RatingReplay:
+    """
+    Recomputes every rating from the match log. Matches are placed into
+    waves where no member plays twice, so each wave is rated in a single
+    vectorized batch while every member still sees their matches in order.
+    Members start from the rating they had before their first logged match.
+    """
+
+    def __init__(self, ties: bool = False):
+        self.ties = ties
+        self._members: Dict[int, int] = {}
+        self._last_wave: List[int] = []
+        self._priors: List[Tuple[float, float]] = []
+        self._players: List[List[int]] = []
+        self._ranks: List[List[int]] = []
+        self._waves: List[int] = []
+
+    def __len__(self):
+        return len(self._players)
+
+    def _index(self, member_id: int, prior: Tuple[float, float]) -> int:
+        index = self._members.get(member_id)
+        if index is None:
+            index = self._members[member_id] = len(self._last_wave)
+            self._last_wave.append(-1)
+            self._priors.append(prior)
+        return index
+
+    def add(
+        self,
+        members: Sequence[int],
+        places: Sequence[int],
+        priors: Optional[Sequence[Tuple[float, float]]] = None,
+    ):
+        """
+        Add a match played after every match already added. Priors are the
+        members' mu and sigma before the match and are used for members
+        seen for the first time.
+        """
+        if priors is None:
+            priors = [(MU, SIGMA)] * len(members)
+        standings = sorted(zip(places, members, priors), key=lambda x: x[0])
+        players = [self._index(member, prior) for _, member, prior in standings]
+        if self.ties:
+            ranks = [place for place, _, _ in standings]
+        else:
+            # Rank by finishing order like DebateMatch.calculate_ratings
+            ranks = list(range(len(players)))
+
+        wave = max(self._last_wave[player] for player in players) + 1
+        for player in players:
+            self._last_wave[player] = wave
+
+        self._players.append(players)
+        self._ranks.append(ranks)
+        self._waves.append(wave)
+
+    async def load(self, collection) -> int:
+        """Stream rated matches from the match log in chronological order."""
+        cursor = collection.find(
+            {"rated": True},
+            {
+                "_id": 0,
+                "participants.member": 1,
+                "participants.place": 1,
+                "participants.mu_pre": 1,
+                "participants.sigma_pre": 1,
+            },
+        ).sort("session_end", 1)
+        async for document in cursor:
+            debaters = [
+                participant
+                for participant in document["participants"]
+                if participant.get("place") is not None
+            ]
+            if len(debaters) < 2:
+                continue
+            self.add(
+                [participant["member"] for participant in debaters],
+                [participant["place"] for participant in debaters],
+                [
+                    (
+                        participant.get("mu_pre", MU),
+                        participant.get("sigma_pre", SIGMA),
+                    )
+                    for participant in debaters
+                ],
+            )
+        return len(self)
+
+    def run(self) -> Dict[int, Tuple[float, float]]:
+        """Rate all added matches and return each member's mu and sigma."""
+        count = len(self._members)
+        if not self._players:
+            return {}
+
+        # The extra slot is where padding points to and is never written
+        priors = np.asarray(self._priors + [(MU, SIGMA)], dtype=np.float64)
+        mu = priors[:, 0].copy()
+        sigma = priors[:, 1].copy()
+
+        sizes = np.fromiter((len(p) for p in self._players), dtype=np.int64)
+        players = np.full((len(self._players), sizes.max()), count, dtype=np.int64)
+        ranks = np.zeros(players.shape, dtype=np.int64)
+        for row, (match_players, match_ranks) in enumerate(
+            zip(self._players, self._ranks)
+        ):
+            players[row, : len(match_players)] = match_players
+            ranks[row, : len(match_ranks)] = match_ranks
+
+        waves = np.asarray(self._waves)
+        order = np.argsort(waves, kind="stable")
+        bounds = np.searchsorted(waves[order], np.arange(waves.max() + 2))
+        for start, end in zip(bounds[:-1], bounds[1:]):
+            rows = order[start:end]
+            width = sizes[rows].max()
+            wave_players = players[rows, :width]
+            valid = wave_players < count
+
+            mu_post, sigma_post = rate_matches(
+                mu[wave_players], sigma[wave_players], ranks[rows, :width], valid
+            )
+            mu[wave_players[valid]] = mu_post[valid]
+            sigma[wave_players[valid]] = sigma_post[valid]
+
+        return {
+            member: (float(mu[index]), float(sigma[index]))
+            for member, index in self._members.items()
+        }
+
+
+async def replay_ratings(
+    bot: commands.Bot, ties: bool = False, batch_size: int = 1000
+) -> int:
+    """
+    Recompute all ratings from the match log and write them back with bulk
+    upserts, then reconcile the rank roles of the members rated. Members
+    without logged matches keep their rating. Matches cannot conclude while
+    the replay runs. Returns the number of members rated.
+    """
+    async with bot.state["rating_lock"]:
+        replay = RatingReplay(ties=ties)
+        await replay.load(bot.db.collection(MatchModel))
+
+        # Rating can take minutes on a large log, keep the gateway responsive
+        loop = asyncio.get_running_loop()
+        ratings = await loop.run_in_executor(None, replay.run)
+
+        operations = []
+        for member_id, (mu, sigma) in ratings.items():
+            rating = float(20 * ((mu - 3 * sigma) + 25))
+            operations.append(
+                UpdateOne(
+                    {"member": member_id},
+                    {"$set": {"mu": mu, "sigma": sigma, "rating": rating}},
+                    upsert=True,
+                )
+            )
+            if len(operations) >= batch_size:
+                await bot.db.bulk_update(MemberModel, operations)
+                operations = []
+        await bot.db.bulk_update(MemberModel, operations)
+
+    # Rebuilt from the database the next time it is needed
+    bot.state["leaderboard"].clear()
+
+    guild = bot.get_guild(bot.config["global"]["guild_id"])
+    for member_id, (mu, sigma) in ratings.items():
+        member = guild.get_member(member_id)
+        if member is None or member.bot:
+            continue
+        bot.state["rank_roles"].schedule(
+            member,
+            float(20 * ((mu - 3 * sigma) + 25)),
+            reason="Updated after a rating replay.",
+        )
+    return len(ratings)
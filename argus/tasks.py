@@ -1,14 +1,85 @@
-import asyncio
-from queue import Queue
+from typing import List, Optional
+
+import discord
+from discord import Embed, TextChannel
 
 from argus.client import ArgusClient
+from argus.constants import DB_CHANNEL_NAME_MAP
+from argus.feed import FeedQueue
+
+# Discord limits for a single message
+FEED_EMBEDS_PER_MESSAGE = 10
+FEED_CHARACTERS_PER_MESSAGE = 6000
+
+
+def publish_to_debate_feed(bot: ArgusClient, embed: Embed):
+    """
+    Queue an embed for the debate feed without waiting. Embeds published
+    while the queue is full wait in its overflow so none are lost.
+    """
+    fifo: FeedQueue = bot.state["debate_feed_fifo"]
+    if fifo.full():
+        bot.logger.warning(
+            "Debate feed queue full, holding embed",
+            title=embed.title,
+            overflowed=fifo.overflowed + 1,
+        )
+    fifo.put_nowait(embed)
+
+
+async def fetch_debate_feed(bot: ArgusClient) -> Optional[TextChannel]:
+    """Fetch the debate feed channel from Discord and refresh the channel cache."""
+    guild = bot.get_guild(bot.config["global"]["guild_id"])
+    for channel in await guild.fetch_channels():
+        if DB_CHANNEL_NAME_MAP.get(channel.name) == "tc_debate_feed":
+            bot.state["map_channels"]["tc_debate_feed"] = channel
+            return channel
+    return None
 
 
 async def debate_feed_updater(bot: ArgusClient):
+    """
+    Publish queued embeds to the debate feed. Wakes as soon as an embed is
+    queued and packs everything already waiting into as few messages as
+    Discord allows. Failed messages are logged and dropped so the feed keeps
+    draining.
+    """
+    fifo: FeedQueue = bot.state["debate_feed_fifo"]
+    debate_feed: Optional[TextChannel] = None
+    stale = False
+    carried: Optional[Embed] = None
+
     while bot.state["debates_enabled"]:
-        fifo: Queue = bot.state["debate_feed_fifo"]
-        while fifo.qsize() > 0:
-            embed = fifo.get()
-            debate_feed = bot.state["map_channels"]["tc_debate_feed"]
-            await debate_feed.send(embed=embed)
-        await asyncio.sleep(0.5)
+        embed = carried if carried else await fifo.get()
+        carried = None
+
+        embeds: List[Embed] = [embed]
+        characters = len(embed)
+        while len(embeds) < FEED_EMBEDS_PER_MESSAGE and not fifo.empty():
+            embed = fifo.get_nowait()
+            if characters + len(embed) > FEED_CHARACTERS_PER_MESSAGE:
+                carried = embed
+                break
+            embeds.append(embed)
+            characters += len(embed)
+
+        try:
+            if debate_feed is None:
+                debate_feed = bot.state["map_channels"].get("tc_debate_feed")
+                if debate_feed is None or stale:
+                    debate_feed = await fetch_debate_feed(bot)
+                    stale = False
+            if debate_feed is None:
+                bot.logger.warning(
+                    "Debate feed channel not found, dropping embeds",
+                    dropped=len(embeds),
+                )
+                continue
+            await debate_feed.send(embeds=embeds)
+        except discord.NotFound:
+            # The channel was recreated, fetch it again on the next send
+            debate_feed = None
+            stale = True
+            bot.logger.exception("Debate feed channel not found")
+        except Exception:
+            bot.logger.exception("Failed to publish to debate feed")
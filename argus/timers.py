@@ -0,0 +1,167 @@
+import asyncio
+from collections import Counter
+from datetime import datetime, timedelta
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
+
+from discord.ext import commands
+from pymongo.errors import PyMongoError
+
+from argus.models import DebateRoom, DebateRoomRegistry
+
+TimerHandler = Callable[[DebateRoom, Optional[int]], Awaitable]
+
+
+class RoomTimers:
+    """
+    Expiry timers keyed by room number and kind, such as a studio or lounge
+    waiting for its owner to return. Expiry times and owner ids are saved so
+    pending timers can be restored after a restart.
+    """
+
+    def __init__(self, bot: commands.Bot, collection: str = "timer"):
+        self.bot = bot
+        self.collection = collection
+        self.counts = Counter()
+        self._handlers: Dict[str, TimerHandler] = {}
+        self._timers: Dict[
+            Tuple[int, str], Tuple[datetime, Optional[int], asyncio.Task]
+        ] = {}
+
+    def __len__(self):
+        return len(self._timers)
+
+    def __contains__(self, key: Tuple[int, str]):
+        return key in self._timers
+
+    def register(self, kind: str, handler: TimerHandler):
+        """
+        Set the coroutine run when a kind of timer expires. It is called with
+        the room and the id of the member the timer was scheduled for.
+        """
+        self._handlers[kind] = handler
+
+    def expires_at(self, room: DebateRoom, kind: str) -> Optional[datetime]:
+        """Get when a room's timer expires, or None if it is not pending."""
+        timer = self._timers.get((room.number, kind))
+        return timer[0] if timer else None
+
+    def pending(self) -> List[Tuple[int, str, datetime]]:
+        """Get the room number, kind and expiry of pending timers, soonest first."""
+        return sorted(
+            (
+                (number, kind, expires_at)
+                for (number, kind), (expires_at, _, _) in self._timers.items()
+            ),
+            key=lambda timer: timer[2],
+        )
+
+    async def schedule(
+        self, room: DebateRoom, kind: str, delay: float, owner: Optional[int] = None
+    ) -> datetime:
+        """Start a room's timer, replacing the pending one of the same kind."""
+        if kind not in self._handlers:
+            raise KeyError(f"No handler registered for '{kind}' timers.")
+        self._stop(room.number, kind)
+
+        expires_at = datetime.utcnow() + timedelta(seconds=delay)
+        self._start(room, kind, expires_at, owner)
+        self.counts["scheduled"] += 1
+        await self._save(room.number, kind, expires_at, owner)
+        return expires_at
+
+    async def reschedule(
+        self, room: DebateRoom, kind: str, delay: float
+    ) -> Optional[datetime]:
+        """Move a pending timer to expire after a new delay."""
+        timer = self._timers.get((room.number, kind))
+        if timer is None:
+            return None
+        return await self.schedule(room, kind, delay, timer[1])
+
+    async def cancel(self, room: DebateRoom, kind: str) -> bool:
+        """Cancel a room's pending timer. Returns whether one was pending."""
+        if not self._stop(room.number, kind):
+            return False
+        self.counts["cancelled"] += 1
+        await self._delete(room.number, kind)
+        return True
+
+    async def restore(self, rooms: DebateRoomRegistry) -> int:
+        """Restart saved timers for rebuilt rooms. Returns the number restored."""
+        collection = self.bot.db[self.bot.db.database][self.collection]
+        restored = 0
+        try:
+            async for document in collection.find({}, {"_id": 0}):
+                room = rooms.get(document["room"])
+                if room is None or document["kind"] not in self._handlers:
+                    continue
+                self._stop(room.number, document["kind"])
+                self._start(
+                    room,
+                    document["kind"],
+                    document["expires_at"],
+                    document.get("owner"),
+                )
+                restored += 1
+        except PyMongoError:
+            self.bot.logger.exception("Failed to restore room timers")
+        self.counts["restored"] += restored
+        return restored
+
+    def clear(self):
+        """Stop every pending timer but keep them saved for a later restore."""
+        for _, _, task in self._timers.values():
+            task.cancel()
+        self._timers.clear()
+
+    def _start(
+        self, room: DebateRoom, kind: str, expires_at: datetime, owner: Optional[int]
+    ):
+        task = asyncio.create_task(self._expire(room, kind, expires_at, owner))
+        self._timers[(room.number, kind)] = (expires_at, owner, task)
+
+    def _stop(self, number: int, kind: str) -> bool:
+        timer = self._timers.pop((number, kind), None)
+        if timer is None:
+            return False
+        timer[2].cancel()
+        return True
+
+    async def _expire(
+        self, room: DebateRoom, kind: str, expires_at: datetime, owner: Optional[int]
+    ):
+        delay = (expires_at - datetime.utcnow()).total_seconds()
+        await asyncio.sleep(max(delay, 0))
+
+        # The timer is no longer pending once its handler starts
+        del self._timers[(room.number, kind)]
+        self.counts["expired"] += 1
+        await self._delete(room.number, kind)
+        try:
+            await self._handlers[kind](room, owner)
+        except Exception:
+            self.bot.logger.exception("Room timer failed", room=room.number, kind=kind)
+
+    async def _save(
+        self, number: int, kind: str, expires_at: datetime, owner: Optional[int]
+    ):
+        collection = self.bot.db[self.bot.db.database][self.collection]
+        try:
+            await collection.update_one(
+                {"room": number, "kind": kind},
+                {"$set": {"expires_at": expires_at, "owner": owner}},
+                upsert=True,
+            )
+        except PyMongoError:
+            self.bot.logger.exception(
+                "Failed to save room timer", room=number, kind=kind
+            )
+
+    async def _delete(self, number: int, kind: str):
+        collection = self.bot.db[self.bot.db.database][self.collection]
+        try:
+            await collection.delete_one({"room": number, "kind": kind})
+        except PyMongoError:
+            self.bot.logger.exception(
+                "Failed to delete room timer", room=number, kind=kind
+            )
@@ -7,13 +7,34 @@ async def update(interaction: Interaction, *args, **kwargs):
     If no initial response is sent, then it sends one.
     """
     if interaction.response.is_done():
-        if "ephemeral" in kwargs:
-            kwargs.pop("ephemeral")
-        await interaction.edit_original_response(*args, **kwargs)
+        ephemeral = kwargs.pop("ephemeral", False)
+        followup = interaction.extras.get("followup")
+        if followup:
+            await followup.edit(*args, **kwargs)
+        elif not ephemeral and interaction.extras.pop("ephemeral_defer", False):
+            # An ephemeral response cannot be made public, so replace it
+            await interaction.delete_original_response()
+            interaction.extras["followup"] = await interaction.followup.send(
+                *args, wait=True, **kwargs
+            )
+        else:
+            await interaction.edit_original_response(*args, **kwargs)
     else:
         await interaction.response.send_message(*args, **kwargs)
 
 
+async def defer(interaction: Interaction, ephemeral: bool = False):
+    """
+    Defer an interaction unless it was already responded to. Replies sent
+    with update after an ephemeral defer keep their own ephemeral flag.
+    """
+    if interaction.response.is_done():
+        return
+    await interaction.response.defer(ephemeral=ephemeral, thinking=True)
+    if ephemeral:
+        interaction.extras["ephemeral_defer"] = True
+
+
 def floor_rating(rating_input: float) -> float:
     """
     Returns the closest value for a rating role's value.
@@ -1,9 +1,11 @@
 import asyncio
-from queue import PriorityQueue
+from typing import Dict, Iterable, Optional, Set
 
-from discord import VoiceChannel
+import discord
+from discord import Member, VoiceChannel, VoiceState, abc
 
 from argus.client import ArgusClient
+from argus.models import DebateRoom
 from argus.overwrites import BASE, MODERATION_BOT, NEGATIVE
 
 
@@ -42,47 +44,156 @@ async def make_vc_invisible(bot: ArgusClient, vc: VoiceChannel):
     )
 
 
-async def voice_channel_update(bot: ArgusClient):
-    while bot.state["debates_enabled"]:
-        empty_rooms = PriorityQueue(maxsize=0)
-        non_empty_rooms = PriorityQueue(maxsize=0)
-        invisible_rooms = PriorityQueue(maxsize=0)
-        visible_rooms = PriorityQueue(maxsize=0)
-        empty_invisible_rooms = PriorityQueue(maxsize=0)
-        empty_visible_rooms = PriorityQueue(maxsize=0)
-        non_empty_invisible_rooms = PriorityQueue(maxsize=0)
-        non_empty_visible_rooms = PriorityQueue(maxsize=0)
+async def apply_mutes(
+    bot: ArgusClient,
+    desired: Dict[Member, bool],
+    channel: Optional[VoiceChannel] = None,
+    reason: Optional[str] = None,
+) -> int:
+    """
+    Set the server mute of many members at once. Members not in voice, not
+    in the given channel or already in the desired state are skipped and
+    the rest are edited concurrently, limited by the shared voice edit
+    semaphore. Failures are logged together. Returns the number of members
+    edited.
+    """
+    changes = [
+        (member, mute)
+        for member, mute in desired.items()
+        if member.voice is not None
+        and (channel is None or member.voice.channel == channel)
+        and member.voice.mute != mute
+    ]
+    if not changes:
+        return 0
+
+    semaphore: asyncio.Semaphore = bot.state["voice_edit_semaphore"]
+
+    async def edit(member: Member, mute: bool):
+        async with semaphore:
+            await member.edit(mute=mute, reason=reason)
+
+    results = await asyncio.gather(
+        *(edit(member, mute) for member, mute in changes), return_exceptions=True
+    )
+    failed = [
+        member.id
+        for (member, _), result in zip(changes, results)
+        if isinstance(result, discord.HTTPException)
+    ]
+    if failed:
+        bot.logger.warning(
+            "Failed to update voice states", failed=failed, attempted=len(changes)
+        )
+    for result in results:
+        if isinstance(result, Exception) and not isinstance(
+            result, discord.HTTPException
+        ):
+            raise result
+    return len(changes) - len(failed)
+
+
+async def mute_members(
+    bot: ArgusClient,
+    members: Iterable[Member],
+    mute: bool = True,
+    channel: Optional[VoiceChannel] = None,
+    reason: Optional[str] = None,
+) -> int:
+    """Server mute or unmute every member given."""
+    return await apply_mutes(
+        bot, {member: mute for member in members}, channel=channel, reason=reason
+    )
 
-        debate_rooms = bot.state["debate_rooms"]
-        for room in debate_rooms:
-            vc = room.vc
-            if vc_is_empty(bot, vc):
-                empty_rooms.put(room)
-                if not vc_is_visible(bot, vc):
-                    empty_invisible_rooms.put(room)
-                else:
-                    empty_visible_rooms.put(room)
-            else:
-                non_empty_rooms.put(room)
-                if not vc_is_visible(bot, vc):
-                    non_empty_invisible_rooms.put(room)
-                else:
-                    non_empty_visible_rooms.put(room)
-
-            if not vc_is_visible(bot, vc):
-                invisible_rooms.put(room)
-            else:
-                visible_rooms.put(room)
 
-        if empty_visible_rooms.empty():
-            empty_invisible_room = empty_invisible_rooms.get()
-            vc = empty_invisible_room.vc
-            await make_vc_visible(bot, vc)
-            visible_rooms.put(empty_invisible_room)
+class RoomVisibility:
+    """
+    Keeps exactly one empty debate room visible. Empty and visible flags
+    are tracked per room and only updated from voice and channel events,
+    so nothing is compared or edited while the rooms are in a good state.
+    """
+
+    def __init__(self, bot: ArgusClient):
+        self.bot = bot
+        self._rooms: Dict[int, DebateRoom] = {}
+        self._empty: Dict[int, bool] = {}
+        self._visible: Dict[int, bool] = {}
+        self._lock = asyncio.Lock()
+        self._tasks: Set[asyncio.Task] = set()
+
+    def load(self, debate_rooms: Iterable[DebateRoom]):
+        """Read the state of every room once."""
+        self._rooms = {room.vc.id: room for room in debate_rooms}
+        self._empty = {}
+        self._visible = {}
+        for room in debate_rooms:
+            self._empty[room.vc.id] = vc_is_empty(self.bot, room.vc)
+            self._visible[room.vc.id] = vc_is_visible(self.bot, room.vc)
+
+    def _schedule(self):
+        # The loop only keeps weak references to tasks, hold them until done
+        task = asyncio.create_task(self.reconcile())
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    def voice_state_update(self, before: VoiceState, after: VoiceState):
+        """Update the empty flags of the rooms a member left or joined."""
+        changed = False
+        for channel in {before.channel, after.channel}:
+            if channel is None or channel.id not in self._rooms:
+                continue
+            empty = vc_is_empty(self.bot, channel)
+            if self._empty[channel.id] != empty:
+                self._empty[channel.id] = empty
+                changed = True
+        if changed:
+            self._schedule()
+
+    def channel_update(self, after: abc.GuildChannel):
+        """Update visible flags when a room or its category is edited."""
+        if after.id in self._rooms:
+            channels = [after]
         else:
-            if empty_visible_rooms.qsize() > 1:
-                for room in empty_visible_rooms.queue[1:]:
-                    vc = room.vc
-                    await make_vc_invisible(bot, vc)
-
-        await asyncio.sleep(1)
+            channels = [
+                room.vc for room in self._rooms.values() if room.vc.category == after
+            ]
+        changed = False
+        for channel in channels:
+            visible = vc_is_visible(self.bot, channel)
+            if self._visible[channel.id] != visible:
+                self._visible[channel.id] = visible
+                changed = True
+        if changed:
+            self._schedule()
+
+    async def reconcile(self):
+        """Show or hide rooms if there is not exactly one empty visible room."""
+        async with self._lock:
+            empty_visible = sorted(
+                room
+                for channel_id, room in self._rooms.items()
+                if self._empty[channel_id] and self._visible[channel_id]
+            )
+            if len(empty_visible) == 1:
+                return
+
+            if not empty_visible:
+                empty_invisible = sorted(
+                    room
+                    for channel_id, room in self._rooms.items()
+                    if self._empty[channel_id] and not self._visible[channel_id]
+                )
+                if empty_invisible:
+                    room = empty_invisible[0]
+                    try:
+                        await make_vc_visible(self.bot, room.vc)
+                        self._visible[room.vc.id] = True
+                    except discord.HTTPException:
+                        self.bot.logger.exception("Failed to show room", room=room)
+            else:
+                for room in empty_visible[1:]:
+                    try:
+                        await make_vc_invisible(self.bot, room.vc)
+                        self._visible[room.vc.id] = False
+                    except discord.HTTPException:
+                        self.bot.logger.exception("Failed to hide room", room=room)
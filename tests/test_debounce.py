@@ -0,0 +1,66 @@
+import asyncio
+
+from argus.debounce import Debouncer
+
+
+class FakeLogger:
+    def __init__(self):
+        self.errors = []
+
+    def opt(self, exception=None):
+        self.exception = exception
+        return self
+
+    def error(self, message, **kwargs):
+        self.errors.append((message, self.exception, kwargs))
+
+
+def test_failed_callback_is_logged_and_later_calls_still_run():
+    logger = FakeLogger()
+    calls = []
+
+    async def main():
+        debouncer = Debouncer(logger, interval=0)
+        started = asyncio.Event()
+        release = asyncio.Event()
+
+        async def fail():
+            started.set()
+            await release.wait()
+            raise RuntimeError("render failed")
+
+        async def record():
+            calls.append("trailing")
+
+        debouncer.schedule(1, fail)
+        await started.wait()
+        # Coalesced behind the failing call
+        debouncer.schedule(1, record)
+        release.set()
+        for _ in range(10):
+            await asyncio.sleep(0)
+
+    asyncio.run(main())
+    assert calls == ["trailing"]
+    assert len(logger.errors) == 1
+    message, error, kwargs = logger.errors[0]
+    assert isinstance(error, RuntimeError)
+    assert kwargs == {"key": 1}
+
+
+def test_calls_are_coalesced():
+    logger = FakeLogger()
+    calls = []
+
+    async def main():
+        debouncer = Debouncer(logger, interval=0.01)
+        for value in range(5):
+            debouncer.schedule("room", lambda value=value: record(value))
+        await asyncio.sleep(0.1)
+
+    async def record(value):
+        calls.append(value)
+
+    asyncio.run(main())
+    assert calls == [4]
+    assert logger.errors == []
@@ -0,0 +1,56 @@
+import asyncio
+
+from argus.feed import FeedQueue
+
+
+def drain(fifo: FeedQueue):
+    items = []
+    while not fifo.empty():
+        items.append(fifo.get_nowait())
+    return items
+
+
+def test_full_queue_keeps_every_item_in_order():
+    async def main():
+        fifo = FeedQueue(maxsize=3)
+        for item in range(10):
+            fifo.put_nowait(item)
+        assert fifo.qsize() == 3
+        assert fifo.overflowed == 7
+        return drain(fifo), fifo.overflowed
+
+    items, overflowed = asyncio.run(main())
+    assert items == list(range(10))
+    assert overflowed == 0
+
+
+def test_items_published_while_draining_queue_behind_overflow():
+    async def main():
+        fifo = FeedQueue(maxsize=2)
+        for item in range(4):
+            fifo.put_nowait(item)
+        first = fifo.get_nowait()
+        # There is room again but the overflow was published first
+        fifo.put_nowait(4)
+        return [first] + drain(fifo)
+
+    assert asyncio.run(main()) == [0, 1, 2, 3, 4]
+
+
+def test_waiting_consumer_gets_overflow():
+    async def main():
+        fifo = FeedQueue(maxsize=1)
+        received = []
+
+        async def consume():
+            while len(received) < 5:
+                received.append(await fifo.get())
+
+        consumer = asyncio.create_task(consume())
+        await asyncio.sleep(0)
+        for item in range(5):
+            fifo.put_nowait(item)
+        await asyncio.wait_for(consumer, 1)
+        return received
+
+    assert asyncio.run(main()) == [0, 1, 2, 3, 4]
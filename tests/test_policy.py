@@ -0,0 +1,62 @@
+import itertools
+from typing import Optional
+
+import pytest
+
+from argus.policy import VoiceContext, desired_mute
+
+
+def reference_mute(context: VoiceContext) -> Optional[bool]:
+    """The nested checks join_room used before the policy table, as the oracle."""
+    if context.match:
+        if context.debater:
+            if context.private:
+                if context.studio:
+                    if context.detained:
+                        return True
+                    if context.private_debater:
+                        if context.studio_participant:
+                            return False
+                    else:
+                        if not context.studio_participant:
+                            return True
+                    return None
+                if context.detained:
+                    return True
+                return not context.private_debater
+            if context.studio:
+                if context.detained:
+                    return True
+                if context.studio_participant:
+                    return False
+                return None
+            return context.detained
+        if context.studio:
+            if not context.studio_participant:
+                return True
+            return None
+        return True
+
+    if context.private:
+        if context.studio:
+            if context.detained:
+                return True
+            return not context.studio_participant
+        if context.detained:
+            return True
+        return not context.private_debater
+    if context.studio:
+        if context.detained:
+            return True
+        return not context.studio_participant
+    if context.lounge:
+        return None
+    return context.detained
+
+
+@pytest.mark.parametrize(
+    "flags", list(itertools.product([False, True], repeat=len(VoiceContext._fields)))
+)
+def test_policy_matches_reference(flags):
+    context = VoiceContext(*flags)
+    assert desired_mute(context) is reference_mute(context)
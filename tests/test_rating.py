@@ -0,0 +1,99 @@
+import random
+
+import numpy as np
+import pytest
+from openskill import Rating, rate
+
+from argus.rating import MU, SIGMA, rate_match, rate_matches
+
+
+def reference_rate(mu, sigma, ranks=None):
+    """Rate a match with openskill, one single player team per player."""
+    teams = [[Rating(mu=m, sigma=s)] for m, s in zip(mu, sigma)]
+    if ranks is None:
+        result = rate(teams)
+    else:
+        result = rate(teams, rank=list(ranks))
+    return (
+        np.array([team[0].mu for team in result]),
+        np.array([team[0].sigma for team in result]),
+    )
+
+
+def random_match(rng: random.Random, players: int, ties: bool):
+    mu = [rng.uniform(MU - 15, MU + 15) for _ in range(players)]
+    sigma = [rng.uniform(1, SIGMA) for _ in range(players)]
+    if ties:
+        ranks = [rng.randint(1, max(players - 1, 1)) for _ in range(players)]
+    else:
+        ranks = rng.sample(range(1, players + 1), players)
+    return mu, sigma, ranks
+
+
+def test_one_on_one_default_order():
+    mu, sigma = [MU, MU], [SIGMA, SIGMA]
+    expected = reference_rate(mu, sigma)
+    actual = rate_match(mu, sigma)
+
+    np.testing.assert_allclose(actual, expected)
+    assert actual[0][0] > actual[0][1]
+
+
+@pytest.mark.parametrize(
+    "ranks",
+    [
+        [1, 2],
+        [2, 1],
+        [1, 1],
+        [1, 2, 3],
+        [3, 1, 2],
+        [2, 2, 1],
+        [1, 1, 1],
+        [4, 2, 3, 1],
+        [2, 1, 2, 1],
+        [3, 3, 1, 2, 5],
+    ],
+)
+def test_rate_match_matches_openskill(ranks):
+    rng = random.Random(len(ranks))
+    mu = [rng.uniform(MU - 10, MU + 10) for _ in ranks]
+    sigma = [rng.uniform(1, SIGMA) for _ in ranks]
+
+    # openskill sorts teams by rank internally, the output must still line
+    # up with the input order
+    expected = reference_rate(mu, sigma, ranks)
+    actual = rate_match(mu, sigma, ranks)
+
+    np.testing.assert_allclose(actual[0], expected[0])
+    np.testing.assert_allclose(actual[1], expected[1])
+
+
+@pytest.mark.parametrize("seed", range(50))
+def test_batch_matches_openskill(seed):
+    rng = random.Random(seed)
+    width = rng.randint(2, 6)
+    matches = [
+        random_match(rng, rng.randint(2, width), ties=rng.random() < 0.5)
+        for _ in range(rng.randint(1, 8))
+    ]
+
+    # Shorter matches are padded out to the widest one
+    mu = np.full((len(matches), width), MU)
+    sigma = np.full((len(matches), width), SIGMA)
+    ranks = np.zeros((len(matches), width), dtype=int)
+    valid = np.zeros((len(matches), width), dtype=bool)
+    for row, (m, s, r) in enumerate(matches):
+        mu[row, : len(m)] = m
+        sigma[row, : len(s)] = s
+        ranks[row, : len(r)] = r
+        valid[row, : len(m)] = True
+
+    mu_post, sigma_post = rate_matches(mu, sigma, ranks, valid)
+
+    for row, (m, s, r) in enumerate(matches):
+        expected = reference_rate(m, s, r)
+        np.testing.assert_allclose(mu_post[row, : len(m)], expected[0])
+        np.testing.assert_allclose(sigma_post[row, : len(s)], expected[1])
+        # Padding is left untouched
+        assert np.all(mu_post[row, len(m) :] == MU)
+        assert np.all(sigma_post[row, len(s) :] == SIGMA)
@@ -0,0 +1,113 @@
+import datetime
+import random
+from dataclasses import dataclass, field
+from types import SimpleNamespace
+from typing import List, Optional
+
+import pytest
+
+import argus.models
+from argus.models import DebateRoom, DebateTopic
+
+
+@dataclass(frozen=True)
+class FakeMember:
+    id: int
+
+
+@dataclass
+class FakeVoiceChannel:
+    members: List[FakeMember] = field(default_factory=list)
+
+
+class FakeDateTime(datetime.datetime):
+    now = datetime.datetime(2023, 1, 1)
+
+    @classmethod
+    def utcnow(cls):
+        return cls.now
+
+
+@pytest.fixture(autouse=True)
+def fake_clock(monkeypatch):
+    FakeDateTime.now = datetime.datetime(2023, 1, 1)
+    monkeypatch.setattr(
+        argus.models, "datetime", SimpleNamespace(datetime=FakeDateTime)
+    )
+
+
+def tick(rng: random.Random):
+    # Equal creation times are common so ties must be covered too
+    FakeDateTime.now += datetime.timedelta(seconds=rng.choice([0, 0, 1]))
+
+
+def reference_select(room: DebateRoom) -> Optional[DebateTopic]:
+    """The original scan over every topic, used as the oracle."""
+    topics = room.topics
+    if not topics:
+        return None
+    oldest = sorted(topics, key=lambda topic: topic.created_at)[0]
+
+    def votes(topic):
+        return len(topic.voters) + (1 if topic is oldest else 0)
+
+    most = max(votes(topic) for topic in topics)
+    leaders = [topic for topic in topics if votes(topic) == most]
+    if oldest in leaders:
+        return oldest
+    if len(leaders) == 1:
+        return leaders[0]
+    return None
+
+
+@pytest.mark.parametrize("seed", range(300))
+def test_selection_matches_reference(seed):
+    rng = random.Random(seed)
+    members = [FakeMember(i) for i in range(8)]
+    vc = FakeVoiceChannel(list(members))
+    room = DebateRoom(1, vc)
+
+    for _ in range(80):
+        operation = rng.choice(
+            [
+                "add",
+                "add",
+                "vote",
+                "vote",
+                "vote",
+                "remove",
+                "leave",
+                "reset",
+                "priority",
+                "obsolete",
+                "purge",
+                "select",
+            ]
+        )
+        member = rng.choice(members)
+        if operation == "add":
+            tick(rng)
+            room.add_topic(DebateTopic(member, "topic"))
+        elif operation == "vote":
+            room.vote_topic(member, rng.choice(members))
+        elif operation == "remove":
+            room.remove_topic(member)
+        elif operation == "leave":
+            room.remove_topic_voter(member)
+        elif operation == "reset":
+            tick(rng)
+            room.reset_topic_creation(member)
+        elif operation == "priority":
+            room.remove_priority_from_topic(member)
+        elif operation == "obsolete":
+            vc.members = rng.sample(members, rng.randint(0, len(members)))
+            room.remove_obsolete_topics()
+        elif operation == "purge" and rng.random() < 0.2:
+            room.purge_topics()
+
+        previous = room.current_topic
+        expected = reference_select(room)
+        changed = room.set_current_topic()
+
+        assert room.current_topic is expected
+        assert changed == (expected is not previous)
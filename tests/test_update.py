@@ -0,0 +1,109 @@
+import asyncio
+
+from argus.utils import defer, update
+
+
+class FakeResponse:
+    def __init__(self, interaction):
+        self.interaction = interaction
+        self.done = False
+
+    def is_done(self):
+        return self.done
+
+    async def defer(self, ephemeral=False, thinking=False):
+        self.done = True
+        self.interaction.original_ephemeral = ephemeral
+        self.interaction.sent.append(("defer", ephemeral))
+
+    async def send_message(self, *args, ephemeral=False, **kwargs):
+        self.done = True
+        self.interaction.sent.append(("send", ephemeral))
+
+
+class FakeMessage:
+    def __init__(self, interaction):
+        self.interaction = interaction
+
+    async def edit(self, *args, **kwargs):
+        self.interaction.sent.append(("edit_followup", False))
+
+
+class FakeFollowup:
+    def __init__(self, interaction):
+        self.interaction = interaction
+
+    async def send(self, *args, ephemeral=False, wait=False, **kwargs):
+        self.interaction.sent.append(("followup", ephemeral))
+        return FakeMessage(self.interaction)
+
+
+class FakeInteraction:
+    def __init__(self):
+        self.sent = []
+        self.extras = {}
+        self.response = FakeResponse(self)
+        self.followup = FakeFollowup(self)
+        self.original_ephemeral = None
+
+    async def edit_original_response(self, *args, **kwargs):
+        self.sent.append(("edit", self.original_ephemeral))
+
+    async def delete_original_response(self):
+        self.sent.append(("delete", self.original_ephemeral))
+
+
+def run(*steps):
+    interaction = FakeInteraction()
+
+    async def main():
+        for step in steps:
+            await step(interaction)
+
+    asyncio.run(main())
+    return interaction.sent
+
+
+def ephemeral_defer(interaction):
+    return defer(interaction, ephemeral=True)
+
+
+def public_defer(interaction):
+    return defer(interaction)
+
+
+def reply(ephemeral):
+    return lambda interaction: update(interaction, content="x", ephemeral=ephemeral)
+
+
+def test_reply_without_defer_keeps_flag():
+    assert run(reply(True)) == [("send", True)]
+    assert run(reply(False)) == [("send", False)]
+
+
+def test_ephemeral_reply_after_ephemeral_defer_stays_ephemeral():
+    assert run(ephemeral_defer, reply(True)) == [("defer", True), ("edit", True)]
+
+
+def test_public_reply_after_ephemeral_defer_is_public():
+    assert run(ephemeral_defer, reply(False)) == [
+        ("defer", True),
+        ("delete", True),
+        ("followup", False),
+    ]
+
+
+def test_later_replies_edit_the_public_followup():
+    assert run(ephemeral_defer, reply(False), reply(False)) == [
+        ("defer", True),
+        ("delete", True),
+        ("followup", False),
+        ("edit_followup", False),
+    ]
+
+
+def test_defer_is_skipped_once_responded():
+    assert run(ephemeral_defer, public_defer, reply(True)) == [
+        ("defer", True),
+        ("edit", True),
+    ]